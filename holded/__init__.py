@@ -8,13 +8,9 @@ __version__ = "0.1.0"
 __author__ = "BonifacioCalindoro"
 __license__ = "MIT"
 
-# Import main client classes for easier access
-# Import API modules for direct access
-from .api import accounting, crm, invoice, projects, team
-from .async_client import AsyncHoldedClient
-from .client import HoldedClient
+from typing import TYPE_CHECKING
 
-# Import exceptions
+# Exceptions have no dependencies and are always loaded
 from .exceptions import (
     HoldedAPIError,
     HoldedAuthError,
@@ -26,10 +22,29 @@ from .exceptions import (
     HoldedTimeoutError,
     HoldedValidationError,
 )
+from .lazy import attach
+
+if TYPE_CHECKING:
+    from .api import accounting, crm, invoice, projects, team
+    from .async_client import AsyncHoldedClient
+    from .batch import BatchItemResult, BatchResult
+    from .bridge import AsyncBridge
+    from .cache import ResponseCache
+    from .client import HoldedClient
+    from .codec import JSONCodec, OrjsonCodec
+    from .config import ClientConfig
+    from .instrumentation import RequestEvent
+    from .metrics import MetricsRegistry
+    from .pooling import PoolConfig
+    from .rate_limit import RateLimiter
+    from .retry import RetryBudget, RetryPolicy
+    from .streaming import JSONArrayParser
 
 __all__ = [
     "HoldedClient",
     "AsyncHoldedClient",
+    "AsyncBridge",
+    "ClientConfig",
     "HoldedError",
     "HoldedAPIError",
     "HoldedAuthError",
@@ -39,9 +54,50 @@ __all__ = [
     "HoldedServerError",
     "HoldedTimeoutError",
     "HoldedConnectionError",
+    "PoolConfig",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryBudget",
+    "ResponseCache",
+    "BatchResult",
+    "BatchItemResult",
+    "JSONCodec",
+    "OrjsonCodec",
+    "JSONArrayParser",
+    "RequestEvent",
+    "MetricsRegistry",
     "accounting",
     "crm",
     "invoice",
     "projects",
     "team",
 ]
+
+# Everything else is imported on first access, so that ``import holded`` stays
+# cheap and the async client does not load aiohttp for programs that never use it
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "HoldedClient": ".client",
+        "AsyncHoldedClient": ".async_client",
+        "AsyncBridge": ".bridge",
+        "ClientConfig": ".config",
+        "PoolConfig": ".pooling",
+        "RateLimiter": ".rate_limit",
+        "RetryPolicy": ".retry",
+        "RetryBudget": ".retry",
+        "ResponseCache": ".cache",
+        "BatchResult": ".batch",
+        "BatchItemResult": ".batch",
+        "JSONCodec": ".codec",
+        "OrjsonCodec": ".codec",
+        "JSONArrayParser": ".streaming",
+        "RequestEvent": ".instrumentation",
+        "MetricsRegistry": ".metrics",
+        "accounting": ".api",
+        "crm": ".api",
+        "invoice": ".api",
+        "projects": ".api",
+        "team": ".api",
+    },
+)
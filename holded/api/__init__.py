@@ -4,7 +4,7 @@ API modules for Holded.
 This module provides access to all Holded API modules including accounting, CRM, invoice, projects, and team APIs.
 """
 
-from . import accounting, crm, invoice, projects, team
+from ..lazy import attach
 
 __all__ = [
     "accounting",
@@ -13,3 +13,6 @@ __all__ = [
     "projects",
     "team",
 ]
+
+# Each API module is imported on first access
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
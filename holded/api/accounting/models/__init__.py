@@ -2,16 +2,21 @@
 Models for the Accounting API.
 """
 
-from .chart_of_accounts import Account, AccountCreate, AccountListResponse
-from .daily_ledger import (
-    DailyLedgerListParams,
-    Entry,
-    EntryCreate,
-    EntryLine,
-    EntryLineResponse,
-    EntryListResponse,
-    EntryResponse,
-)
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .chart_of_accounts import Account, AccountCreate, AccountListResponse
+    from .daily_ledger import (
+        DailyLedgerListParams,
+        Entry,
+        EntryCreate,
+        EntryLine,
+        EntryLineResponse,
+        EntryListResponse,
+        EntryResponse,
+    )
 
 __all__ = [
     # Daily Ledger
@@ -27,3 +32,13 @@ __all__ = [
     "AccountCreate",
     "AccountListResponse",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "chart_of_accounts",
+        "daily_ledger",
+    ],
+    exports=__all__,
+)
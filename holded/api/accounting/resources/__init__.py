@@ -2,10 +2,15 @@
 Resources for the Accounting API.
 """
 
-from .async_chart_of_accounts import AsyncChartOfAccountsResource
-from .async_daily_ledger import AsyncDailyLedgerResource
-from .chart_of_accounts import ChartOfAccountsResource
-from .daily_ledger import DailyLedgerResource
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .async_chart_of_accounts import AsyncChartOfAccountsResource
+    from .async_daily_ledger import AsyncDailyLedgerResource
+    from .chart_of_accounts import ChartOfAccountsResource
+    from .daily_ledger import DailyLedgerResource
 
 __all__ = [
     "DailyLedgerResource",
@@ -13,3 +18,15 @@ __all__ = [
     "ChartOfAccountsResource",
     "AsyncChartOfAccountsResource",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "async_chart_of_accounts",
+        "async_daily_ledger",
+        "chart_of_accounts",
+        "daily_ledger",
+    ],
+    exports=__all__,
+)
@@ -2,8 +2,9 @@
 Async resource for interacting with the Daily Ledger API.
 """
 
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
 
+from ....pagination import aiter_items
 from ...resources import AsyncBaseResource
 from ..models.daily_ledger import DailyLedgerListParams, EntryCreate, EntryResponse
 
@@ -27,6 +28,35 @@ class AsyncDailyLedgerResource(AsyncBaseResource):
         result = await self.client.get(self.base_path, params=params)
         return cast(List[Dict[str, Any]], result)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], DailyLedgerListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all daily ledger entries asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields daily ledger entries one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
+    def stream_list(
+        self, params: Optional[Union[Dict[str, Any], DailyLedgerListParams]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the daily ledger entries of one response, decoding them as they arrive.
+
+        Args:
+            params: Optional query parameters (page, starttmp, endtmp)
+
+        Returns:
+            An async iterator that yields entries one at a time.
+        """
+        return self.client.stream_list(self.base_path, params=params)
+
     async def create(self, entry_data: EntryCreate) -> EntryResponse:
         """Create a new daily ledger entry.
         https://developers.holded.com/reference/createentry
@@ -2,8 +2,9 @@
 Resource for interacting with the Daily Ledger API.
 """
 
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Union, cast
 
+from ....pagination import iter_items
 from ...resources import BaseResource
 from ..models.daily_ledger import DailyLedgerListParams, EntryCreate
 
@@ -31,6 +32,31 @@ class DailyLedgerResource(BaseResource):
         """
         return cast(List[Dict[str, Any]], self.client.get(self.base_path, params=params))
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], DailyLedgerListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all daily ledger entries, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields daily ledger entries one at a time.
+        """
+        return iter_items(self.list, params)
+
+    def stream_list(
+        self, params: Optional[Union[Dict[str, Any], DailyLedgerListParams]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the daily ledger entries of one response, decoding them as they arrive.
+
+        Args:
+            params: Optional query parameters (page, starttmp, endtmp)
+
+        Returns:
+            An iterator that yields entries one at a time.
+        """
+        return self.client.stream_list(self.base_path, params=params)
+
     def create(self, data: Union[Dict[str, Any], EntryCreate]) -> Dict[str, Any]:
         """Create a new daily ledger entry.
 
@@ -2,45 +2,50 @@
 Data models for the Holded CRM API.
 """
 
-from .bookings import (
-    Booking,
-    BookingCreate,
-    BookingListResponse,
-    BookingResponse,
-    BookingUpdate,
-    Location,
-    LocationListResponse,
-    LocationResponse,
-    Slot,
-    SlotListResponse,
-)
-from .events import (
-    Event,
-    EventCreate,
-    EventListResponse,
-    EventResponse,
-    EventUpdate,
-)
-from .funnels import (
-    Funnel,
-    FunnelCreate,
-    FunnelListResponse,
-    FunnelResponse,
-    FunnelUpdate,
-)
-from .leads import (
-    Lead,
-    LeadCreate,
-    LeadDateUpdate,
-    LeadListResponse,
-    LeadNoteCreate,
-    LeadNoteUpdate,
-    LeadResponse,
-    LeadStageUpdate,
-    LeadTaskCreate,
-    LeadTaskUpdate,
-    LeadUpdate,
-)
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .bookings import (
+        Booking,
+        BookingCreate,
+        BookingListResponse,
+        BookingResponse,
+        BookingUpdate,
+        Location,
+        LocationListResponse,
+        LocationResponse,
+        Slot,
+        SlotListResponse,
+    )
+    from .events import (
+        Event,
+        EventCreate,
+        EventListResponse,
+        EventResponse,
+        EventUpdate,
+    )
+    from .funnels import (
+        Funnel,
+        FunnelCreate,
+        FunnelListResponse,
+        FunnelResponse,
+        FunnelUpdate,
+    )
+    from .leads import (
+        Lead,
+        LeadCreate,
+        LeadDateUpdate,
+        LeadListResponse,
+        LeadNoteCreate,
+        LeadNoteUpdate,
+        LeadResponse,
+        LeadStageUpdate,
+        LeadTaskCreate,
+        LeadTaskUpdate,
+        LeadUpdate,
+    )
 
 __all__ = [
     # Funnels
@@ -79,3 +84,15 @@ __all__ = [
     "BookingResponse",
     "BookingListResponse",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "bookings",
+        "events",
+        "funnels",
+        "leads",
+    ],
+    exports=__all__,
+)
@@ -1,11 +1,16 @@
-from .async_bookings import AsyncBookingsResource
-from .async_events import AsyncEventsResource
-from .async_funnels import AsyncFunnelsResource
-from .async_leads import AsyncLeadsResource
-from .bookings import BookingsResource
-from .events import EventsResource
-from .funnels import FunnelsResource
-from .leads import LeadsResource
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .async_bookings import AsyncBookingsResource
+    from .async_events import AsyncEventsResource
+    from .async_funnels import AsyncFunnelsResource
+    from .async_leads import AsyncLeadsResource
+    from .bookings import BookingsResource
+    from .events import EventsResource
+    from .funnels import FunnelsResource
+    from .leads import LeadsResource
 
 __all__ = [
     "FunnelsResource",
@@ -17,3 +22,19 @@ __all__ = [
     "BookingsResource",
     "AsyncBookingsResource",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "async_bookings",
+        "async_events",
+        "async_funnels",
+        "async_leads",
+        "bookings",
+        "events",
+        "funnels",
+        "leads",
+    ],
+    exports=__all__,
+)
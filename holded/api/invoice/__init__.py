@@ -4,6 +4,9 @@ Invoice API module for Holded.
 This module provides access to invoice-related resources and models.
 """
 
-from . import models, resources
+from ...lazy import attach
 
 __all__ = ["models", "resources"]
+
+# The models and resources are imported on first access
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
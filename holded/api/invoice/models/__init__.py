@@ -2,152 +2,157 @@
 Data models for the Holded Invoice API.
 """
 
-from .contact_groups import (
-    ContactGroup,
-    ContactGroupCreate,
-    ContactGroupListResponse,
-    ContactGroupResponse,
-    ContactGroupUpdate,
-)
-from .contacts import (
-    Contact,
-    ContactAddress,
-    ContactAttachment,
-    ContactAttachmentListResponse,
-    ContactAttachmentResponse,
-    ContactAttachmentUpload,
-    ContactBankAccount,
-    ContactCreate,
-    ContactImport,
-    ContactImportResponse,
-    ContactListParams,
-    ContactListResponse,
-    ContactPaymentSettings,
-    ContactResponse,
-    ContactSocialMedia,
-    ContactStatus,
-    ContactTax,
-    ContactType,
-    ContactUpdate,
-)
-from .documents import (
-    Document,
-    DocumentAttachment,
-    DocumentAttachmentListResponse,
-    DocumentAttachmentResponse,
-    DocumentAttachmentUpload,
-    DocumentCreate,
-    DocumentItem,
-    DocumentListParams,
-    DocumentListResponse,
-    DocumentPayment,
-    DocumentPaymentCreate,
-    DocumentPaymentListResponse,
-    DocumentPaymentResponse,
-    DocumentResponse,
-    DocumentSendParams,
-    DocumentSendResponse,
-    DocumentStatus,
-    DocumentStatusUpdate,
-    DocumentTax,
-    DocumentType,
-    DocumentUpdate,
-    PaymentMethod,
-)
-from .expense_accounts import (
-    ExpenseAccount,
-    ExpenseAccountCreate,
-    ExpenseAccountListParams,
-    ExpenseAccountListResponse,
-    ExpenseAccountResponse,
-    ExpenseAccountUpdate,
-)
-from .numbering_series import (
-    NumberingSeries,
-    NumberingSeriesCreate,
-    NumberingSeriesListResponse,
-    NumberingSeriesResponse,
-    NumberingSeriesUpdate,
-)
-from .payments import (
-    Payment,
-    PaymentCreate,
-    PaymentListParams,
-    PaymentListResponse,
-    PaymentResponse,
-    PaymentUpdate,
-)
-from .products import (
-    Product,
-    ProductCategory,
-    ProductCategoryCreate,
-    ProductCategoryListParams,
-    ProductCategoryListResponse,
-    ProductCategoryResponse,
-    ProductCategoryUpdate,
-    ProductCreate,
-    ProductImage,
-    ProductImageListResponse,
-    ProductImageResponse,
-    ProductImageUpload,
-    ProductImport,
-    ProductImportResponse,
-    ProductListParams,
-    ProductListResponse,
-    ProductResponse,
-    ProductStatus,
-    ProductStockAdjustment,
-    ProductStockAdjustmentResponse,
-    ProductSupplier,
-    ProductTax,
-    ProductType,
-    ProductUpdate,
-    ProductVariant,
-    ProductVariantAttribute,
-    ProductVariantListResponse,
-    ProductVariantResponse,
-    ProductWarehouse,
-    StockManagement,
-)
-from .remittances import (
-    Remittance,
-    RemittanceListResponse,
-    RemittanceResponse,
-)
-from .sales_channels import (
-    SalesChannel,
-    SalesChannelCreate,
-    SalesChannelListParams,
-    SalesChannelListResponse,
-    SalesChannelResponse,
-    SalesChannelUpdate,
-)
-from .services import (
-    Service,
-    ServiceCreate,
-    ServiceListResponse,
-    ServiceResponse,
-    ServiceUpdate,
-)
-from .taxes import (
-    Tax,
-    TaxResponse,
-)
-from .treasury import (
-    TreasuryAccount,
-    TreasuryAccountCreate,
-    TreasuryAccountListResponse,
-    TreasuryAccountResponse,
-)
-from .warehouse import (
-    Warehouse,
-    WarehouseAddress,
-    WarehouseCreate,
-    WarehouseListParams,
-    WarehouseListResponse,
-    WarehouseResponse,
-    WarehouseUpdate,
-)
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .contact_groups import (
+        ContactGroup,
+        ContactGroupCreate,
+        ContactGroupListResponse,
+        ContactGroupResponse,
+        ContactGroupUpdate,
+    )
+    from .contacts import (
+        Contact,
+        ContactAddress,
+        ContactAttachment,
+        ContactAttachmentListResponse,
+        ContactAttachmentResponse,
+        ContactAttachmentUpload,
+        ContactBankAccount,
+        ContactCreate,
+        ContactImport,
+        ContactImportResponse,
+        ContactListParams,
+        ContactListResponse,
+        ContactPaymentSettings,
+        ContactResponse,
+        ContactSocialMedia,
+        ContactStatus,
+        ContactTax,
+        ContactType,
+        ContactUpdate,
+    )
+    from .documents import (
+        Document,
+        DocumentAttachment,
+        DocumentAttachmentListResponse,
+        DocumentAttachmentResponse,
+        DocumentAttachmentUpload,
+        DocumentCreate,
+        DocumentItem,
+        DocumentListParams,
+        DocumentListResponse,
+        DocumentPayment,
+        DocumentPaymentCreate,
+        DocumentPaymentListResponse,
+        DocumentPaymentResponse,
+        DocumentResponse,
+        DocumentSendParams,
+        DocumentSendResponse,
+        DocumentStatus,
+        DocumentStatusUpdate,
+        DocumentTax,
+        DocumentType,
+        DocumentUpdate,
+        PaymentMethod,
+    )
+    from .expense_accounts import (
+        ExpenseAccount,
+        ExpenseAccountCreate,
+        ExpenseAccountListParams,
+        ExpenseAccountListResponse,
+        ExpenseAccountResponse,
+        ExpenseAccountUpdate,
+    )
+    from .numbering_series import (
+        NumberingSeries,
+        NumberingSeriesCreate,
+        NumberingSeriesListResponse,
+        NumberingSeriesResponse,
+        NumberingSeriesUpdate,
+    )
+    from .payments import (
+        Payment,
+        PaymentCreate,
+        PaymentListParams,
+        PaymentListResponse,
+        PaymentResponse,
+        PaymentUpdate,
+    )
+    from .products import (
+        Product,
+        ProductCategory,
+        ProductCategoryCreate,
+        ProductCategoryListParams,
+        ProductCategoryListResponse,
+        ProductCategoryResponse,
+        ProductCategoryUpdate,
+        ProductCreate,
+        ProductImage,
+        ProductImageListResponse,
+        ProductImageResponse,
+        ProductImageUpload,
+        ProductImport,
+        ProductImportResponse,
+        ProductListParams,
+        ProductListResponse,
+        ProductResponse,
+        ProductStatus,
+        ProductStockAdjustment,
+        ProductStockAdjustmentResponse,
+        ProductSupplier,
+        ProductTax,
+        ProductType,
+        ProductUpdate,
+        ProductVariant,
+        ProductVariantAttribute,
+        ProductVariantListResponse,
+        ProductVariantResponse,
+        ProductWarehouse,
+        StockManagement,
+    )
+    from .remittances import (
+        Remittance,
+        RemittanceListResponse,
+        RemittanceResponse,
+    )
+    from .sales_channels import (
+        SalesChannel,
+        SalesChannelCreate,
+        SalesChannelListParams,
+        SalesChannelListResponse,
+        SalesChannelResponse,
+        SalesChannelUpdate,
+    )
+    from .services import (
+        Service,
+        ServiceCreate,
+        ServiceListResponse,
+        ServiceResponse,
+        ServiceUpdate,
+    )
+    from .taxes import (
+        Tax,
+        TaxResponse,
+    )
+    from .treasury import (
+        TreasuryAccount,
+        TreasuryAccountCreate,
+        TreasuryAccountListResponse,
+        TreasuryAccountResponse,
+    )
+    from .warehouse import (
+        Warehouse,
+        WarehouseAddress,
+        WarehouseCreate,
+        WarehouseListParams,
+        WarehouseListResponse,
+        WarehouseResponse,
+        WarehouseUpdate,
+    )
 
 __all__ = [
     # Contacts
@@ -284,3 +289,24 @@ __all__ = [
     "ServiceResponse",
     "ServiceListResponse",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "contact_groups",
+        "contacts",
+        "documents",
+        "expense_accounts",
+        "numbering_series",
+        "payments",
+        "products",
+        "remittances",
+        "sales_channels",
+        "services",
+        "taxes",
+        "treasury",
+        "warehouse",
+    ],
+    exports=__all__,
+)
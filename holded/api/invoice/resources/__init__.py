@@ -1,29 +1,34 @@
-from .async_contact_groups import AsyncContactGroupsResource
-from .async_contacts import AsyncContactsResource
-from .async_documents import AsyncDocumentsResource
-from .async_expense_accounts import AsyncExpenseAccountsResource
-from .async_numbering_series import AsyncNumberingSeriesResource
-from .async_payments import AsyncPaymentsResource
-from .async_products import AsyncProductsResource
-from .async_remittances import AsyncRemittancesResource
-from .async_sales_channels import AsyncSalesChannelsResource
-from .async_services import AsyncServicesResource
-from .async_taxes import AsyncTaxesResource
-from .async_treasury import AsyncTreasuryResource
-from .async_warehouse import AsyncWarehouseResource
-from .contact_groups import ContactGroupsResource
-from .contacts import ContactsResource
-from .documents import DocumentsResource
-from .expense_accounts import ExpenseAccountsResource
-from .numbering_series import NumberingSeriesResource
-from .payments import PaymentsResource
-from .products import ProductsResource
-from .remittances import RemittancesResource
-from .sales_channels import SalesChannelsResource
-from .services import ServicesResource
-from .taxes import TaxesResource
-from .treasury import TreasuryResource
-from .warehouse import WarehouseResource
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .async_contact_groups import AsyncContactGroupsResource
+    from .async_contacts import AsyncContactsResource
+    from .async_documents import AsyncDocumentsResource
+    from .async_expense_accounts import AsyncExpenseAccountsResource
+    from .async_numbering_series import AsyncNumberingSeriesResource
+    from .async_payments import AsyncPaymentsResource
+    from .async_products import AsyncProductsResource
+    from .async_remittances import AsyncRemittancesResource
+    from .async_sales_channels import AsyncSalesChannelsResource
+    from .async_services import AsyncServicesResource
+    from .async_taxes import AsyncTaxesResource
+    from .async_treasury import AsyncTreasuryResource
+    from .async_warehouse import AsyncWarehouseResource
+    from .contact_groups import ContactGroupsResource
+    from .contacts import ContactsResource
+    from .documents import DocumentsResource
+    from .expense_accounts import ExpenseAccountsResource
+    from .numbering_series import NumberingSeriesResource
+    from .payments import PaymentsResource
+    from .products import ProductsResource
+    from .remittances import RemittancesResource
+    from .sales_channels import SalesChannelsResource
+    from .services import ServicesResource
+    from .taxes import TaxesResource
+    from .treasury import TreasuryResource
+    from .warehouse import WarehouseResource
 
 __all__ = [
     "ContactsResource",
@@ -53,3 +58,37 @@ __all__ = [
     "ServicesResource",
     "AsyncServicesResource",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "async_contact_groups",
+        "async_contacts",
+        "async_documents",
+        "async_expense_accounts",
+        "async_numbering_series",
+        "async_payments",
+        "async_products",
+        "async_remittances",
+        "async_sales_channels",
+        "async_services",
+        "async_taxes",
+        "async_treasury",
+        "async_warehouse",
+        "contact_groups",
+        "contacts",
+        "documents",
+        "expense_accounts",
+        "numbering_series",
+        "payments",
+        "products",
+        "remittances",
+        "sales_channels",
+        "services",
+        "taxes",
+        "treasury",
+        "warehouse",
+    ],
+    exports=__all__,
+)
@@ -2,8 +2,9 @@
 Asynchronous contacts resource for the Holded API.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+from ....pagination import aiter_items
 from ...resources import AsyncBaseResource
 from ..models.contacts import (
     ContactAttachmentListResponse,
@@ -46,6 +47,22 @@ class AsyncContactsResource(AsyncBaseResource):
         """
         return await self.client.get(self.base_path, params=params)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], ContactListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all contacts asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields contacts one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], ContactCreate]) -> Union[Dict[str, Any], ContactResponse]:
         """Create a new contact asynchronously.
 
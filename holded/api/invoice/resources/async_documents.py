@@ -2,7 +2,7 @@
 Asynchronous documents resource for the Holded API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
 from ...resources import AsyncBaseResource
 
@@ -38,6 +38,19 @@ class AsyncDocumentsResource(AsyncBaseResource):
         result = await self.client.get(f"{self.base_path}/{docType}", params=params)
         return cast(List[Dict[str, Any]], result)
 
+    def stream_list(self, docType: str, params: Optional[Any] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all documents asynchronously, decoding them one by one as the response arrives.
+
+        Args:
+            docType: The document type
+            params: Optional query parameters (DocumentListParams or dict)
+
+        Returns:
+            An async iterator that yields documents one at a time
+        """
+        return self.client.stream_list(f"{self.base_path}/{docType}", params=params)
+
     async def create(self, docType: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new document asynchronously.
@@ -2,8 +2,10 @@
 Asynchronous resource for interacting with the Expense Accounts API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
+from ....pagination import aiter_items
+from ...resources import AsyncBaseResource
 from ..models.expense_accounts import (
     ExpenseAccountCreate,
     ExpenseAccountListParams,
@@ -13,7 +15,7 @@ from ..models.expense_accounts import (
 )
 
 
-class AsyncExpenseAccountsResource:
+class AsyncExpenseAccountsResource(AsyncBaseResource):
     """Resource for interacting with the Expense Accounts API asynchronously."""
 
     def __init__(self, client):
@@ -38,6 +40,22 @@ class AsyncExpenseAccountsResource:
         """
         return await self.client.get(self.base_path, params=params)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], ExpenseAccountListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all expense accounts asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields expense accounts one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], ExpenseAccountCreate]) -> ExpenseAccountResponse:
         """Create a new expense account asynchronously.
 
@@ -2,12 +2,14 @@
 Asynchronous resource for interacting with the Payments API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
+from ....pagination import aiter_items
+from ...resources import AsyncBaseResource
 from ..models.payments import PaymentCreate, PaymentListParams, PaymentListResponse, PaymentResponse, PaymentUpdate
 
 
-class AsyncPaymentsResource:
+class AsyncPaymentsResource(AsyncBaseResource):
     """Resource for interacting with the Payments API asynchronously."""
 
     def __init__(self, client):
@@ -30,6 +32,22 @@ class AsyncPaymentsResource:
         """
         return await self.client.get(self.base_path, params=params)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], PaymentListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all payments asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields payments one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], PaymentCreate]) -> PaymentResponse:
         """Create a new payment asynchronously.
 
@@ -2,8 +2,9 @@
 Asynchronous products resource for the Holded API.
 """
 
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
 
+from ....pagination import aiter_items
 from ...resources import AsyncBaseResource
 from ..models.products import ProductCreate, ProductListParams, ProductUpdate
 
@@ -35,6 +36,22 @@ class AsyncProductsResource(AsyncBaseResource):
         result = await self.client.get(self.base_path, params=params)
         return cast(List[Dict[str, Any]], result)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], ProductListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all products asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields products one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], ProductCreate]) -> Dict[str, Any]:
         """
         Create a new product asynchronously.
@@ -2,8 +2,10 @@
 Asynchronous resource for interacting with the Sales Channels API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
+from ....pagination import aiter_items
+from ...resources import AsyncBaseResource
 from ..models.sales_channels import (
     SalesChannelCreate,
     SalesChannelListParams,
@@ -13,7 +15,7 @@ from ..models.sales_channels import (
 )
 
 
-class AsyncSalesChannelsResource:
+class AsyncSalesChannelsResource(AsyncBaseResource):
     """Resource for interacting with the Sales Channels API asynchronously."""
 
     def __init__(self, client):
@@ -38,6 +40,22 @@ class AsyncSalesChannelsResource:
         """
         return await self.client.get(self.base_path, params=params)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], SalesChannelListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all sales channels asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields sales channels one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], SalesChannelCreate]) -> SalesChannelResponse:
         """Create a new sales channel asynchronously.
 
@@ -2,8 +2,10 @@
 Asynchronous resource for interacting with the Warehouse API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Optional, Union
 
+from ....pagination import aiter_items
+from ...resources import AsyncBaseResource
 from ..models.warehouse import (
     WarehouseCreate,
     WarehouseListParams,
@@ -13,7 +15,7 @@ from ..models.warehouse import (
 )
 
 
-class AsyncWarehouseResource:
+class AsyncWarehouseResource(AsyncBaseResource):
     """Resource for interacting with the Warehouse API asynchronously."""
 
     def __init__(self, client):
@@ -36,6 +38,22 @@ class AsyncWarehouseResource:
         """
         return await self.client.get(self.base_path, params=params)
 
+    def stream(
+        self, params: Optional[Union[Dict[str, Any], WarehouseListParams]] = None, concurrency: int = 1
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all warehouses asynchronously, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields warehouses one at a time.
+        """
+        return aiter_items(self.list, params, concurrency)
+
     async def create(self, data: Union[Dict[str, Any], WarehouseCreate]) -> WarehouseResponse:
         """Create a new warehouse asynchronously.
 
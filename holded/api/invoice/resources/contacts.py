@@ -2,8 +2,10 @@
 Resource for interacting with the Contacts API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ....pagination import iter_items
+from ...resources import BaseResource
 from ..models.contacts import (
     ContactAttachmentListResponse,
     ContactAttachmentResponse,
@@ -15,7 +17,7 @@ from ..models.contacts import (
 )
 
 
-class ContactsResource:
+class ContactsResource(BaseResource):
     """Resource for interacting with the Contacts API."""
 
     def __init__(self, client):
@@ -42,6 +44,18 @@ class ContactsResource:
         """
         return self.client.get(self.base_path, params=params)
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], ContactListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all contacts, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields contacts one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], ContactCreate]) -> ContactResponse:
         """Create a new contact.
 
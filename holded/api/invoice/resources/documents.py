@@ -2,7 +2,7 @@
 Documents resource for the Holded API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 from ...resources import BaseResource
 
@@ -31,6 +31,19 @@ class DocumentsResource(BaseResource):
             self.client.get(f"invoicing/documents/{docType}", params=params),
         )
 
+    def stream_list(self, docType: str, params: Optional[Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all documents, decoding them one by one as the response arrives.
+
+        Args:
+            docType: The document type
+            params: Optional query parameters (DocumentListParams or dict)
+
+        Returns:
+            An iterator that yields documents one at a time
+        """
+        return self.client.stream_list(f"invoicing/documents/{docType}", params=params)
+
     def create(self, docType: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new document.
@@ -2,8 +2,10 @@
 Resource for interacting with the Expense Accounts API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ....pagination import iter_items
+from ...resources import BaseResource
 from ..models.expense_accounts import (
     ExpenseAccountCreate,
     ExpenseAccountListParams,
@@ -13,7 +15,7 @@ from ..models.expense_accounts import (
 )
 
 
-class ExpenseAccountsResource:
+class ExpenseAccountsResource(BaseResource):
     """Resource for interacting with the Expense Accounts API."""
 
     def __init__(self, client):
@@ -38,6 +40,18 @@ class ExpenseAccountsResource:
         """
         return self.client.get(self.base_path, params=params)
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], ExpenseAccountListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all expense accounts, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields expense accounts one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], ExpenseAccountCreate]) -> ExpenseAccountResponse:
         """Create a new expense account.
 
@@ -2,12 +2,14 @@
 Resource for interacting with the Payments API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ....pagination import iter_items
+from ...resources import BaseResource
 from ..models.payments import PaymentCreate, PaymentListParams, PaymentListResponse, PaymentResponse, PaymentUpdate
 
 
-class PaymentsResource:
+class PaymentsResource(BaseResource):
     """Resource for interacting with the Payments API."""
 
     def __init__(self, client):
@@ -30,6 +32,18 @@ class PaymentsResource:
         """
         return self.client.get(self.base_path, params=params)
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], PaymentListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all payments, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields payments one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], PaymentCreate]) -> PaymentResponse:
         """Create a new payment.
 
@@ -2,8 +2,9 @@
 Products resource for the Holded API.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+from ....pagination import iter_items
 from ...resources import BaseResource
 from ..models.products import ProductCreate, ProductListParams, ProductUpdate
 
@@ -35,6 +36,18 @@ class ProductsResource(BaseResource):
         result = self.client.get(self.base_path, params=params)
         return result
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], ProductListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all products, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields products one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], ProductCreate]) -> Dict[str, Any]:
         """
         Create a new product.
@@ -2,8 +2,10 @@
 Resource for interacting with the Sales Channels API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ....pagination import iter_items
+from ...resources import BaseResource
 from ..models.sales_channels import (
     SalesChannelCreate,
     SalesChannelListParams,
@@ -13,7 +15,7 @@ from ..models.sales_channels import (
 )
 
 
-class SalesChannelsResource:
+class SalesChannelsResource(BaseResource):
     """Resource for interacting with the Sales Channels API."""
 
     def __init__(self, client):
@@ -36,6 +38,18 @@ class SalesChannelsResource:
         """
         return self.client.get(self.base_path, params=params)
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], SalesChannelListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all sales channels, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields sales channels one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], SalesChannelCreate]) -> SalesChannelResponse:
         """Create a new sales channel.
 
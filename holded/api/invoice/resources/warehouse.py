@@ -2,8 +2,10 @@
 Resource for interacting with the Warehouse API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
+from ....pagination import iter_items
+from ...resources import BaseResource
 from ..models.warehouse import (
     WarehouseCreate,
     WarehouseListParams,
@@ -13,7 +15,7 @@ from ..models.warehouse import (
 )
 
 
-class WarehouseResource:
+class WarehouseResource(BaseResource):
     """Resource for interacting with the Warehouse API."""
 
     def __init__(self, client):
@@ -36,6 +38,18 @@ class WarehouseResource:
         """
         return self.client.get(self.base_path, params=params)
 
+    def iter_all(self, params: Optional[Union[Dict[str, Any], WarehouseListParams]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all warehouses, fetching pages lazily.
+
+        Args:
+            params: Optional query parameters. ``page`` sets the first page and
+                ``limit`` the page size.
+
+        Returns:
+            An iterator that yields warehouses one at a time.
+        """
+        return iter_items(self.list, params)
+
     def create(self, data: Union[Dict[str, Any], WarehouseCreate]) -> WarehouseResponse:
         """Create a new warehouse.
 
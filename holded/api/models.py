@@ -2,15 +2,32 @@
 Base models for the Holded API.
 """
 
+import importlib
+import threading
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Type
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, Field, field_validator
 
 
+# Packages whose models ``warm_schemas`` builds by default
+MODEL_PACKAGES = (
+    "holded.api.accounting.models",
+    "holded.api.crm.models",
+    "holded.api.invoice.models",
+    "holded.api.projects.models",
+    "holded.api.team.models",
+)
+
+
+@lru_cache(maxsize=None)
 def to_camel(string: str) -> str:
-    """Convert snake_case strings to camelCase."""
+    """Convert snake_case strings to camelCase.
+
+    Cached, because the same field names recur across the models.
+    """
     parts = string.split("_")
     if len(parts) == 1:
         return string
@@ -24,9 +41,15 @@ def to_camel(string: str) -> str:
 
 
 class BaseModel(PydanticBaseModel):
-    """Base model for all Holded API models."""
+    """Base model for all Holded API models.
+
+    Validation schemas are built the first time a model validates or
+    serializes data, not when its module is imported. Use ``warm_schemas`` to
+    build them ahead of time.
+    """
 
     model_config = ConfigDict(
+        defer_build=True,
         populate_by_name=True,
         arbitrary_types_allowed=True,
         alias_generator=to_camel,
@@ -86,3 +109,46 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Error message")
     error: Optional[str] = Field(default=None, description="Error code")
     status: Optional[int] = Field(default=None, description="HTTP status code")
+
+
+def iter_models(packages: Iterable[str] = MODEL_PACKAGES) -> Iterator[Type[BaseModel]]:
+    """Iterate over the models exported by model packages, importing them.
+
+    Args:
+        packages: Names of the model packages.
+
+    Yields:
+        The model classes.
+    """
+    for package in packages:
+        module = importlib.import_module(package)
+        for name in getattr(module, "__all__", ()):
+            value = getattr(module, name)
+            if isinstance(value, type) and issubclass(value, PydanticBaseModel):
+                yield value
+
+
+def warm_schemas(packages: Iterable[str] = MODEL_PACKAGES, background: bool = False) -> Optional[threading.Thread]:
+    """Build the validation schemas of models before they are first used.
+
+    Args:
+        packages: Names of the model packages to warm. Defaults to every API.
+        background: Whether to build them in a daemon thread, so that a server
+            can start handling requests meanwhile.
+
+    Returns:
+        The thread building the schemas if ``background`` is set, otherwise None.
+    """
+    packages = list(packages)
+
+    def build() -> None:
+        for model in iter_models(packages):
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+
+    if not background:
+        build()
+        return None
+    thread = threading.Thread(target=build, name="holded-warm-schemas", daemon=True)
+    thread.start()
+    return thread
@@ -2,29 +2,34 @@
 Data models for the Holded Projects API.
 """
 
-from .projects import (
-    Project,
-    ProjectCreate,
-    ProjectListResponse,
-    ProjectResponse,
-    ProjectSummary,
-    ProjectSummaryResponse,
-    ProjectUpdate,
-)
-from .tasks import (
-    Task,
-    TaskCreate,
-    TaskListResponse,
-    TaskResponse,
-    TaskUpdate,
-)
-from .time_tracking import (
-    TimeTracking,
-    TimeTrackingCreate,
-    TimeTrackingListResponse,
-    TimeTrackingResponse,
-    TimeTrackingUpdate,
-)
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .projects import (
+        Project,
+        ProjectCreate,
+        ProjectListResponse,
+        ProjectResponse,
+        ProjectSummary,
+        ProjectSummaryResponse,
+        ProjectUpdate,
+    )
+    from .tasks import (
+        Task,
+        TaskCreate,
+        TaskListResponse,
+        TaskResponse,
+        TaskUpdate,
+    )
+    from .time_tracking import (
+        TimeTracking,
+        TimeTrackingCreate,
+        TimeTrackingListResponse,
+        TimeTrackingResponse,
+        TimeTrackingUpdate,
+    )
 
 __all__ = [
     # Projects
@@ -48,3 +53,14 @@ __all__ = [
     "TimeTrackingResponse",
     "TimeTrackingListResponse",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "projects",
+        "tasks",
+        "time_tracking",
+    ],
+    exports=__all__,
+)
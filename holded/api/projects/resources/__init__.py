@@ -1,9 +1,14 @@
-from .async_projects import AsyncProjectsResource
-from .async_tasks import AsyncTasksResource
-from .async_time_tracking import AsyncTimeTrackingResource
-from .projects import ProjectsResource
-from .tasks import TasksResource
-from .time_tracking import TimeTrackingResource
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .async_projects import AsyncProjectsResource
+    from .async_tasks import AsyncTasksResource
+    from .async_time_tracking import AsyncTimeTrackingResource
+    from .projects import ProjectsResource
+    from .tasks import TasksResource
+    from .time_tracking import TimeTrackingResource
 
 __all__ = [
     "ProjectsResource",
@@ -13,3 +18,17 @@ __all__ = [
     "TimeTrackingResource",
     "AsyncTimeTrackingResource",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "async_projects",
+        "async_tasks",
+        "async_time_tracking",
+        "projects",
+        "tasks",
+        "time_tracking",
+    ],
+    exports=__all__,
+)
@@ -2,8 +2,10 @@
 Asynchronous resource for interacting with the Time Tracking API.
 """
 
-from typing import Any, Dict, List, cast
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Type, cast
 
+from ....batch import DEFAULT_CONCURRENCY, DEFAULT_STOP_ON, BatchItemResult, BatchResult, aiter_batch, arun_batch
+from ....exceptions import HoldedError
 from ...resources import AsyncBaseResource
 from ..models.time_tracking import TimeTrackingCreate, TimeTrackingUpdate
 
@@ -67,6 +69,23 @@ class AsyncTimeTrackingResource(AsyncBaseResource):
         result = await self.client.get(f"{self.base_path}/{project_id}/times/{time_tracking_id}")
         return cast(Dict[str, Any], result)
 
+    async def get_many(
+        self, time_tracking_ids: Iterable[str], project_id: str, *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult:
+        """Get several time tracking entries of a project concurrently.
+
+        Args:
+            time_tracking_ids: The time tracking IDs
+            project_id: The project ID
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            The entries in the order of the IDs, with failed IDs reported in the result
+        """
+        return await arun_batch(
+            lambda time_tracking_id: self.get(project_id, time_tracking_id), list(time_tracking_ids), concurrency
+        )
+
     async def update(self, project_id: str, time_tracking_id: str, data: TimeTrackingUpdate) -> Dict[str, Any]:
         """Update a time tracking entry asynchronously.
 
@@ -81,6 +100,31 @@ class AsyncTimeTrackingResource(AsyncBaseResource):
         result = await self.client.put(f"{self.base_path}/{project_id}/times/{time_tracking_id}", data=data)
         return cast(Dict[str, Any], result)
 
+    def update_many(
+        self,
+        updates: Iterable[Tuple[str, TimeTrackingUpdate]],
+        project_id: str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Update several time tracking entries of a project concurrently.
+
+        Args:
+            updates: Tuples of time tracking ID and data
+            project_id: The project ID
+            concurrency: Maximum number of requests in flight
+            rate_limit: Optional maximum number of requests started per second
+            stop_on: Errors that cancel the remaining updates
+
+        Returns:
+            An async iterator with one result per update, in completion order
+        """
+        return aiter_batch(
+            lambda change: self.update(project_id, change[0], change[1]), updates, concurrency, rate_limit, stop_on
+        )
+
     async def delete(self, project_id: str, time_tracking_id: str) -> Dict[str, Any]:
         """Delete a time tracking entry asynchronously.
 
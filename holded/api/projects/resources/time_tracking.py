@@ -2,8 +2,10 @@
 Resource for interacting with the Time Tracking API.
 """
 
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, cast
 
+from ....batch import DEFAULT_CONCURRENCY, DEFAULT_STOP_ON, BatchItemResult, BatchResult, iter_batch, run_batch
+from ....exceptions import HoldedError
 from ...resources import BaseResource
 from ..models.time_tracking import TimeTrackingCreate, TimeTrackingUpdate
 
@@ -72,6 +74,23 @@ class TimeTrackingResource(BaseResource):
             self.client.get(f"{self.base_path}/{project_id}/times/{time_tracking_id}"),
         )
 
+    def get_many(
+        self, time_tracking_ids: Iterable[str], project_id: str, *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> BatchResult:
+        """Get several time tracking entries of a project concurrently.
+
+        Args:
+            time_tracking_ids: The time tracking IDs
+            project_id: The project ID
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            The entries in the order of the IDs, with failed IDs reported in the result
+        """
+        return run_batch(
+            lambda time_tracking_id: self.get(project_id, time_tracking_id), list(time_tracking_ids), concurrency
+        )
+
     def update(self, project_id: str, time_tracking_id: str, data: TimeTrackingUpdate) -> Dict[str, Any]:
         """Update a time tracking entry.
 
@@ -88,6 +107,31 @@ class TimeTrackingResource(BaseResource):
             self.client.put(f"{self.base_path}/{project_id}/times/{time_tracking_id}", data=data),
         )
 
+    def update_many(
+        self,
+        updates: Iterable[Tuple[str, TimeTrackingUpdate]],
+        project_id: str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> Iterator[BatchItemResult]:
+        """Update several time tracking entries of a project concurrently.
+
+        Args:
+            updates: Tuples of time tracking ID and data
+            project_id: The project ID
+            concurrency: Maximum number of requests in flight
+            rate_limit: Optional maximum number of requests started per second
+            stop_on: Errors that cancel the remaining updates
+
+        Yields:
+            One result per update, in completion order
+        """
+        return iter_batch(
+            lambda change: self.update(project_id, change[0], change[1]), updates, concurrency, rate_limit, stop_on
+        )
+
     def delete(self, project_id: str, time_tracking_id: str) -> Dict[str, Any]:
         """Delete a time tracking entry.
 
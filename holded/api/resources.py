@@ -3,6 +3,19 @@ Base resources for the Holded API.
 """
 
 from abc import ABC
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, Tuple, Type
+
+from ..batch import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_STOP_ON,
+    BatchItemResult,
+    BatchResult,
+    aiter_batch,
+    arun_batch,
+    iter_batch,
+    run_batch,
+)
+from ..exceptions import HoldedError
 
 
 class BaseResource(ABC):
@@ -16,6 +29,80 @@ class BaseResource(ABC):
         """
         self.client = client
 
+    def get_many(
+        self, ids: Iterable[str], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, **kwargs: Any
+    ) -> BatchResult:
+        """Get several records concurrently.
+
+        Calls ``get`` for every ID on a thread pool that shares the client's
+        connection pool. Keep ``concurrency`` within the pool size.
+
+        Args:
+            ids: The IDs to get.
+            *args: Extra positional arguments passed to ``get`` after the ID.
+                Resources whose ``get`` takes the ID after a parent ID, such as
+                time tracking, override this method.
+            concurrency: Maximum number of requests in flight.
+            **kwargs: Extra keyword arguments passed to ``get``.
+
+        Returns:
+            The records in the order of the IDs. Failed IDs are reported in the
+            result instead of aborting the batch.
+        """
+        get = self.get  # type: ignore[attr-defined]
+        return run_batch(lambda record_id: get(record_id, *args, **kwargs), list(ids), concurrency)
+
+    def create_many(
+        self,
+        items: Iterable[Any],
+        *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> Iterator[BatchItemResult]:
+        """Create several records concurrently.
+
+        Args:
+            items: The data of every record.
+            *args: Extra positional arguments passed to ``create`` before the data,
+                such as the document type.
+            concurrency: Maximum number of requests in flight.
+            rate_limit: Optional maximum number of requests started per second.
+            stop_on: Errors that cancel the remaining items.
+
+        Yields:
+            One result per item, in completion order.
+        """
+        create = self.create  # type: ignore[attr-defined]
+        return iter_batch(lambda item: create(*args, item), items, concurrency, rate_limit, stop_on)
+
+    def update_many(
+        self,
+        updates: Iterable[Tuple[str, Any]],
+        *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> Iterator[BatchItemResult]:
+        """Update several records concurrently.
+
+        Args:
+            updates: Tuples of record ID and data.
+            *args: Extra positional arguments passed to ``update`` between the ID
+                and the data, such as the document type. Resources whose
+                ``update`` takes the ID after a parent ID override this method.
+            concurrency: Maximum number of requests in flight.
+            rate_limit: Optional maximum number of requests started per second.
+            stop_on: Errors that cancel the remaining items.
+
+        Yields:
+            One result per update, in completion order.
+        """
+        update = self.update  # type: ignore[attr-defined]
+        return iter_batch(
+            lambda change: update(change[0], *args, change[1]), updates, concurrency, rate_limit, stop_on
+        )
+
 
 class AsyncBaseResource(ABC):
     """Base resource for the Holded API (async)."""
@@ -27,3 +114,74 @@ class AsyncBaseResource(ABC):
             client: The Holded async client instance.
         """
         self.client = client
+
+    async def get_many(
+        self, ids: Iterable[str], *args: Any, concurrency: int = DEFAULT_CONCURRENCY, **kwargs: Any
+    ) -> BatchResult:
+        """Get several records concurrently.
+
+        Args:
+            ids: The IDs to get.
+            *args: Extra positional arguments passed to ``get`` after the ID.
+                Resources whose ``get`` takes the ID after a parent ID, such as
+                time tracking, override this method.
+            concurrency: Maximum number of requests in flight.
+            **kwargs: Extra keyword arguments passed to ``get``.
+
+        Returns:
+            The records in the order of the IDs. Failed IDs are reported in the
+            result instead of aborting the batch.
+        """
+        get = self.get  # type: ignore[attr-defined]
+        return await arun_batch(lambda record_id: get(record_id, *args, **kwargs), list(ids), concurrency)
+
+    def create_many(
+        self,
+        items: Iterable[Any],
+        *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Create several records concurrently.
+
+        Args:
+            items: The data of every record.
+            *args: Extra positional arguments passed to ``create`` before the data,
+                such as the document type.
+            concurrency: Maximum number of requests in flight.
+            rate_limit: Optional maximum number of requests started per second.
+            stop_on: Errors that cancel the remaining items.
+
+        Returns:
+            An async iterator with one result per item, in completion order.
+        """
+        create = self.create  # type: ignore[attr-defined]
+        return aiter_batch(lambda item: create(*args, item), items, concurrency, rate_limit, stop_on)
+
+    def update_many(
+        self,
+        updates: Iterable[Tuple[str, Any]],
+        *args: Any,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Update several records concurrently.
+
+        Args:
+            updates: Tuples of record ID and data.
+            *args: Extra positional arguments passed to ``update`` between the ID
+                and the data, such as the document type. Resources whose
+                ``update`` takes the ID after a parent ID override this method.
+            concurrency: Maximum number of requests in flight.
+            rate_limit: Optional maximum number of requests started per second.
+            stop_on: Errors that cancel the remaining items.
+
+        Returns:
+            An async iterator with one result per update, in completion order.
+        """
+        update = self.update  # type: ignore[attr-defined]
+        return aiter_batch(
+            lambda change: update(change[0], *args, change[1]), updates, concurrency, rate_limit, stop_on
+        )
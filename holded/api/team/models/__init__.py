@@ -2,20 +2,25 @@
 Data models for the Holded Team API.
 """
 
-from .employee_time_tracking import (
-    EmployeeTimeTracking,
-    EmployeeTimeTrackingCreate,
-    EmployeeTimeTrackingListResponse,
-    EmployeeTimeTrackingResponse,
-    EmployeeTimeTrackingUpdate,
-)
-from .employees import (
-    Employee,
-    EmployeeCreate,
-    EmployeeListResponse,
-    EmployeeResponse,
-    EmployeeUpdate,
-)
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .employee_time_tracking import (
+        EmployeeTimeTracking,
+        EmployeeTimeTrackingCreate,
+        EmployeeTimeTrackingListResponse,
+        EmployeeTimeTrackingResponse,
+        EmployeeTimeTrackingUpdate,
+    )
+    from .employees import (
+        Employee,
+        EmployeeCreate,
+        EmployeeListResponse,
+        EmployeeResponse,
+        EmployeeUpdate,
+    )
 
 __all__ = [
     # Employees
@@ -31,3 +36,13 @@ __all__ = [
     "EmployeeTimeTrackingResponse",
     "EmployeeTimeTrackingListResponse",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "employee_time_tracking",
+        "employees",
+    ],
+    exports=__all__,
+)
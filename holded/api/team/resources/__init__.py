@@ -1,7 +1,12 @@
-from .async_employee_time_tracking import AsyncEmployeeTimeTrackingResource
-from .async_employees import AsyncEmployeesResource
-from .employee_time_tracking import EmployeeTimeTrackingResource
-from .employees import EmployeesResource
+from typing import TYPE_CHECKING
+
+from ....lazy import attach
+
+if TYPE_CHECKING:
+    from .async_employee_time_tracking import AsyncEmployeeTimeTrackingResource
+    from .async_employees import AsyncEmployeesResource
+    from .employee_time_tracking import EmployeeTimeTrackingResource
+    from .employees import EmployeesResource
 
 __all__ = [
     "EmployeesResource",
@@ -9,3 +14,15 @@ __all__ = [
     "EmployeeTimeTrackingResource",
     "AsyncEmployeeTimeTrackingResource",
 ]
+
+# Exports are imported from their submodule on first access
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "async_employee_time_tracking",
+        "async_employees",
+        "employee_time_tracking",
+        "employees",
+    ],
+    exports=__all__,
+)
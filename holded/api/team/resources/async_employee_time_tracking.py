@@ -2,8 +2,9 @@
 Asynchronous resource for interacting with the Employee Time Tracking API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
+from ....pagination import aiter_items
 from ...resources import AsyncBaseResource
 from ..models.employee_time_tracking import (
     EmployeeTimeTrackingCreate,
@@ -38,6 +39,19 @@ class AsyncEmployeeTimeTrackingResource(AsyncBaseResource):
         result = await self.client.get(f"{self.base_path}/times", params=params)
         return cast(List[Dict[str, Any]], result)
 
+    def stream(self, page: int = 1, concurrency: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """Stream time tracking entries across all employees, fetching pages lazily.
+
+        Args:
+            page: Page number to start from
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields time tracking entries one at a time
+        """
+        return aiter_items(lambda params: self.list_all(page=params["page"]), {"page": page}, concurrency)
+
     async def list(self, employee_id: str) -> List[Dict[str, Any]]:
         """List all time tracking entries for a specific employee asynchronously.
 
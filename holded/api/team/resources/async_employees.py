@@ -2,8 +2,9 @@
 Asynchronous resource for interacting with the Employees API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
+from ....pagination import aiter_items
 from ...resources import AsyncBaseResource
 from ..models.employees import EmployeeCreate, EmployeeUpdate
 
@@ -35,6 +36,19 @@ class AsyncEmployeesResource(AsyncBaseResource):
         result = await self.client.get(self.base_path, params=params)
         return cast(List[Dict[str, Any]], result)
 
+    def stream(self, page: int = 1, concurrency: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all employees asynchronously, fetching pages lazily.
+
+        Args:
+            page: Page number to start from
+            concurrency: Number of pages fetched at once. Values above 1 discover
+                the page count first and then fetch pages in parallel.
+
+        Returns:
+            An async iterator that yields employees one at a time
+        """
+        return aiter_items(lambda params: self.list(page=params["page"]), {"page": page}, concurrency)
+
     async def create(self, data: EmployeeCreate) -> Dict[str, Any]:
         """Create a new employee asynchronously.
 
@@ -2,8 +2,9 @@
 Resource for interacting with the Employee Time Tracking API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
+from ....pagination import iter_items
 from ...resources import BaseResource
 from ..models.employee_time_tracking import (
     EmployeeTimeTrackingCreate,
@@ -40,6 +41,17 @@ class EmployeeTimeTrackingResource(BaseResource):
             self.client.get(f"{self.base_path}/times", params=params),
         )
 
+    def iter_all(self, page: int = 1) -> Iterator[Dict[str, Any]]:
+        """Iterate over time tracking entries across all employees, fetching pages lazily.
+
+        Args:
+            page: Page number to start from
+
+        Returns:
+            An iterator that yields time tracking entries one at a time
+        """
+        return iter_items(lambda params: self.list_all(page=params["page"]), {"page": page})
+
     def list(self, employee_id: str) -> List[Dict[str, Any]]:
         """List all time tracking entries for a specific employee.
 
@@ -2,8 +2,9 @@
 Resource for interacting with the Employees API.
 """
 
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
+from ....pagination import iter_items
 from ...resources import BaseResource
 from ..models.employees import EmployeeCreate, EmployeeUpdate
 
@@ -34,6 +35,17 @@ class EmployeesResource(BaseResource):
             params["page"] = page
         return cast(List[Dict[str, Any]], self.client.get(self.base_path, params=params))
 
+    def iter_all(self, page: int = 1) -> Iterator[Dict[str, Any]]:
+        """Iterate over all employees, fetching pages lazily.
+
+        Args:
+            page: Page number to start from
+
+        Returns:
+            An iterator that yields employees one at a time
+        """
+        return iter_items(lambda params: self.list(page=params["page"]), {"page": page})
+
     def create(self, data: EmployeeCreate) -> Dict[str, Any]:
         """Create a new employee.
 
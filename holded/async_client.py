@@ -3,50 +3,62 @@ Asynchronous client for the Holded API.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Type, TypeVar, Union
 from urllib.parse import urljoin
 
-import aiohttp
-from aiohttp import ClientTimeout
 from pydantic import BaseModel
 
-from .api.accounting.resources.async_chart_of_accounts import AsyncChartOfAccountsResource
-from .api.accounting.resources.async_daily_ledger import AsyncDailyLedgerResource
-from .api.crm.resources.async_bookings import AsyncBookingsResource
-from .api.crm.resources.async_events import AsyncEventsResource
-from .api.crm.resources.async_funnels import AsyncFunnelsResource
-from .api.crm.resources.async_leads import AsyncLeadsResource
-from .api.invoice.resources.async_contact_groups import AsyncContactGroupsResource
-from .api.invoice.resources.async_contacts import AsyncContactsResource
-from .api.invoice.resources.async_documents import AsyncDocumentsResource
-from .api.invoice.resources.async_expense_accounts import AsyncExpenseAccountsResource
-from .api.invoice.resources.async_numbering_series import AsyncNumberingSeriesResource
-from .api.invoice.resources.async_payments import AsyncPaymentsResource
-from .api.invoice.resources.async_products import AsyncProductsResource
-from .api.invoice.resources.async_remittances import AsyncRemittancesResource
-from .api.invoice.resources.async_sales_channels import AsyncSalesChannelsResource
-from .api.invoice.resources.async_services import AsyncServicesResource
-from .api.invoice.resources.async_taxes import AsyncTaxesResource
-from .api.invoice.resources.async_treasury import AsyncTreasuryResource
-from .api.invoice.resources.async_warehouse import AsyncWarehouseResource
-from .api.projects.resources.async_projects import AsyncProjectsResource
-from .api.projects.resources.async_tasks import AsyncTasksResource
-from .api.projects.resources.async_time_tracking import AsyncTimeTrackingResource
-from .api.team.resources.async_employee_time_tracking import AsyncEmployeeTimeTrackingResource
-from .api.team.resources.async_employees import AsyncEmployeesResource
+from . import fork
+from .cache import ResponseCache, account_scope
+from .codec import JSONCodec, resolve_codec
+from .coalesce import COALESCE_METHODS, AsyncRequestCoalescer, coalesce_key
+from .config import ClientConfig
 from .exceptions import (
     HoldedAPIError,
     HoldedAuthError,
-    HoldedConnectionError,
     HoldedError,
     HoldedNotFoundError,
     HoldedRateLimitError,
     HoldedServerError,
-    HoldedTimeoutError,
     HoldedValidationError,
 )
+from .instrumentation import RequestEvent, RequestHook, emit, endpoint_template
+from .lazy import lazy_resource
+from .metrics import MetricsRegistry
+from .pooling import PoolConfig
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import DEFAULT_CHUNK_SIZE, JSONArrayParser
+from .validation import FULL, ResponseValidator
+from .transports.base import AsyncTransport, AsyncTransportResponse
+
+if TYPE_CHECKING:
+    from .api.accounting.resources.async_chart_of_accounts import AsyncChartOfAccountsResource
+    from .api.accounting.resources.async_daily_ledger import AsyncDailyLedgerResource
+    from .api.crm.resources.async_bookings import AsyncBookingsResource
+    from .api.crm.resources.async_events import AsyncEventsResource
+    from .api.crm.resources.async_funnels import AsyncFunnelsResource
+    from .api.crm.resources.async_leads import AsyncLeadsResource
+    from .api.invoice.resources.async_contact_groups import AsyncContactGroupsResource
+    from .api.invoice.resources.async_contacts import AsyncContactsResource
+    from .api.invoice.resources.async_documents import AsyncDocumentsResource
+    from .api.invoice.resources.async_expense_accounts import AsyncExpenseAccountsResource
+    from .api.invoice.resources.async_numbering_series import AsyncNumberingSeriesResource
+    from .api.invoice.resources.async_payments import AsyncPaymentsResource
+    from .api.invoice.resources.async_products import AsyncProductsResource
+    from .api.invoice.resources.async_remittances import AsyncRemittancesResource
+    from .api.invoice.resources.async_sales_channels import AsyncSalesChannelsResource
+    from .api.invoice.resources.async_services import AsyncServicesResource
+    from .api.invoice.resources.async_taxes import AsyncTaxesResource
+    from .api.invoice.resources.async_treasury import AsyncTreasuryResource
+    from .api.invoice.resources.async_warehouse import AsyncWarehouseResource
+    from .api.projects.resources.async_projects import AsyncProjectsResource
+    from .api.projects.resources.async_tasks import AsyncTasksResource
+    from .api.projects.resources.async_time_tracking import AsyncTimeTrackingResource
+    from .api.team.resources.async_employee_time_tracking import AsyncEmployeeTimeTrackingResource
+    from .api.team.resources.async_employees import AsyncEmployeesResource
 
 logger = logging.getLogger(__name__)
 
@@ -56,8 +68,76 @@ T = TypeVar("T")
 class AsyncHoldedClient:
     """
     Asynchronous client for the Holded API.
+
+    Pickling a client keeps only its ``ClientConfig``: the unpickled client has
+    no cache, hooks or metrics and its own rate limiter. Clients cannot be
+    copied with ``copy``; build a new one with ``from_config(client.to_config())``.
     """
 
+    # Resources are created on first access
+    contacts: "AsyncContactsResource" = lazy_resource(
+        ".api.invoice.resources.async_contacts:AsyncContactsResource"
+    )
+    documents: "AsyncDocumentsResource" = lazy_resource(
+        ".api.invoice.resources.async_documents:AsyncDocumentsResource"
+    )
+    products: "AsyncProductsResource" = lazy_resource(
+        ".api.invoice.resources.async_products:AsyncProductsResource"
+    )
+    warehouse: "AsyncWarehouseResource" = lazy_resource(
+        ".api.invoice.resources.async_warehouse:AsyncWarehouseResource"
+    )
+    treasury: "AsyncTreasuryResource" = lazy_resource(
+        ".api.invoice.resources.async_treasury:AsyncTreasuryResource"
+    )
+    sales_channels: "AsyncSalesChannelsResource" = lazy_resource(
+        ".api.invoice.resources.async_sales_channels:AsyncSalesChannelsResource"
+    )
+    numbering_series: "AsyncNumberingSeriesResource" = lazy_resource(
+        ".api.invoice.resources.async_numbering_series:AsyncNumberingSeriesResource"
+    )
+    expense_accounts: "AsyncExpenseAccountsResource" = lazy_resource(
+        ".api.invoice.resources.async_expense_accounts:AsyncExpenseAccountsResource"
+    )
+    remittances: "AsyncRemittancesResource" = lazy_resource(
+        ".api.invoice.resources.async_remittances:AsyncRemittancesResource"
+    )
+    payments: "AsyncPaymentsResource" = lazy_resource(
+        ".api.invoice.resources.async_payments:AsyncPaymentsResource"
+    )
+    taxes: "AsyncTaxesResource" = lazy_resource(".api.invoice.resources.async_taxes:AsyncTaxesResource")
+    contact_groups: "AsyncContactGroupsResource" = lazy_resource(
+        ".api.invoice.resources.async_contact_groups:AsyncContactGroupsResource"
+    )
+    services: "AsyncServicesResource" = lazy_resource(
+        ".api.invoice.resources.async_services:AsyncServicesResource"
+    )
+    funnels: "AsyncFunnelsResource" = lazy_resource(".api.crm.resources.async_funnels:AsyncFunnelsResource")
+    leads: "AsyncLeadsResource" = lazy_resource(".api.crm.resources.async_leads:AsyncLeadsResource")
+    events: "AsyncEventsResource" = lazy_resource(".api.crm.resources.async_events:AsyncEventsResource")
+    bookings: "AsyncBookingsResource" = lazy_resource(
+        ".api.crm.resources.async_bookings:AsyncBookingsResource"
+    )
+    projects: "AsyncProjectsResource" = lazy_resource(
+        ".api.projects.resources.async_projects:AsyncProjectsResource"
+    )
+    tasks: "AsyncTasksResource" = lazy_resource(".api.projects.resources.async_tasks:AsyncTasksResource")
+    time_tracking: "AsyncTimeTrackingResource" = lazy_resource(
+        ".api.projects.resources.async_time_tracking:AsyncTimeTrackingResource"
+    )
+    employees: "AsyncEmployeesResource" = lazy_resource(
+        ".api.team.resources.async_employees:AsyncEmployeesResource"
+    )
+    employee_time_tracking: "AsyncEmployeeTimeTrackingResource" = lazy_resource(
+        ".api.team.resources.async_employee_time_tracking:AsyncEmployeeTimeTrackingResource"
+    )
+    daily_ledger: "AsyncDailyLedgerResource" = lazy_resource(
+        ".api.accounting.resources.async_daily_ledger:AsyncDailyLedgerResource"
+    )
+    chart_of_accounts: "AsyncChartOfAccountsResource" = lazy_resource(
+        ".api.accounting.resources.async_chart_of_accounts:AsyncChartOfAccountsResource"
+    )
+
     def __init__(
         self,
         api_key: str,
@@ -66,6 +146,19 @@ class AsyncHoldedClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: int = 1,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_config: Optional[PoolConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        validation: str = FULL,
+        validation_sample_rate: int = 100,
+        transport: Optional[AsyncTransport] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initialize the asynchronous Holded API client.
@@ -75,8 +168,37 @@ class AsyncHoldedClient:
             base_url: The base URL for the Holded API
             api_version: The API version to use
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retries for failed requests
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of attempts for failed requests
+            retry_delay: Base delay between retries in seconds
+            rate_limit: Optional maximum number of requests per second. Requests
+                are paced before they are sent instead of waiting for a 429
+            rate_limit_burst: Number of requests allowed back to back when the
+                limiter is idle. Defaults to rate_limit
+            rate_limiter: Optional limiter to share with other clients. Takes
+                precedence over rate_limit
+            retry_policy: Optional retry policy. Defaults to exponential backoff
+                with jitter built from max_retries and retry_delay
+            pool_config: Optional connection pool settings. Ignored when transport
+                is given
+            cache: Optional cache for GET responses of reference-data endpoints.
+                Can be shared with other clients
+            coalesce: Whether concurrent identical GET requests from several tasks
+                share one HTTP request
+            json_codec: Optional JSON codec, or the name of a built-in one
+                ("json" or "orjson"). Defaults to orjson when installed
+            validation: How responses are turned into response models: "full"
+                validates every response, "sampled" validates one in every
+                validation_sample_rate responses and logs schema drift, and
+                "trusted" builds models without validation
+            validation_sample_rate: How often responses are validated in
+                "sampled" mode
+            transport: Optional transport that sends the requests. Defaults to an
+                AiohttpTransport; use AsyncHttpxTransport for HTTP/2
+            hooks: Optional callables that receive a RequestEvent with the outcome
+                and phase timings of every attempt. They run on the event loop, so
+                they must not block. More can be appended to hooks later
+            metrics: Optional registry that records the count, latency and size
+                of the requests per endpoint. Can be shared with other clients
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -84,53 +206,144 @@ class AsyncHoldedClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.session = None
+        if rate_limiter is None and rate_limit is not None:
+            rate_limiter = RateLimiter(rate_limit, rate_limit_burst)
+        self.rate_limiter = rate_limiter
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_attempts=max_retries, base_delay=retry_delay)
+        self.retry_policy = retry_policy
+        self.pool_config = pool_config or PoolConfig()
+        self.cache = cache
+        self.json_codec = resolve_codec(json_codec)
+        self.validator = ResponseValidator(validation, validation_sample_rate)
+        self.coalescer = AsyncRequestCoalescer() if coalesce else None
+        self.hooks: List[RequestHook] = list(hooks or ())
+        self.metrics = metrics
+        if metrics is not None:
+            self.hooks.append(metrics)
         self.headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "Key": self.api_key,
         }
+        if transport is None:
+            # Imported here so that importing the client does not load aiohttp
+            from .transports.aiohttp_transport import AiohttpTransport
+
+            transport = AiohttpTransport(timeout=timeout, pool_config=self.pool_config)
+        self.transport = transport
+        self.transport.headers.update(self.headers)
+        # Forked children drop the connections they inherit from this process
+        fork.register(self)
+
+    @property
+    def session(self) -> Any:
+        """
+        The session of the transport, if it has one.
+        """
+        return getattr(self.transport, "session", None)
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Open connections to the API ahead of the first requests.
+
+        Sends ``connections`` concurrent HEAD requests to the base URL so that the
+        TCP and TLS handshakes are done before latency-sensitive calls. The
+        connections stay in the pool for as long as the keepalive timeout allows.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            The number of connections that were opened successfully
+        """
+        await self.transport.open()
+
+        async def open_connection() -> None:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            async with self.transport.request("HEAD", self.base_url) as response:
+                await response.read()
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(f"Failed to open {len(failures)} of {connections} connections: {failures[0]}")
+        return connections - len(failures)
+
+    def to_config(self) -> ClientConfig:
+        """
+        Get the settings of this client as a picklable config.
+
+        Returns:
+            The config. The rate limiter, cache and transport are not part of it
+        """
+        limiter = self.rate_limiter
+        return ClientConfig(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            api_version=self.api_version,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            rate_limit=limiter.rate if limiter is not None else None,
+            rate_limit_burst=limiter.burst if limiter is not None else None,
+            retry_policy=self.retry_policy,
+            pool_config=self.pool_config,
+            coalesce=self.coalescer is not None,
+            json_codec=self.json_codec,
+            validation=self.validator.mode,
+            validation_sample_rate=self.validator.sample_rate,
+        )
+
+    @classmethod
+    def from_config(cls, config: ClientConfig) -> "AsyncHoldedClient":
+        """
+        Create a client from a config.
+
+        Args:
+            config: The config, such as one returned by to_config
+
+        Returns:
+            A new client
+        """
+        kwargs = config.to_kwargs()
+        del kwargs["session_per_thread"]
+        return cls(**kwargs)
+
+    def __reduce__(self) -> Any:
+        # Pickled as its config only; see ClientConfig
+        return (type(self).from_config, (self.to_config(),))
+
+    def __copy__(self) -> "AsyncHoldedClient":
+        # A copy through __reduce__ would silently drop the cache, hooks, metrics and shared rate limiter
+        raise TypeError(
+            f"{type(self).__name__} cannot be copied; use from_config(client.to_config()) and pass "
+            "the cache, hooks and metrics again"
+        )
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AsyncHoldedClient":
+        return self.__copy__()
+
+    def _after_fork(self) -> None:
+        """
+        Drop the connections, locks and in-flight requests inherited from the parent process.
+        """
+        budget = getattr(self.retry_policy, "budget", None)
+        fork.reset_locks(self.rate_limiter, budget, self.cache, self.validator)
+        if self.coalescer is not None:
+            self.coalescer = AsyncRequestCoalescer()
+        self.transport.reset_after_fork()
 
-        # Initialize resources
-        self.contacts = AsyncContactsResource(self)
-        self.documents = AsyncDocumentsResource(self)
-        self.products = AsyncProductsResource(self)
-        self.warehouse = AsyncWarehouseResource(self)
-        self.treasury = AsyncTreasuryResource(self)
-        self.sales_channels = AsyncSalesChannelsResource(self)
-        self.numbering_series = AsyncNumberingSeriesResource(self)
-        self.expense_accounts = AsyncExpenseAccountsResource(self)
-        self.remittances = AsyncRemittancesResource(self)
-        self.payments = AsyncPaymentsResource(self)
-        self.taxes = AsyncTaxesResource(self)
-        self.contact_groups = AsyncContactGroupsResource(self)
-        self.services = AsyncServicesResource(self)
-        self.funnels = AsyncFunnelsResource(self)
-        self.leads = AsyncLeadsResource(self)
-        self.events = AsyncEventsResource(self)
-        self.bookings = AsyncBookingsResource(self)
-        self.projects = AsyncProjectsResource(self)
-        self.tasks = AsyncTasksResource(self)
-        self.time_tracking = AsyncTimeTrackingResource(self)
-        self.employees = AsyncEmployeesResource(self)
-        self.employee_time_tracking = AsyncEmployeeTimeTrackingResource(self)
-        self.daily_ledger = AsyncDailyLedgerResource(self)
-        self.chart_of_accounts = AsyncChartOfAccountsResource(self)
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """
-        Get or create an aiohttp ClientSession.
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Get the usage of the connection pool.
 
         Returns:
-            An aiohttp ClientSession
+            A dictionary with the pool size, connections in use, idle connections,
+            the saturation (in use divided by size) and the same figures per host
         """
-        if self.session is None or self.session.closed:
-            timeout = ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(
-                headers=self.headers,
-                timeout=timeout,
-            )
-        return self.session
+        return self.transport.pool_stats()
 
     def _build_url(self, path: str) -> str:
         """
@@ -166,14 +379,21 @@ class AsyncHoldedClient:
         return data
 
     async def _handle_response(
-        self, response: aiohttp.ClientResponse, response_model: Optional[Type[T]] = None
+        self,
+        response: AsyncTransportResponse,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        event: Optional[RequestEvent] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Handle the API response and raise appropriate exceptions.
 
         Args:
-            response: The aiohttp ClientResponse object
+            response: The transport response
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
+            event: Optional event that records the size, download, decode and
+                validation time of the response
 
         Returns:
             The parsed JSON response
@@ -188,37 +408,92 @@ class AsyncHoldedClient:
         """
         status_code = response.status
         content_type = response.headers.get("Content-Type", "")
+        content = await response.read()
+        if event is not None:
+            event.bytes_received = len(content)
+            event.download = response.timings.get("download")
+        start = time.perf_counter()
 
         try:
+            data = self.json_codec.loads(content) if content else None
+        except ValueError as e:
             if "application/json" in content_type:
-                data = await response.json()
-            else:
-                text = await response.text()
-                try:
-                    data = json.loads(text)
-                except json.JSONDecodeError:
-                    data = {"message": text}
-        except Exception as e:
-            raise HoldedAPIError(f"Failed to parse response: {str(e)}", status_code=status_code)
+                raise HoldedAPIError(f"Failed to parse response: {str(e)}", status_code=status_code)
+            data = {"message": content.decode("utf-8", errors="replace")}
+        if event is not None:
+            event.decode = time.perf_counter() - start
 
         if status_code >= 400:
-            error_message = data.get("message", str(data))
+            error_message = data.get("message", str(data)) if isinstance(data, dict) else str(data)
+            error_details = {"status_code": status_code, "error_data": data, "headers": response.headers}
             if status_code == 401:
-                raise HoldedAuthError(error_message, status_code=status_code, error_data=data)
+                raise HoldedAuthError(error_message, **error_details)
             elif status_code == 404:
-                raise HoldedNotFoundError(error_message, status_code=status_code, error_data=data)
+                raise HoldedNotFoundError(error_message, **error_details)
             elif status_code == 422:
-                raise HoldedValidationError(error_message, status_code=status_code, error_data=data)
+                raise HoldedValidationError(error_message, **error_details)
             elif status_code == 429:
-                raise HoldedRateLimitError(error_message, status_code=status_code, error_data=data)
+                raise HoldedRateLimitError(error_message, **error_details)
             elif status_code >= 500:
-                raise HoldedServerError(error_message, status_code=status_code, error_data=data)
+                raise HoldedServerError(error_message, **error_details)
             else:
-                raise HoldedAPIError(error_message, status_code=status_code, error_data=data)
+                raise HoldedAPIError(error_message, **error_details)
 
-        if response_model is not None:
-            return response_model.model_validate(data)
-        return data
+        return self._validate_response(data, response_model, validation, event)
+
+    def _validate_response(
+        self,
+        data: Any,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        event: Optional[RequestEvent] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
+        """Validate decoded response data.
+
+        Args:
+            data: The decoded response data.
+            response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+            event: Optional event that records the validation time.
+
+        Returns:
+            The model instance, or the data itself if no model is given.
+        """
+        if response_model is None:
+            return data
+        if event is None:
+            return self.validator.validate(response_model, data, validation)
+        start = time.perf_counter()
+        try:
+            return self.validator.validate(response_model, data, validation)
+        finally:
+            event.validation = time.perf_counter() - start
+
+    def _validate_fetched(
+        self,
+        data: Any,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
+        """Validate data served outside ``_send``, raising the same errors as ``_send``.
+
+        Args:
+            data: The decoded response data.
+            response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+
+        Returns:
+            The model instance, or the data itself if no model is given.
+
+        Raises:
+            HoldedError: If the data does not validate.
+        """
+        try:
+            return self._validate_response(data, response_model, validation)
+        except HoldedError:
+            raise
+        except Exception as e:
+            raise HoldedError(f"Unexpected error: {str(e)}") from e
 
     async def request(
         self,
@@ -227,6 +502,7 @@ class AsyncHoldedClient:
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Make an asynchronous request to the Holded API.
@@ -237,6 +513,7 @@ class AsyncHoldedClient:
             params: Optional query parameters
             data: Optional request body data
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
 
         Returns:
             The parsed JSON response
@@ -247,7 +524,6 @@ class AsyncHoldedClient:
             Various HoldedAPIError subclasses for API errors
         """
         url = self._build_url(path)
-        session = await self._get_session()
 
         # Serialize params and data if they are Pydantic models
         if params is not None and isinstance(params, BaseModel):
@@ -255,38 +531,135 @@ class AsyncHoldedClient:
 
         if data is not None:
             data = self._serialize_data(data)
+            body = self.json_codec.dumps(data)
+        else:
+            body = None
+
+        endpoint = endpoint_template(path)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(method, path, params, account_scope(self.api_key, self.base_url))
+        if cache_key is not None:
+            found, cached = self.cache.lookup(cache_key)
+            if not found:
+                cached = await self._fetch(method, url, params, body, endpoint)
+                self.cache.store(cache_key, cached)
+            return self._validate_fetched(cached, response_model, validation)
+
+        if self.coalescer is not None and method.upper() in COALESCE_METHODS:
+            data = await self._fetch(method, url, params, body, endpoint)
+            return self._validate_fetched(data, response_model, validation)
+
+        result = await self._send(method, url, params, body, response_model, validation, endpoint)
+        if self.cache is not None and method.upper() != "GET":
+            self.cache.invalidate_resource(path)
+        return result
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        endpoint: str = "",
+    ) -> Any:
+        """
+        Send a request and return the decoded data, sharing identical requests in flight.
+
+        Args:
+            method: HTTP method
+            url: The full URL
+            params: Optional query parameters
+            body: Optional encoded request body
+            endpoint: The endpoint template, for the request events
+
+        Returns:
+            The decoded response data
+        """
+        if self.coalescer is None or method.upper() not in COALESCE_METHODS:
+            return await self._send(method, url, params, body, endpoint=endpoint)
+        key = coalesce_key(method, url, params)
+        return await self.coalescer.run(key, lambda: self._send(method, url, params, body, endpoint=endpoint))
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        endpoint: str = "",
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
+        """
+        Send a request, pacing and retrying it as configured.
+
+        Args:
+            method: HTTP method
+            url: The full URL
+            params: Optional query parameters
+            body: Optional encoded request body
+            response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
+            endpoint: The endpoint template, for the request events
 
-        for attempt in range(self.max_retries):
+        Returns:
+            The parsed JSON response
+        """
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            event = RequestEvent(method, url, endpoint, attempt, len(body) if body else 0) if self.hooks else None
+            started = time.perf_counter()
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire_async()
+                if event is not None:
+                    event.rate_limit_wait = waited
             try:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    ssl=True,
-                ) as response:
-                    return await self._handle_response(response, response_model)
-            except (HoldedRateLimitError, HoldedServerError) as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2**attempt)
-                    logger.warning(f"Request failed with {e.__class__.__name__}. Retrying in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
-            except aiohttp.ClientConnectorError as e:
-                raise HoldedConnectionError(f"Connection error: {str(e)}")
-            except asyncio.TimeoutError:
-                raise HoldedTimeoutError("Request timed out")
-            except HoldedError:
-                raise
+                async with self.transport.request(method, url, params=params, content=body) as response:
+                    if event is not None:
+                        event.record_response(response.status, response.timings)
+                    result = await self._handle_response(response, response_model, validation, event)
+            except HoldedError as e:
+                error = e
             except Exception as e:
-                raise HoldedError(f"Unexpected error: {str(e)}")
+                if event is not None:
+                    event.error = e
+                    self._emit_event(event, started)
+                raise HoldedError(f"Unexpected error: {str(e)}") from e
+            else:
+                if event is not None:
+                    self._emit_event(event, started)
+                return result
+
+            delay = self.retry_policy.get_retry_delay(method, error, attempt)
+            if event is not None:
+                event.error = error
+                event.retry_delay = delay
+                self._emit_event(event, started)
+            if delay is None:
+                raise error
+            logger.warning(f"Request failed with {error.__class__.__name__}. Retrying in {delay:.2f} seconds...")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _emit_event(self, event: RequestEvent, started: float) -> None:
+        """
+        Complete the event of an attempt and send it to the hooks.
+
+        Args:
+            event: The event
+            started: When the attempt started, from ``time.perf_counter()``
+        """
+        event.total = time.perf_counter() - started
+        emit(self.hooks, event)
 
     async def get(
         self,
         path: str,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Make an asynchronous GET request to the Holded API.
@@ -295,11 +668,14 @@ class AsyncHoldedClient:
             path: API path (e.g., 'invoicing/documents')
             params: Optional query parameters
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
 
         Returns:
             The parsed JSON response
         """
-        return await self.request("GET", path, params=params, response_model=response_model)
+        return await self.request(
+            "GET", path, params=params, response_model=response_model, validation=validation
+        )
 
     async def post(
         self,
@@ -307,6 +683,7 @@ class AsyncHoldedClient:
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Make an asynchronous POST request to the Holded API.
@@ -316,11 +693,14 @@ class AsyncHoldedClient:
             data: Request body data
             params: Optional query parameters
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
 
         Returns:
             The parsed JSON response
         """
-        return await self.request("POST", path, params=params, data=data, response_model=response_model)
+        return await self.request(
+            "POST", path, params=params, data=data, response_model=response_model, validation=validation
+        )
 
     async def put(
         self,
@@ -328,6 +708,7 @@ class AsyncHoldedClient:
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Make an asynchronous PUT request to the Holded API.
@@ -337,17 +718,21 @@ class AsyncHoldedClient:
             data: Request body data
             params: Optional query parameters
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
 
         Returns:
             The parsed JSON response
         """
-        return await self.request("PUT", path, params=params, data=data, response_model=response_model)
+        return await self.request(
+            "PUT", path, params=params, data=data, response_model=response_model, validation=validation
+        )
 
     async def delete(
         self,
         path: str,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """
         Make an asynchronous DELETE request to the Holded API.
@@ -356,15 +741,115 @@ class AsyncHoldedClient:
             path: API path (e.g., 'invoicing/documents')
             params: Optional query parameters
             response_model: Optional Pydantic model to deserialize to
+            validation: Optional validation mode for the response model
 
         Returns:
             The parsed JSON response
         """
-        return await self.request("DELETE", path, params=params, response_model=response_model)
+        return await self.request(
+            "DELETE", path, params=params, response_model=response_model, validation=validation
+        )
+
+    async def stream_list(
+        self,
+        path: str,
+        params: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Any]:
+        """
+        Make an asynchronous GET request and yield the items of the JSON array it returns.
+
+        Items are decoded while the body downloads, so memory use stays around
+        one item however long the list is. The request is retried like any
+        other request until the body starts to arrive; errors after that are
+        raised. Streamed responses are neither cached nor shared with
+        identical requests.
+
+        Args:
+            path: API path (e.g., 'invoicing/documents/invoice')
+            params: Optional query parameters
+            chunk_size: Number of bytes read from the connection at a time
+
+        Yields:
+            The items of the list
+
+        Raises:
+            HoldedAPIError: If the body is not valid JSON
+        """
+        url = self._build_url(path)
+        if params is not None and isinstance(params, BaseModel):
+            params = params.model_dump(exclude_none=True)
+
+        endpoint = endpoint_template(path)
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            event = RequestEvent("GET", url, endpoint, attempt) if self.hooks else None
+            started = time.perf_counter()
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire_async()
+                if event is not None:
+                    event.rate_limit_wait = waited
+            received = False
+            try:
+                async with self.transport.request("GET", url, params=params, stream=True) as response:
+                    if event is not None:
+                        event.record_response(response.status, response.timings)
+                    if response.status >= 400:
+                        await self._handle_response(response, event=event)
+                    if event is not None:
+                        # The event is sent once the headers arrive, before the body
+                        self._emit_event(event, started)
+                        event = None
+                    parser = JSONArrayParser(self.json_codec)
+                    async for chunk in response.iter_chunks(chunk_size):
+                        received = True
+                        for item in parser.feed(chunk):
+                            yield item
+                    for item in parser.close():
+                        yield item
+                    return
+            except HoldedError as e:
+                if received:
+                    raise
+                error = e
+            except ValueError as e:
+                raise HoldedAPIError(f"Failed to parse response: {str(e)}", status_code=response.status) from e
+            except Exception as e:
+                if event is not None:
+                    event.error = e
+                    self._emit_event(event, started)
+                raise HoldedError(f"Unexpected error: {str(e)}") from e
+
+            delay = self.retry_policy.get_retry_delay("GET", error, attempt)
+            if event is not None:
+                event.error = error
+                event.retry_delay = delay
+                self._emit_event(event, started)
+            if delay is None:
+                raise error
+            logger.warning(f"Request failed with {error.__class__.__name__}. Retrying in {delay:.2f} seconds...")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __aenter__(self) -> "AsyncHoldedClient":
+        """
+        Open the client session when entering an ``async with`` block.
+
+        Returns:
+            The client
+        """
+        await self.transport.open()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """
+        Close the client session when leaving an ``async with`` block.
+        """
+        await self.close()
 
     async def close(self) -> None:
         """
-        Close the aiohttp session.
+        Close the transport and its connections.
         """
-        if self.session and not self.session.closed:
-            await self.session.close()
+        await self.transport.close()
@@ -0,0 +1,323 @@
+"""
+Concurrent batch operations for the Holded resources.
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .exceptions import HoldedAuthError, HoldedError
+from .rate_limit import RateLimiter
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 8
+
+# Errors after which the remaining items of a write batch are cancelled, because
+# every other item would fail the same way
+DEFAULT_STOP_ON: Tuple[Type[HoldedError], ...] = (HoldedAuthError,)
+
+
+class BatchResult(Generic[T]):
+    """Outcome of a batch operation, in the order of its inputs.
+
+    Failed inputs do not abort the batch: their result is None and the error is
+    kept at the same position in ``errors``.
+    """
+
+    def __init__(self, inputs: Sequence[Any], results: List[Optional[T]], errors: List[Optional[HoldedError]]):
+        """Initialize the batch result.
+
+        Args:
+            inputs: The inputs of the batch, such as IDs.
+            results: The result for every input, None where it failed.
+            errors: The error for every input, None where it succeeded.
+        """
+        self.inputs = list(inputs)
+        self.results = results
+        self.errors = errors
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Optional[T]]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> Optional[T]:
+        return self.results[index]
+
+    def __repr__(self) -> str:
+        return f"BatchResult(succeeded={len(self) - len(self.failures())}, failed={len(self.failures())})"
+
+    @property
+    def ok(self) -> bool:
+        """Whether every input succeeded."""
+        return all(error is None for error in self.errors)
+
+    def successes(self) -> List[T]:
+        """Get the results of the inputs that succeeded.
+
+        Returns:
+            The results, in input order.
+        """
+        return [result for result, error in zip(self.results, self.errors) if error is None]  # type: ignore[misc]
+
+    def failures(self) -> List[Tuple[Any, HoldedError]]:
+        """Get the inputs that failed.
+
+        Returns:
+            Tuples of input and error, in input order.
+        """
+        return [(item, error) for item, error in zip(self.inputs, self.errors) if error is not None]
+
+    def raise_for_errors(self) -> None:
+        """Raise the first error of the batch, if any.
+
+        Raises:
+            HoldedError: The error of the first input that failed.
+        """
+        for error in self.errors:
+            if error is not None:
+                raise error
+
+
+def run_batch(fn: Callable[[K], T], inputs: Sequence[K], concurrency: int = DEFAULT_CONCURRENCY) -> BatchResult[T]:
+    """Call a function for every input on a thread pool.
+
+    Args:
+        fn: The function to call, such as a resource's ``get``.
+        inputs: The inputs.
+        concurrency: Maximum number of concurrent calls. Keep it within the
+            connection pool size of the client.
+
+    Returns:
+        The batch result.
+    """
+    inputs = list(inputs)
+
+    def call(item: K) -> Tuple[Optional[T], Optional[HoldedError]]:
+        try:
+            return fn(item), None
+        except HoldedError as e:
+            return None, e
+
+    if concurrency <= 1 or len(inputs) <= 1:
+        outcomes = [call(item) for item in inputs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(inputs))) as executor:
+            outcomes = list(executor.map(call, inputs))
+    return BatchResult(inputs, [result for result, _ in outcomes], [error for _, error in outcomes])
+
+
+async def arun_batch(
+    fn: Callable[[K], Awaitable[T]], inputs: Sequence[K], concurrency: int = DEFAULT_CONCURRENCY
+) -> BatchResult[T]:
+    """Await a coroutine function for every input with bounded concurrency.
+
+    Args:
+        fn: The coroutine function to call, such as a resource's ``get``.
+        inputs: The inputs.
+        concurrency: Maximum number of concurrent calls.
+
+    Returns:
+        The batch result.
+    """
+    inputs = list(inputs)
+    results: List[Optional[T]] = [None] * len(inputs)
+    errors: List[Optional[HoldedError]] = [None] * len(inputs)
+    positions = iter(range(len(inputs)))
+
+    async def worker() -> None:
+        # Workers pull the next position instead of one task per input, so large
+        # batches do not create thousands of pending tasks
+        for index in positions:
+            try:
+                results[index] = await fn(inputs[index])
+            except HoldedError as e:
+                errors[index] = e
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(inputs))))))
+    return BatchResult(inputs, results, errors)
+
+
+class BatchItemResult(Generic[T]):
+    """Outcome of one item of a streamed batch."""
+
+    def __init__(
+        self,
+        index: int,
+        input: Any,
+        result: Optional[T] = None,
+        error: Optional[HoldedError] = None,
+        elapsed: float = 0.0,
+        cancelled: bool = False,
+    ):
+        """Initialize the item result.
+
+        Args:
+            index: Position of the item in the batch.
+            input: The item.
+            result: The response, if the item succeeded.
+            error: The error, if the item failed.
+            elapsed: Seconds spent on the item, including rate limit waits.
+            cancelled: Whether the item was skipped after a fatal error.
+        """
+        self.index = index
+        self.input = input
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+        self.cancelled = cancelled
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None and not self.cancelled
+
+    def __repr__(self) -> str:
+        status = "cancelled" if self.cancelled else "failed" if self.error is not None else "ok"
+        return f"BatchItemResult(index={self.index}, status={status}, elapsed={self.elapsed:.3f})"
+
+
+def _limiter(rate_limit: Optional[float]) -> Optional[RateLimiter]:
+    """Create the limiter that caps the request rate of a batch."""
+    return RateLimiter(rate_limit, burst=1) if rate_limit is not None else None
+
+
+def iter_batch(
+    fn: Callable[[K], T],
+    inputs: Iterable[K],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limit: Optional[float] = None,
+    stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+) -> Iterator[BatchItemResult[T]]:
+    """Call a function for every input on a thread pool and stream the outcomes.
+
+    Items are submitted as earlier ones finish, so no more than ``concurrency``
+    calls are in flight. After an error listed in ``stop_on`` no new items are
+    started; the items in flight finish and the rest are yielded as cancelled.
+    Closing the iterator early also stops starting new items.
+
+    Args:
+        fn: The function to call, such as a resource's ``create``.
+        inputs: The inputs.
+        concurrency: Maximum number of concurrent calls.
+        rate_limit: Optional maximum number of calls started per second.
+        stop_on: Errors that cancel the remaining items.
+
+    Yields:
+        One result per input, in completion order.
+    """
+    limiter = _limiter(rate_limit)
+    pending = enumerate(inputs)
+
+    def call(index: int, item: K) -> BatchItemResult[T]:
+        start = time.monotonic()
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return BatchItemResult(index, item, result=fn(item), elapsed=time.monotonic() - start)
+        except HoldedError as e:
+            return BatchItemResult(index, item, error=e, elapsed=time.monotonic() - start)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    in_flight: Set["Future[BatchItemResult[T]]"] = set()
+    stopped = False
+    try:
+        for index, item in pending:
+            in_flight.add(executor.submit(call, index, item))
+            if len(in_flight) >= concurrency:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = future.result()
+                if isinstance(outcome.error, stop_on):
+                    stopped = True
+                yield outcome
+                if not stopped:
+                    for index, item in pending:
+                        in_flight.add(executor.submit(call, index, item))
+                        break
+        for index, item in pending:
+            yield BatchItemResult(index, item, cancelled=True)
+    finally:
+        executor.shutdown(wait=True)
+
+
+async def aiter_batch(
+    fn: Callable[[K], Awaitable[T]],
+    inputs: Iterable[K],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limit: Optional[float] = None,
+    stop_on: Tuple[Type[HoldedError], ...] = DEFAULT_STOP_ON,
+) -> AsyncIterator[BatchItemResult[T]]:
+    """Await a coroutine function for every input and stream the outcomes.
+
+    No more than ``concurrency`` calls are in flight. After an error listed in
+    ``stop_on`` no new items are started; the items in flight finish and the
+    rest are yielded as cancelled. Closing the iterator early cancels the calls
+    in flight.
+
+    Args:
+        fn: The coroutine function to call, such as a resource's ``create``.
+        inputs: The inputs.
+        concurrency: Maximum number of concurrent calls.
+        rate_limit: Optional maximum number of calls started per second.
+        stop_on: Errors that cancel the remaining items.
+
+    Yields:
+        One result per input, in completion order.
+    """
+    limiter = _limiter(rate_limit)
+    pending = enumerate(inputs)
+
+    async def call(index: int, item: K) -> BatchItemResult[T]:
+        start = time.monotonic()
+        if limiter is not None:
+            await limiter.acquire_async()
+        try:
+            return BatchItemResult(index, item, result=await fn(item), elapsed=time.monotonic() - start)
+        except HoldedError as e:
+            return BatchItemResult(index, item, error=e, elapsed=time.monotonic() - start)
+
+    in_flight: Set["asyncio.Future[BatchItemResult[T]]"] = set()
+    stopped = False
+    try:
+        for index, item in pending:
+            in_flight.add(asyncio.ensure_future(call(index, item)))
+            if len(in_flight) >= concurrency:
+                break
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                outcome = task.result()
+                if isinstance(outcome.error, stop_on):
+                    stopped = True
+                yield outcome
+                if not stopped:
+                    for index, item in pending:
+                        in_flight.add(asyncio.ensure_future(call(index, item)))
+                        break
+        for index, item in pending:
+            yield BatchItemResult(index, item, cancelled=True)
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,22 @@
+"""
+Benchmarks of the Holded clients against the local stand-in for the API.
+
+Run them with ``python -m holded.bench``; see ``--help`` for the options. The
+report is JSON, so results can be compared across releases.
+"""
+
+from .runner import CLIENTS, Scenario, main, run_benchmarks, run_scenario
+from .workloads import WORKLOADS, LargeList, ReadHeavy, Workload, WriteHeavy
+
+__all__ = [
+    "CLIENTS",
+    "WORKLOADS",
+    "Scenario",
+    "Workload",
+    "ReadHeavy",
+    "WriteHeavy",
+    "LargeList",
+    "main",
+    "run_benchmarks",
+    "run_scenario",
+]
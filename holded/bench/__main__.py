@@ -0,0 +1,8 @@
+"""
+Run the benchmarks: ``python -m holded.bench --help``.
+"""
+
+from .runner import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+"""
+Runner of the benchmark suite.
+
+Every scenario runs one workload with one client setup against a freshly
+prepared stand-in server and reports requests per second, p50/p90/p99
+latency, CPU time per request and peak RSS. By default the server runs in
+its own process and every scenario in a new one, so the CPU time and memory
+belong to the client alone.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .. import __version__
+from ..async_client import AsyncHoldedClient
+from ..client import HoldedClient
+from ..exceptions import HoldedError
+from ..instrumentation import RequestEvent
+from ..testing import FakeHoldedServer, get_profile
+from ..testing.faults import PROFILES
+from .workloads import WORKLOADS, Workload
+
+API_KEY = "benchmark"
+# Ways of driving the clients: serially, on a thread pool and on an event loop
+CLIENTS = ("sync", "threads", "async")
+HEALTHY = "healthy"
+
+# Latency of one request and whether it succeeded
+_Sample = Tuple[float, bool]
+
+
+class Scenario:
+    """One workload run by one client setup under one fault profile."""
+
+    def __init__(
+        self,
+        client: str,
+        concurrency: int,
+        workload: str,
+        profile: str = HEALTHY,
+        requests: int = 500,
+        warmup: int = 20,
+    ):
+        """Initialize the scenario.
+
+        Args:
+            client: ``"sync"`` for serial calls of ``HoldedClient``, ``"threads"``
+                for ``HoldedClient.executor()`` or ``"async"`` for ``AsyncHoldedClient``.
+            concurrency: Number of threads or concurrent requests; 1 for ``"sync"``.
+            workload: The name of the workload, one of ``WORKLOADS``.
+            profile: The name of the fault profile of the server.
+            requests: Number of measured requests.
+            warmup: Number of requests sent first and not measured.
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self.workload = workload
+        self.profile = profile
+        self.requests = requests
+        self.warmup = warmup
+
+    def __repr__(self) -> str:
+        return f"Scenario({self.workload} {self.client} x{self.concurrency}, profile={self.profile})"
+
+
+class _StatusCounter:
+    """A request hook that counts attempts by status class."""
+
+    def __init__(self) -> None:
+        self.counts: "Counter[str]" = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            self.counts[event.status_class] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+
+def run_scenario(scenario: Scenario, base_url: str, ids: List[str]) -> Dict[str, Any]:
+    """Run a scenario against a prepared server.
+
+    Args:
+        scenario: The scenario.
+        base_url: The base URL of the server.
+        ids: The IDs returned by the setup of the workload.
+
+    Returns:
+        The result: throughput, latency percentiles in milliseconds, CPU
+        milliseconds per request, peak RSS in MiB, failed requests and the
+        attempts per status class, retries included.
+    """
+    workload = WORKLOADS[scenario.workload]
+    statuses = _StatusCounter()
+    if scenario.client == "async":
+        samples, seconds, cpu = asyncio.run(_run_async(scenario, workload, base_url, ids, statuses))
+    else:
+        samples, seconds, cpu = _run_sync(scenario, workload, base_url, ids, statuses)
+
+    latencies = sorted(latency for latency, _ in samples)
+    count = len(samples)
+    return {
+        "workload": scenario.workload,
+        "client": scenario.client,
+        "concurrency": scenario.concurrency,
+        "profile": scenario.profile,
+        "requests": count,
+        "errors": sum(not ok for _, ok in samples),
+        "attempts": dict(sorted(statuses.counts.items())),
+        "seconds": round(seconds, 4),
+        "requests_per_second": round(count / seconds, 1) if seconds else None,
+        "latency_ms": {
+            "p50": _percentile_ms(latencies, 0.5),
+            "p90": _percentile_ms(latencies, 0.9),
+            "p99": _percentile_ms(latencies, 0.99),
+            "max": _percentile_ms(latencies, 1.0),
+        },
+        "cpu_ms_per_request": round(cpu * 1000 / count, 4) if count else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _run_sync(
+    scenario: Scenario, workload: Workload, base_url: str, ids: List[str], statuses: _StatusCounter
+) -> Tuple[List[_Sample], float, float]:
+    client = HoldedClient(api_key=API_KEY, base_url=base_url, hooks=[statuses])
+    executor = client.executor(max_workers=scenario.concurrency) if scenario.client == "threads" else None
+
+    def timed(index: int) -> _Sample:
+        start = time.perf_counter()
+        try:
+            workload.call(client, index, ids)
+            ok = True
+        except HoldedError:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    def batch(indexes: Iterable[int]) -> List[_Sample]:
+        if executor is None:
+            return [timed(index) for index in indexes]
+        return list(executor.map(timed, indexes))
+
+    try:
+        batch(range(scenario.warmup))
+        statuses.clear()
+        cpu = time.process_time()
+        start = time.perf_counter()
+        samples = batch(range(scenario.warmup, scenario.warmup + scenario.requests))
+        return samples, time.perf_counter() - start, time.process_time() - cpu
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        client.close()
+
+
+async def _run_async(
+    scenario: Scenario, workload: Workload, base_url: str, ids: List[str], statuses: _StatusCounter
+) -> Tuple[List[_Sample], float, float]:
+    async with AsyncHoldedClient(api_key=API_KEY, base_url=base_url, hooks=[statuses]) as client:
+
+        async def timed(index: int) -> _Sample:
+            start = time.perf_counter()
+            try:
+                await workload.call(client, index, ids)
+                ok = True
+            except HoldedError:
+                ok = False
+            return time.perf_counter() - start, ok
+
+        async def batch(indexes: Iterable[int]) -> List[_Sample]:
+            # A fixed number of workers pull from one iterator, which caps the requests in flight
+            pending = iter(indexes)
+            samples: List[_Sample] = []
+
+            async def worker() -> None:
+                for index in pending:
+                    samples.append(await timed(index))
+
+            await asyncio.gather(*(worker() for _ in range(scenario.concurrency)))
+            return samples
+
+        await batch(range(scenario.warmup))
+        statuses.clear()
+        cpu = time.process_time()
+        start = time.perf_counter()
+        samples = await batch(range(scenario.warmup, scenario.warmup + scenario.requests))
+        return samples, time.perf_counter() - start, time.process_time() - cpu
+
+
+def _percentile_ms(latencies: Sequence[float], q: float) -> Optional[float]:
+    """Get a nearest-rank percentile of sorted latencies, in milliseconds."""
+    if not latencies:
+        return None
+    rank = min(len(latencies), max(1, math.ceil(q * len(latencies)))) - 1
+    return round(latencies[rank] * 1000, 3)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MiB, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes and macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class _LocalServer:
+    """The stand-in server, prepared afresh for every scenario."""
+
+    def __init__(self, latency: float, seed: int):
+        self.seed = seed
+        self.server = FakeHoldedServer(latency=latency).start()
+        self.base_url = self.server.base_url
+
+    def prepare(self, workload: str, profile: str) -> List[str]:
+        """Reset the records and the fault script, and seed the workload."""
+        self.server.reset()
+        self.server.profile = get_profile(profile, seed=self.seed)
+        return WORKLOADS[workload].setup(self.server)
+
+    def faults(self) -> Dict[str, int]:
+        """Get the faults injected since ``prepare``."""
+        return self.server.profile.stats() if self.server.profile is not None else {}
+
+    def close(self) -> None:
+        self.server.stop()
+
+
+def _serve(connection: Any, latency: float, seed: int) -> None:
+    """Run a ``_LocalServer`` in a child process, answering the calls sent over a pipe."""
+    server = _LocalServer(latency, seed)
+    connection.send(server.base_url)
+    try:
+        while True:
+            name, args = connection.recv()
+            if name == "close":
+                break
+            connection.send(getattr(server, name)(*args))
+    finally:
+        server.close()
+
+
+class _ServerProcess:
+    """A ``_LocalServer`` in its own process, so that it does not share the CPU time of the clients."""
+
+    def __init__(self, latency: float, seed: int, context: Any):
+        self._connection, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child, latency, seed), daemon=True)
+        self._process.start()
+        self.base_url = self._connection.recv()
+
+    def _call(self, name: str, *args: Any) -> Any:
+        self._connection.send((name, args))
+        return self._connection.recv()
+
+    def prepare(self, workload: str, profile: str) -> List[str]:
+        return self._call("prepare", workload, profile)
+
+    def faults(self) -> Dict[str, int]:
+        return self._call("faults")
+
+    def close(self) -> None:
+        self._connection.send(("close", ()))
+        self._process.join()
+
+
+def run_benchmarks(
+    workloads: Sequence[str] = tuple(WORKLOADS),
+    clients: Sequence[str] = CLIENTS,
+    threads: Sequence[int] = (4, 16),
+    concurrency: Sequence[int] = (1, 10, 50),
+    profiles: Sequence[str] = (HEALTHY,),
+    requests: int = 500,
+    warmup: int = 20,
+    latency: float = 0.0,
+    seed: int = 0,
+    isolate: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run every combination of workload, client setup and fault profile.
+
+    When ``profiles`` has faulty profiles, the healthy profile is run too and
+    the results under faults get a ``vs_healthy`` entry with their throughput
+    and p99 latency relative to the healthy run of the same scenario.
+
+    Args:
+        workloads: Names of the workloads, from ``WORKLOADS``.
+        clients: Client setups, from ``CLIENTS``.
+        threads: Thread pool sizes of the ``"threads"`` setup.
+        concurrency: Concurrency levels of the ``"async"`` setup.
+        profiles: Names of the fault profiles, from ``holded.testing.faults.PROFILES``.
+        requests: Number of measured requests per scenario.
+        warmup: Number of requests sent before measuring each scenario.
+        latency: Seconds the server waits before each response.
+        seed: Seed of the fault profiles.
+        isolate: Whether to run the server and every scenario in separate
+            processes. Without it, CPU time and RSS include the server.
+        progress: Optional function called with each result as it is ready.
+
+    Returns:
+        A report that can be serialized as JSON, with the environment, the
+        settings and a ``results`` list.
+
+    Raises:
+        ValueError: If a workload, client setup or profile is unknown.
+    """
+    for names, known, kind in (
+        (workloads, WORKLOADS, "workload"),
+        (clients, CLIENTS, "client"),
+        (profiles, PROFILES, "profile"),
+    ):
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown {kind} {unknown[0]!r}; choose from {', '.join(sorted(known))}")
+    if any(profile != HEALTHY for profile in profiles) and HEALTHY not in profiles:
+        profiles = [HEALTHY, *profiles]
+
+    setups = [(client, level) for client in clients for level in _levels(client, threads, concurrency)]
+    context = multiprocessing.get_context("spawn")
+    server = _ServerProcess(latency, seed, context) if isolate else _LocalServer(latency, seed)
+    results = []
+    try:
+        for profile in profiles:
+            for workload in workloads:
+                for client, level in setups:
+                    scenario = Scenario(client, level, workload, profile, requests, warmup)
+                    ids = server.prepare(workload, profile)
+                    if isolate:
+                        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                            result = pool.submit(run_scenario, scenario, server.base_url, ids).result()
+                    else:
+                        result = run_scenario(scenario, server.base_url, ids)
+                    result["faults"] = server.faults()
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    finally:
+        server.close()
+
+    _compare(results)
+    return {
+        "holded": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "settings": {
+            "requests": requests,
+            "warmup": warmup,
+            "latency": latency,
+            "seed": seed,
+            "isolate": isolate,
+        },
+        "results": results,
+    }
+
+
+def _levels(client: str, threads: Sequence[int], concurrency: Sequence[int]) -> Sequence[int]:
+    if client == "sync":
+        return (1,)
+    return threads if client == "threads" else concurrency
+
+
+def _compare(results: List[Dict[str, Any]]) -> None:
+    """Add the degradation under faults relative to the healthy run of each scenario."""
+    healthy = {
+        (result["workload"], result["client"], result["concurrency"]): result
+        for result in results
+        if result["profile"] == HEALTHY
+    }
+    for result in results:
+        baseline = healthy.get((result["workload"], result["client"], result["concurrency"]))
+        if result["profile"] == HEALTHY or baseline is None:
+            continue
+        result["vs_healthy"] = {
+            "throughput": _ratio(result["requests_per_second"], baseline["requests_per_second"]),
+            "p99": _ratio(result["latency_ms"]["p99"], baseline["latency_ms"]["p99"]),
+            "error_rate": round(result["errors"] / result["requests"], 4) if result["requests"] else None,
+        }
+
+
+def _ratio(value: Optional[float], baseline: Optional[float]) -> Optional[float]:
+    return round(value / baseline, 3) if value is not None and baseline else None
+
+
+def _describe(result: Dict[str, Any]) -> str:
+    """Format a result as one line of progress."""
+    latency = result["latency_ms"]
+    return (
+        f"{result['workload']:<12} {result['profile']:<14} {result['client']:>7} x{result['concurrency']:<4}"
+        f" {result['requests_per_second']:>9} req/s  p50 {latency['p50']} ms  p99 {latency['p99']} ms"
+        f"  cpu {result['cpu_ms_per_request']} ms/req  {result['errors']} errors"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmarks from the command line and print the report as JSON."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Holded clients against a local stand-in for the API."
+    )
+    parser.add_argument("--workload", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--client", nargs="+", choices=CLIENTS, default=list(CLIENTS))
+    parser.add_argument("--threads", nargs="+", type=int, default=[4, 16], help="thread pool sizes")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 10, 50], help="async concurrency levels")
+    parser.add_argument(
+        "--profile", nargs="+", choices=sorted(PROFILES), default=[HEALTHY], help="fault profiles of the server"
+    )
+    parser.add_argument("--requests", type=int, default=500, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="requests sent before measuring")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the server waits before each response")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the fault profiles")
+    parser.add_argument(
+        "--in-process", action="store_true", help="run the server and the scenarios in this process"
+    )
+    parser.add_argument("--output", help="file to write the JSON report to instead of standard output")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        workloads=args.workload,
+        clients=args.client,
+        threads=args.threads,
+        concurrency=args.concurrency,
+        profiles=args.profile,
+        requests=args.requests,
+        warmup=args.warmup,
+        latency=args.latency,
+        seed=args.seed,
+        isolate=not args.in_process,
+        progress=lambda result: print(_describe(result), file=sys.stderr),
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
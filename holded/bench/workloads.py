@@ -0,0 +1,106 @@
+"""
+Workloads of the benchmark suite.
+
+A workload seeds the stand-in server and then issues one request per call.
+The same workload drives both clients: ``call`` returns whatever the resource
+method returns, which the asynchronous client's runner awaits.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ..testing import FakeHoldedServer
+
+CONTACTS = "invoicing/contacts"
+
+
+def _contact(index: int) -> Dict[str, Any]:
+    return {
+        "name": f"Contact {index}",
+        "code": f"B{index:08d}",
+        "email": f"contact{index}@example.com",
+        "type": "client",
+        "billAddress": {"address": f"Calle Mayor {index}", "city": "Madrid", "postalCode": "28013"},
+    }
+
+
+class Workload(ABC):
+    """A mix of requests, run against a seeded stand-in server."""
+
+    name = "workload"
+    description = ""
+
+    def setup(self, server: "FakeHoldedServer") -> List[str]:
+        """Seed the server.
+
+        Args:
+            server: The server, already reset.
+
+        Returns:
+            The IDs of the seeded records, passed back to ``call``.
+        """
+        return []
+
+    @abstractmethod
+    def call(self, client: Any, index: int, ids: List[str]) -> Any:
+        """Send the request with the given number.
+
+        Args:
+            client: A ``HoldedClient`` or ``AsyncHoldedClient``.
+            index: The number of the request, starting at 0.
+            ids: The IDs returned by ``setup``.
+
+        Returns:
+            The result of the resource method; a coroutine on the async client.
+        """
+
+
+class ReadHeavy(Workload):
+    """Nine contact lookups for every list of taxes."""
+
+    name = "read-heavy"
+    description = "90% GET of a contact by ID, 10% list of taxes"
+
+    def setup(self, server: "FakeHoldedServer") -> List[str]:
+        return server.seed(CONTACTS, (_contact(index) for index in range(200)))
+
+    def call(self, client: Any, index: int, ids: List[str]) -> Any:
+        if index % 10 == 9:
+            return client.taxes.list()
+        return client.contacts.get(ids[index % len(ids)])
+
+
+class WriteHeavy(Workload):
+    """Three contact creations for every update."""
+
+    name = "write-heavy"
+    description = "75% POST of a new contact, 25% PUT of an existing one"
+
+    def setup(self, server: "FakeHoldedServer") -> List[str]:
+        return server.seed(CONTACTS, (_contact(index) for index in range(200)))
+
+    def call(self, client: Any, index: int, ids: List[str]) -> Any:
+        if index % 4 == 3:
+            return client.contacts.update(ids[index % len(ids)], {"phone": f"+34 600 {index:06d}"})
+        return client.contacts.create(_contact(index))
+
+
+class LargeList(Workload):
+    """Unpaged lists of a large collection, which stress decoding."""
+
+    name = "large-list"
+    description = "GET of every contact, 2000 per response"
+
+    size = 2000
+
+    def setup(self, server: "FakeHoldedServer") -> List[str]:
+        return server.seed(CONTACTS, (_contact(index) for index in range(self.size)))
+
+    def call(self, client: Any, index: int, ids: List[str]) -> Any:
+        return client.contacts.list()
+
+
+WORKLOADS: Dict[str, Workload] = {
+    workload.name: workload for workload in (ReadHeavy(), WriteHeavy(), LargeList())
+}
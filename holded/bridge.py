@@ -0,0 +1,274 @@
+"""
+Blocking access to the asynchronous client from synchronous code.
+"""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Awaitable, Iterable, Iterator, List, Optional, TypeVar
+
+from .async_client import AsyncHoldedClient
+from .lazy import LazyResource
+
+T = TypeVar("T")
+
+
+async def _resolve(awaitable: Awaitable[T]) -> T:
+    """Await any awaitable inside a coroutine, as ``run_coroutine_threadsafe`` requires."""
+    return await awaitable
+
+
+class _BlockingResource:
+    """An async resource whose methods block until their result is ready."""
+
+    def __init__(self, bridge: "AsyncBridge", resource: Any):
+        self._bridge = bridge
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._resource, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._bridge.call(attribute, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attribute.__doc__
+        return call
+
+    def __repr__(self) -> str:
+        return f"<{self._resource.__class__.__name__} on {self._bridge!r}>"
+
+
+class AsyncBridge:
+    """Run an ``AsyncHoldedClient`` on a dedicated event loop thread.
+
+    Synchronous code gets the concurrency of the async client from a single
+    extra thread: calls block the calling thread until their result is ready,
+    while ``run_many`` runs any number of requests concurrently on the loop.
+    The bridge can be used from several threads at once.
+
+    The bridge has the same resources as the client, with blocking methods;
+    methods that return async iterators return blocking iterators instead::
+
+        with AsyncBridge(api_key="your_api_key") as bridge:
+            contact = bridge.contacts.get("123")
+            contacts = bridge.run_many(bridge.client.contacts.get(i) for i in ids)
+            for document in bridge.documents.stream_list("invoice"):
+                print(document["id"])
+    """
+
+    def __init__(self, client: Optional[AsyncHoldedClient] = None, **client_kwargs: Any):
+        """Start the event loop thread and create the client.
+
+        Args:
+            client: Optional client to run. It must not be in use on another
+                event loop.
+            **client_kwargs: Arguments for a new ``AsyncHoldedClient`` when
+                ``client`` is not given, such as ``api_key``.
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._serve, name="holded-async-bridge", daemon=True)
+        self._thread.start()
+        self.closed = False
+        if client is None:
+            client = self.run(self._create_client(client_kwargs))
+        self.client = client
+
+    def _serve(self) -> None:
+        """Run the event loop until ``close`` stops it."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @staticmethod
+    async def _create_client(kwargs: Any) -> AsyncHoldedClient:
+        """Create the client on the loop, so that it binds to it."""
+        return AsyncHoldedClient(**kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        client = self.__dict__.get("client")
+        if client is not None and isinstance(getattr(type(client), name, None), LazyResource):
+            resource = _BlockingResource(self, getattr(client, name))
+            # Cache the proxy so later lookups do not go through __getattr__
+            setattr(self, name, resource)
+            return resource
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return f"AsyncBridge(closed={self.closed})"
+
+    def submit(self, awaitable: Awaitable[T]) -> "Future[T]":
+        """Schedule an awaitable on the loop without waiting for it.
+
+        Args:
+            awaitable: The awaitable, such as ``bridge.client.contacts.get("1")``.
+
+        Returns:
+            A ``concurrent.futures.Future`` for the result.
+
+        Raises:
+            RuntimeError: If the bridge is closed.
+        """
+        if self.closed:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("The bridge is closed")
+        coro = awaitable if asyncio.iscoroutine(awaitable) else _resolve(awaitable)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)  # type: ignore[arg-type]
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run an awaitable on the loop and wait for its result.
+
+        Args:
+            awaitable: The awaitable.
+            timeout: Optional maximum number of seconds to wait.
+
+        Returns:
+            The result.
+
+        Raises:
+            RuntimeError: If called from the bridge's own loop, which would
+                deadlock, or if the bridge is closed.
+        """
+        if threading.current_thread() is self._thread:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("AsyncBridge.run cannot be called from the bridge's event loop; await instead")
+        return self.submit(awaitable).result(timeout)
+
+    def call(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """Call an async client method and wait for its result.
+
+        The method is called on the loop. If it returns an async iterator, a
+        blocking iterator over the same items is returned instead.
+
+        Args:
+            fn: The method, such as ``bridge.client.contacts.list``.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            The result.
+        """
+
+        async def invoke() -> Any:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        result = self.run(invoke())
+        if hasattr(result, "__anext__"):
+            return self.iterate(result)
+        return result
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Turn an async iterator into a blocking iterator.
+
+        Each item is produced on the loop; closing the blocking iterator
+        closes the async one.
+
+        Args:
+            iterator: The async iterator, such as ``bridge.client.stream_list(...)``.
+
+        Yields:
+            The items.
+        """
+        try:
+            while True:
+                try:
+                    yield self.run(_resolve(iterator.__anext__()))
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None and not self.closed:
+                self.run(aclose())
+
+    def run_many(
+        self,
+        awaitables: Iterable[Awaitable[T]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Run awaitables concurrently on the loop and wait for all of them.
+
+        Args:
+            awaitables: The awaitables, such as client calls.
+            concurrency: Optional maximum number running at once. The client's
+                connection pool and rate limiter apply either way.
+            return_exceptions: Whether to return errors in place of results
+                instead of raising the first one.
+            timeout: Optional maximum number of seconds to wait.
+
+        Returns:
+            The results, in input order.
+
+        Raises:
+            Exception: The first error, unless ``return_exceptions`` is set. The
+                awaitables still running are cancelled.
+        """
+        return self.run(self._gather(list(awaitables), concurrency, return_exceptions), timeout)
+
+    @staticmethod
+    async def _gather(
+        awaitables: List[Awaitable[Any]], concurrency: Optional[int], return_exceptions: bool
+    ) -> List[Any]:
+        """Await the awaitables with bounded concurrency, cancelling the rest on error."""
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def run(awaitable: Awaitable[Any]) -> Any:
+            if semaphore is None:
+                return await awaitable
+            async with semaphore:
+                return await awaitable
+
+        tasks = [asyncio.ensure_future(run(awaitable)) for awaitable in awaitables]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Close the coroutines that were cancelled before they started
+            for awaitable in awaitables:
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()
+            raise
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        """Make a GET request and wait for it; see ``AsyncHoldedClient.get``."""
+        return self.run(self.client.get(*args, **kwargs))
+
+    def post(self, *args: Any, **kwargs: Any) -> Any:
+        """Make a POST request and wait for it; see ``AsyncHoldedClient.post``."""
+        return self.run(self.client.post(*args, **kwargs))
+
+    def put(self, *args: Any, **kwargs: Any) -> Any:
+        """Make a PUT request and wait for it; see ``AsyncHoldedClient.put``."""
+        return self.run(self.client.put(*args, **kwargs))
+
+    def delete(self, *args: Any, **kwargs: Any) -> Any:
+        """Make a DELETE request and wait for it; see ``AsyncHoldedClient.delete``."""
+        return self.run(self.client.delete(*args, **kwargs))
+
+    def close(self) -> None:
+        """Close the client, stop the loop and wait for its thread."""
+        if self.closed:
+            return
+        try:
+            self.run(self.client.close())
+        finally:
+            self.closed = True
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+
+    def __enter__(self) -> "AsyncBridge":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
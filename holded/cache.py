@@ -0,0 +1,237 @@
+"""
+Response cache for reference data served by the Holded API.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+# Endpoints whose data rarely changes, with the seconds a response stays fresh.
+# A ``*`` matches exactly one path segment.
+DEFAULT_TTLS: Dict[str, float] = {
+    "invoicing/taxes": 3600.0,
+    "invoicing/paymentmethods": 3600.0,
+    "invoicing/numberingseries/*": 3600.0,
+    "invoicing/saleschannels": 3600.0,
+    "invoicing/saleschannels/*": 3600.0,
+    "invoicing/expensesaccounts": 3600.0,
+    "invoicing/expensesaccounts/*": 3600.0,
+    "invoicing/warehouses": 3600.0,
+    "invoicing/warehouses/*": 3600.0,
+    "accounting/chartofaccounts": 3600.0,
+}
+
+
+def _split(path: str) -> Tuple[str, ...]:
+    """Split an API path into its segments, ignoring leading and trailing slashes."""
+    return tuple(segment for segment in path.strip("/").split("/") if segment)
+
+
+def account_scope(api_key: str, base_url: str) -> str:
+    """Get the part of a cache key that keeps the responses of accounts and hosts apart.
+
+    Args:
+        api_key: The API key of the client.
+        base_url: The base URL of the client.
+
+    Returns:
+        A digest of both, so the key itself is not kept in the cache.
+    """
+    return hashlib.sha256(f"{base_url}\n{api_key}".encode()).hexdigest()[:32]
+
+
+class ResponseCache:
+    """Time-limited, size-bounded cache for GET responses.
+
+    Only GET requests to endpoints with a TTL are cached; every other request
+    goes to the API. Entries are keyed by method, path, query parameters and the
+    account (a digest of the API key and base URL of the client), and the least
+    recently used entry is evicted when the cache is full. A
+    successful write (``POST``, ``PUT`` or ``DELETE``) through a client that
+    uses the cache drops the cached entries of the same resource.
+
+    The cache is thread-safe and can be shared by synchronous and asynchronous
+    clients; clients of different accounts or hosts never see each other's
+    entries.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttls: Optional[Mapping[str, Optional[float]]] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses.
+            ttls: TTLs in seconds per endpoint pattern, merged over ``DEFAULT_TTLS``.
+                Patterns are API paths such as ``"invoicing/taxes"`` where ``*``
+                matches one path segment; when several match, the one with the
+                fewest ``*`` wins. A TTL of None or 0 disables caching for the
+                endpoint.
+            default_ttl: Optional TTL for GET requests that match no pattern. By
+                default they are not cached.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        rules = dict(DEFAULT_TTLS)
+        rules.update(ttls or {})
+        self.ttls = rules
+        # Literal segments take precedence over wildcards, so an override of one
+        # path is not shadowed by a default pattern that also matches it
+        self._patterns = sorted(
+            ((_split(pattern), ttl) for pattern, ttl in rules.items()), key=lambda rule: rule[0].count("*")
+        )
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Get the TTL of an endpoint.
+
+        Args:
+            path: The API path.
+
+        Returns:
+            The TTL in seconds, or None if responses of the endpoint are not cached.
+        """
+        segments = _split(path)
+        for pattern, ttl in self._patterns:
+            if len(pattern) == len(segments) and all(p in ("*", s) for p, s in zip(pattern, segments)):
+                return ttl or None
+        return self.default_ttl or None
+
+    def key(
+        self, method: str, path: str, params: Optional[Mapping[str, Any]] = None, scope: str = ""
+    ) -> Optional[Hashable]:
+        """Build the cache key of a request.
+
+        Args:
+            method: The HTTP method.
+            path: The API path.
+            params: The query parameters.
+            scope: The account of the request, from ``account_scope``.
+
+        Returns:
+            The key, or None if the request is not cacheable.
+        """
+        if method.upper() != "GET" or self.ttl_for(path) is None:
+            return None
+        return ("GET", "/".join(_split(path)), json.dumps(params or {}, sort_keys=True, default=str), scope)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a cached response.
+
+        Args:
+            key: The key returned by ``key``.
+
+        Returns:
+            A tuple of whether a fresh entry was found and a copy of its value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[1]
+        return True, copy.deepcopy(value)
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Cache a response.
+
+        Args:
+            key: The key returned by ``key``.
+            value: The decoded response. A copy is stored, so callers may modify it.
+        """
+        ttl = self.ttl_for(key[1])  # type: ignore[index]
+        if ttl is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """Drop cached responses.
+
+        Args:
+            path: Optional API path. Drops the entries of the path and of every
+                path below it. Drops all entries if omitted.
+
+        Returns:
+            The number of entries dropped.
+        """
+        with self._lock:
+            if path is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            prefix = "/".join(_split(path))
+            keys = [
+                key
+                for key in self._entries
+                if key[1] == prefix or key[1].startswith(prefix + "/")  # type: ignore[index]
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def invalidate_resource(self, path: str) -> int:
+        """Drop the cached responses of the resource a path belongs to.
+
+        Args:
+            path: Any API path of the resource, such as ``"invoicing/warehouses/123"``.
+
+        Returns:
+            The number of entries dropped.
+        """
+        return self.invalidate("/".join(_split(path)[:2]))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics.
+
+        Returns:
+            A dictionary with the number of entries, the maximum size, hits,
+            misses, evictions, expirations and the hit rate.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the usage statistics."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
@@ -2,50 +2,65 @@
 Synchronous client for the Holded API.
 """
 
-import json
 import logging
 import time
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union
 from urllib.parse import urljoin
 
-import requests
 from pydantic import BaseModel
 
-from .api.accounting.resources.chart_of_accounts import ChartOfAccountsResource
-from .api.accounting.resources.daily_ledger import DailyLedgerResource
-from .api.crm.resources.bookings import BookingsResource
-from .api.crm.resources.events import EventsResource
-from .api.crm.resources.funnels import FunnelsResource
-from .api.crm.resources.leads import LeadsResource
-from .api.invoice.resources.contact_groups import ContactGroupsResource
-from .api.invoice.resources.contacts import ContactsResource
-from .api.invoice.resources.documents import DocumentsResource
-from .api.invoice.resources.expense_accounts import ExpenseAccountsResource
-from .api.invoice.resources.numbering_series import NumberingSeriesResource
-from .api.invoice.resources.payments import PaymentsResource
-from .api.invoice.resources.products import ProductsResource
-from .api.invoice.resources.remittances import RemittancesResource
-from .api.invoice.resources.sales_channels import SalesChannelsResource
-from .api.invoice.resources.services import ServicesResource
-from .api.invoice.resources.taxes import TaxesResource
-from .api.invoice.resources.treasury import TreasuryResource
-from .api.invoice.resources.warehouse import WarehouseResource
-from .api.projects.resources.projects import ProjectsResource
-from .api.projects.resources.tasks import TasksResource
-from .api.projects.resources.time_tracking import TimeTrackingResource
-from .api.team.resources.employee_time_tracking import EmployeeTimeTrackingResource
-from .api.team.resources.employees import EmployeesResource
+from . import fork
+from .batch import DEFAULT_CONCURRENCY
+from .cache import ResponseCache, account_scope
+from .codec import JSONCodec, resolve_codec
+from .coalesce import COALESCE_METHODS, RequestCoalescer, coalesce_key
+from .config import ClientConfig
 from .exceptions import (
     HoldedAPIError,
     HoldedAuthError,
-    HoldedConnectionError,
     HoldedError,
     HoldedNotFoundError,
     HoldedRateLimitError,
     HoldedServerError,
-    HoldedTimeoutError,
     HoldedValidationError,
 )
+from .executor import ClientExecutor
+from .instrumentation import RequestEvent, RequestHook, emit, endpoint_template
+from .lazy import lazy_resource
+from .metrics import MetricsRegistry
+from .pooling import PoolConfig
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import DEFAULT_CHUNK_SIZE, JSONArrayParser
+from .validation import FULL, ResponseValidator
+from .transports.base import Transport, TransportResponse
+from .transports.requests_transport import RequestsTransport
+
+if TYPE_CHECKING:
+    from .api.accounting.resources.chart_of_accounts import ChartOfAccountsResource
+    from .api.accounting.resources.daily_ledger import DailyLedgerResource
+    from .api.crm.resources.bookings import BookingsResource
+    from .api.crm.resources.events import EventsResource
+    from .api.crm.resources.funnels import FunnelsResource
+    from .api.crm.resources.leads import LeadsResource
+    from .api.invoice.resources.contact_groups import ContactGroupsResource
+    from .api.invoice.resources.contacts import ContactsResource
+    from .api.invoice.resources.documents import DocumentsResource
+    from .api.invoice.resources.expense_accounts import ExpenseAccountsResource
+    from .api.invoice.resources.numbering_series import NumberingSeriesResource
+    from .api.invoice.resources.payments import PaymentsResource
+    from .api.invoice.resources.products import ProductsResource
+    from .api.invoice.resources.remittances import RemittancesResource
+    from .api.invoice.resources.sales_channels import SalesChannelsResource
+    from .api.invoice.resources.services import ServicesResource
+    from .api.invoice.resources.taxes import TaxesResource
+    from .api.invoice.resources.treasury import TreasuryResource
+    from .api.invoice.resources.warehouse import WarehouseResource
+    from .api.projects.resources.projects import ProjectsResource
+    from .api.projects.resources.tasks import TasksResource
+    from .api.projects.resources.time_tracking import TimeTrackingResource
+    from .api.team.resources.employee_time_tracking import EmployeeTimeTrackingResource
+    from .api.team.resources.employees import EmployeesResource
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +68,60 @@ T = TypeVar("T")
 
 
 class HoldedClient:
-    """Client for the Holded API."""
+    """Client for the Holded API.
+
+    A client can be shared by threads: rate limiting, retries, caching and
+    validation are thread-safe. Create it with ``session_per_thread=True`` so
+    that every thread also sends requests through its own ``requests.Session``.
+
+    Pickling a client keeps only its ``ClientConfig``: the unpickled client has
+    no cache, hooks or metrics and its own rate limiter. Clients cannot be
+    copied with ``copy``; build a new one with ``from_config(client.to_config())``.
+    """
+
+    # Resources are created on first access
+    contacts: "ContactsResource" = lazy_resource(".api.invoice.resources.contacts:ContactsResource")
+    documents: "DocumentsResource" = lazy_resource(".api.invoice.resources.documents:DocumentsResource")
+    products: "ProductsResource" = lazy_resource(".api.invoice.resources.products:ProductsResource")
+    warehouse: "WarehouseResource" = lazy_resource(".api.invoice.resources.warehouse:WarehouseResource")
+    treasury: "TreasuryResource" = lazy_resource(".api.invoice.resources.treasury:TreasuryResource")
+    sales_channels: "SalesChannelsResource" = lazy_resource(
+        ".api.invoice.resources.sales_channels:SalesChannelsResource"
+    )
+    numbering_series: "NumberingSeriesResource" = lazy_resource(
+        ".api.invoice.resources.numbering_series:NumberingSeriesResource"
+    )
+    expense_accounts: "ExpenseAccountsResource" = lazy_resource(
+        ".api.invoice.resources.expense_accounts:ExpenseAccountsResource"
+    )
+    remittances: "RemittancesResource" = lazy_resource(
+        ".api.invoice.resources.remittances:RemittancesResource"
+    )
+    payments: "PaymentsResource" = lazy_resource(".api.invoice.resources.payments:PaymentsResource")
+    taxes: "TaxesResource" = lazy_resource(".api.invoice.resources.taxes:TaxesResource")
+    contact_groups: "ContactGroupsResource" = lazy_resource(
+        ".api.invoice.resources.contact_groups:ContactGroupsResource"
+    )
+    services: "ServicesResource" = lazy_resource(".api.invoice.resources.services:ServicesResource")
+    funnels: "FunnelsResource" = lazy_resource(".api.crm.resources.funnels:FunnelsResource")
+    leads: "LeadsResource" = lazy_resource(".api.crm.resources.leads:LeadsResource")
+    events: "EventsResource" = lazy_resource(".api.crm.resources.events:EventsResource")
+    bookings: "BookingsResource" = lazy_resource(".api.crm.resources.bookings:BookingsResource")
+    projects: "ProjectsResource" = lazy_resource(".api.projects.resources.projects:ProjectsResource")
+    tasks: "TasksResource" = lazy_resource(".api.projects.resources.tasks:TasksResource")
+    time_tracking: "TimeTrackingResource" = lazy_resource(
+        ".api.projects.resources.time_tracking:TimeTrackingResource"
+    )
+    employees: "EmployeesResource" = lazy_resource(".api.team.resources.employees:EmployeesResource")
+    employee_time_tracking: "EmployeeTimeTrackingResource" = lazy_resource(
+        ".api.team.resources.employee_time_tracking:EmployeeTimeTrackingResource"
+    )
+    daily_ledger: "DailyLedgerResource" = lazy_resource(
+        ".api.accounting.resources.daily_ledger:DailyLedgerResource"
+    )
+    chart_of_accounts: "ChartOfAccountsResource" = lazy_resource(
+        ".api.accounting.resources.chart_of_accounts:ChartOfAccountsResource"
+    )
 
     def __init__(
         self,
@@ -63,6 +131,20 @@ class HoldedClient:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: int = 1,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_config: Optional[PoolConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        validation: str = FULL,
+        validation_sample_rate: int = 100,
+        transport: Optional[Transport] = None,
+        session_per_thread: bool = False,
+        hooks: Optional[Iterable[RequestHook]] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """Initialize the Holded client.
 
@@ -71,8 +153,42 @@ class HoldedClient:
             base_url: The base URL for the Holded API.
             api_version: The API version to use.
             timeout: Request timeout in seconds.
-            max_retries: Maximum number of retries for failed requests.
-            retry_delay: Delay between retries in seconds.
+            max_retries: Maximum number of attempts for failed requests.
+            retry_delay: Base delay between retries in seconds.
+            rate_limit: Optional maximum number of requests per second. Requests
+                are paced before they are sent instead of waiting for a 429.
+            rate_limit_burst: Number of requests allowed back to back when the
+                limiter is idle. Defaults to ``rate_limit``.
+            rate_limiter: Optional limiter to share with other clients. Takes
+                precedence over ``rate_limit``.
+            retry_policy: Optional retry policy. Defaults to exponential backoff
+                with jitter built from ``max_retries`` and ``retry_delay``.
+            pool_config: Optional connection pool settings. Size the pool to the
+                number of threads sharing the client. Ignored when ``transport``
+                is given.
+            cache: Optional cache for GET responses of reference-data endpoints.
+                Can be shared with other clients.
+            coalesce: Whether concurrent identical GET requests from several
+                threads share one HTTP request.
+            json_codec: Optional JSON codec, or the name of a built-in one
+                (``"json"`` or ``"orjson"``). Defaults to orjson when installed.
+            validation: How responses are turned into response models: ``"full"``
+                validates every response, ``"sampled"`` validates one in every
+                ``validation_sample_rate`` responses and logs schema drift, and
+                ``"trusted"`` builds models without validation.
+            validation_sample_rate: How often responses are validated in
+                ``"sampled"`` mode.
+            transport: Optional transport that sends the requests. Defaults to a
+                ``RequestsTransport``; use ``HttpxTransport`` for HTTP/2.
+            session_per_thread: Whether the default transport gives every thread
+                its own ``requests.Session`` over one shared connection pool.
+                Enable it when threads share the client. Ignored when
+                ``transport`` is given.
+            hooks: Optional callables that receive a ``RequestEvent`` with the
+                outcome and phase timings of every attempt, in the thread that
+                sent it. More can be appended to ``hooks`` later.
+            metrics: Optional registry that records the count, latency and size
+                of the requests per endpoint. Can be shared with other clients.
         """
         self.api_key = api_key
         self.base_url = base_url
@@ -80,40 +196,36 @@ class HoldedClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.api_version = api_version
-        self.session = requests.Session()
-        self.session.headers.update(
+        if rate_limiter is None and rate_limit is not None:
+            rate_limiter = RateLimiter(rate_limit, rate_limit_burst)
+        self.rate_limiter = rate_limiter
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_attempts=max_retries, base_delay=retry_delay)
+        self.retry_policy = retry_policy
+        self.pool_config = pool_config or PoolConfig()
+        self.cache = cache
+        self.json_codec = resolve_codec(json_codec)
+        self.validator = ResponseValidator(validation, validation_sample_rate)
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.hooks: List[RequestHook] = list(hooks or ())
+        self.metrics = metrics
+        if metrics is not None:
+            self.hooks.append(metrics)
+        self.transport = transport or RequestsTransport(self.pool_config, session_per_thread=session_per_thread)
+        self.transport.headers.update(
             {
                 "Accept": "application/json",
                 "Content-Type": "application/json",
                 "Key": self.api_key,
             }
         )
+        # Forked children drop the connections they inherit from this process
+        fork.register(self)
 
-        # Initialize resources
-        self.contacts = ContactsResource(self)
-        self.documents = DocumentsResource(self)
-        self.products = ProductsResource(self)
-        self.warehouse = WarehouseResource(self)
-        self.treasury = TreasuryResource(self)
-        self.sales_channels = SalesChannelsResource(self)
-        self.numbering_series = NumberingSeriesResource(self)
-        self.expense_accounts = ExpenseAccountsResource(self)
-        self.remittances = RemittancesResource(self)
-        self.payments = PaymentsResource(self)
-        self.taxes = TaxesResource(self)
-        self.contact_groups = ContactGroupsResource(self)
-        self.services = ServicesResource(self)
-        self.funnels = FunnelsResource(self)
-        self.leads = LeadsResource(self)
-        self.events = EventsResource(self)
-        self.bookings = BookingsResource(self)
-        self.projects = ProjectsResource(self)
-        self.tasks = TasksResource(self)
-        self.time_tracking = TimeTrackingResource(self)
-        self.employees = EmployeesResource(self)
-        self.employee_time_tracking = EmployeeTimeTrackingResource(self)
-        self.daily_ledger = DailyLedgerResource(self)
-        self.chart_of_accounts = ChartOfAccountsResource(self)
+    @property
+    def session(self) -> Any:
+        """The session of the transport used by the calling thread, if it has one."""
+        return getattr(self.transport, "session", None)
 
     def _build_url(self, path: str) -> str:
         """Build the URL for the API request.
@@ -147,34 +259,102 @@ class HoldedClient:
         return data
 
     def _deserialize_response(
-        self, response: requests.Response, response_model: Optional[Type[T]] = None
+        self,
+        response: TransportResponse,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        event: Optional[RequestEvent] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Deserialize a response.
 
         Args:
             response: The response to deserialize.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+            event: Optional event that records the decode and validation times.
 
         Returns:
             The deserialized response.
         """
+        start = time.perf_counter()
         try:
-            data = response.json()
+            data = self.json_codec.loads(response.content)
         except ValueError:
             data = {"message": response.text}
+        if event is not None:
+            event.decode = time.perf_counter() - start
 
-        if response_model is not None:
-            return response_model.model_validate(data)
-        return data
+        return self._validate_response(data, response_model, validation, event)
+
+    def _validate_response(
+        self,
+        data: Any,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        event: Optional[RequestEvent] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
+        """Validate decoded response data.
+
+        Args:
+            data: The decoded response data.
+            response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+            event: Optional event that records the validation time.
+
+        Returns:
+            The model instance, or the data itself if no model is given.
+        """
+        if response_model is None:
+            return data
+        if event is None:
+            return self.validator.validate(response_model, data, validation)
+        start = time.perf_counter()
+        try:
+            return self.validator.validate(response_model, data, validation)
+        finally:
+            event.validation = time.perf_counter() - start
+
+    def _validate_fetched(
+        self,
+        data: Any,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
+        """Validate data served outside ``_send``, raising the same errors as ``_send``.
+
+        Args:
+            data: The decoded response data.
+            response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+
+        Returns:
+            The model instance, or the data itself if no model is given.
+
+        Raises:
+            HoldedError: If the data does not validate.
+        """
+        try:
+            return self._validate_response(data, response_model, validation)
+        except HoldedError:
+            raise
+        except Exception as e:
+            raise HoldedError(message=f"Unexpected error: {str(e)}") from e
 
     def _handle_response(
-        self, response: requests.Response, response_model: Optional[Type[T]] = None
+        self,
+        response: TransportResponse,
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        event: Optional[RequestEvent] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Handle a response from the API.
 
         Args:
             response: The response to handle.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+            event: Optional event that records the size, decode and validation
+                time of the response.
 
         Returns:
             The response data.
@@ -187,13 +367,14 @@ class HoldedClient:
             HoldedServerError: If the server returns an error.
             HoldedAPIError: For other API errors.
         """
-        try:
-            response.raise_for_status()
-            return self._deserialize_response(response, response_model)
-        except requests.exceptions.HTTPError:
+        if event is not None:
+            event.bytes_received = len(response.content)
+        if response.status_code < 400:
+            return self._deserialize_response(response, response_model, validation, event)
+        else:
             error_data = {}
             try:
-                error_data = response.json()
+                error_data = self.json_codec.loads(response.content)
             except ValueError:
                 error_data = {"message": response.text}
 
@@ -203,36 +384,42 @@ class HoldedClient:
                     message="Authentication failed. Check your API key.",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
             elif status_code == 404:
                 raise HoldedNotFoundError(
                     message="Resource not found.",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
             elif status_code == 422:
                 raise HoldedValidationError(
                     message="Validation error.",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
             elif status_code == 429:
                 raise HoldedRateLimitError(
                     message="Rate limit exceeded.",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
             elif status_code >= 500:
                 raise HoldedServerError(
                     message="Server error.",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
             else:
                 raise HoldedAPIError(
                     message=f"API error: {response.text}",
                     status_code=status_code,
                     error_data=error_data,
+                    headers=response.headers,
                 )
 
     def _request(
@@ -242,6 +429,7 @@ class HoldedClient:
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Make a request to the API.
 
@@ -251,6 +439,7 @@ class HoldedClient:
             params: Optional query parameters.
             data: Optional request data.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
 
         Returns:
             The response data.
@@ -268,45 +457,145 @@ class HoldedClient:
 
         if data is not None:
             data = self._serialize_data(data)
-            data_str = json.dumps(data)
+            body = self.json_codec.dumps(data)
         else:
-            data_str = None
+            body = None
+
+        endpoint = endpoint_template(path)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(method, path, params, account_scope(self.api_key, self.base_url))
+        if cache_key is not None:
+            found, cached = self.cache.lookup(cache_key)
+            if not found:
+                cached = self._fetch(method, url, params, body, endpoint)
+                self.cache.store(cache_key, cached)
+            return self._validate_fetched(cached, response_model, validation)
+
+        if self.coalescer is not None and method.upper() in COALESCE_METHODS:
+            data = self._fetch(method, url, params, body, endpoint)
+            return self._validate_fetched(data, response_model, validation)
+
+        result = self._send(method, url, params, body, response_model, validation, endpoint=endpoint)
+        if self.cache is not None and method.upper() != "GET":
+            self.cache.invalidate_resource(path)
+        return result
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        endpoint: str = "",
+    ) -> Any:
+        """Send a request and return the decoded data, sharing identical requests in flight.
 
-        for attempt in range(self.max_retries):
+        Args:
+            method: The HTTP method to use.
+            url: The full URL.
+            params: Optional query parameters.
+            body: Optional encoded request body.
+            endpoint: The endpoint template, for the request events.
+
+        Returns:
+            The decoded response data.
+        """
+        if self.coalescer is None or method.upper() not in COALESCE_METHODS:
+            return self._send(method, url, params, body, endpoint=endpoint)
+        key = coalesce_key(method, url, params)
+        return self.coalescer.run(key, lambda: self._send(method, url, params, body, endpoint=endpoint))
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[bytes],
+        response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
+        stream: bool = False,
+        endpoint: str = "",
+    ) -> Any:
+        """Send a request, pacing and retrying it as configured.
+
+        Args:
+            method: The HTTP method to use.
+            url: The full URL.
+            params: Optional query parameters.
+            body: Optional encoded request body.
+            response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
+            stream: Whether to return the successful response with its body
+                unread instead of the response data.
+            endpoint: The endpoint template, for the request events.
+
+        Returns:
+            The response data, or the response itself when streaming.
+        """
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            event = RequestEvent(method, url, endpoint, attempt, len(body) if body else 0) if self.hooks else None
+            started = time.perf_counter()
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if event is not None:
+                    event.rate_limit_wait = waited
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
+                response = self.transport.request(
+                    method,
+                    url,
                     params=params,
-                    data=data_str,
+                    content=body,
                     timeout=self.timeout,
+                    stream=stream,
                 )
-                return self._handle_response(response, response_model)
-            except (
-                requests.exceptions.ConnectionError,
-                requests.exceptions.SSLError,
-            ) as e:
-                if attempt == self.max_retries - 1:
-                    raise HoldedConnectionError(message=f"Connection error: {str(e)}") from e
-                time.sleep(self.retry_delay)
-            except requests.exceptions.Timeout as e:
-                if attempt == self.max_retries - 1:
-                    raise HoldedTimeoutError(message=f"Request timed out: {str(e)}") from e
-                time.sleep(self.retry_delay)
-            except (HoldedRateLimitError, HoldedServerError):
-                if attempt == self.max_retries - 1:
-                    raise
-                time.sleep(self.retry_delay * (attempt + 1))
+                if event is not None:
+                    event.record_response(response.status_code, response.timings)
+                if stream and response.status_code < 400:
+                    result = response
+                else:
+                    result = self._handle_response(response, response_model, validation, event)
+            except HoldedError as e:
+                error = e
             except Exception as e:
-                if isinstance(e, HoldedError):
-                    raise
+                if event is not None:
+                    event.error = e
+                    self._emit_event(event, started)
                 raise HoldedError(message=f"Unexpected error: {str(e)}") from e
+            else:
+                if event is not None:
+                    self._emit_event(event, started)
+                return result
+
+            delay = self.retry_policy.get_retry_delay(method, error, attempt)
+            if event is not None:
+                event.error = error
+                event.retry_delay = delay
+                self._emit_event(event, started)
+            if delay is None:
+                raise error
+            logger.warning(f"Request failed with {error.__class__.__name__}. Retrying in {delay:.2f} seconds...")
+            time.sleep(delay)
+            attempt += 1
+
+    def _emit_event(self, event: RequestEvent, started: float) -> None:
+        """Complete the event of an attempt and send it to the hooks.
+
+        Args:
+            event: The event.
+            started: When the attempt started, from ``time.perf_counter()``.
+        """
+        event.total = time.perf_counter() - started
+        emit(self.hooks, event)
 
     def get(
         self,
         path: str,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Make a GET request.
 
@@ -314,11 +603,14 @@ class HoldedClient:
             path: The API endpoint path.
             params: Optional query parameters.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
 
         Returns:
             The response data.
         """
-        return self._request("GET", path, params=params, response_model=response_model)
+        return self._request(
+            "GET", path, params=params, response_model=response_model, validation=validation
+        )
 
     def post(
         self,
@@ -326,6 +618,7 @@ class HoldedClient:
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Make a POST request.
 
@@ -334,11 +627,14 @@ class HoldedClient:
             data: The request data.
             params: Optional query parameters.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
 
         Returns:
             The response data.
         """
-        return self._request("POST", path, params=params, data=data, response_model=response_model)
+        return self._request(
+            "POST", path, params=params, data=data, response_model=response_model, validation=validation
+        )
 
     def put(
         self,
@@ -346,6 +642,7 @@ class HoldedClient:
         data: Optional[Union[Dict[str, Any], BaseModel]] = None,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Make a PUT request.
 
@@ -354,17 +651,21 @@ class HoldedClient:
             data: The request data.
             params: Optional query parameters.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
 
         Returns:
             The response data.
         """
-        return self._request("PUT", path, params=params, data=data, response_model=response_model)
+        return self._request(
+            "PUT", path, params=params, data=data, response_model=response_model, validation=validation
+        )
 
     def delete(
         self,
         path: str,
         params: Optional[Union[Dict[str, Any], BaseModel]] = None,
         response_model: Optional[Type[T]] = None,
+        validation: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], T]:
         """Make a DELETE request.
 
@@ -372,12 +673,143 @@ class HoldedClient:
             path: The API endpoint path.
             params: Optional query parameters.
             response_model: Optional Pydantic model to deserialize to.
+            validation: Optional validation mode for the response model.
 
         Returns:
             The response data.
         """
-        return self._request("DELETE", path, params=params, response_model=response_model)
+        return self._request(
+            "DELETE", path, params=params, response_model=response_model, validation=validation
+        )
+
+    def stream_list(
+        self,
+        path: str,
+        params: Optional[Union[Dict[str, Any], BaseModel]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Make a GET request and yield the items of the JSON array it returns.
+
+        Items are decoded while the body downloads, so memory use stays around
+        one item however long the list is. The request is sent when iteration
+        starts and is retried like any other request until the body starts to
+        arrive; errors after that are raised. Streamed responses are neither
+        cached nor shared with identical requests.
+
+        Args:
+            path: The API endpoint path.
+            params: Optional query parameters.
+            chunk_size: Number of bytes read from the connection at a time.
+
+        Yields:
+            The items of the list.
+
+        Raises:
+            HoldedAPIError: If the body is not valid JSON.
+        """
+        url = self._build_url(path)
+        if params is not None and isinstance(params, BaseModel):
+            params = params.model_dump(exclude_none=True)
+
+        response = self._send("GET", url, params, None, stream=True, endpoint=endpoint_template(path))
+        parser = JSONArrayParser(self.json_codec)
+        try:
+            for chunk in response.iter_content(chunk_size):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        except ValueError as e:
+            raise HoldedAPIError(
+                message=f"Failed to parse response: {str(e)}", status_code=response.status_code
+            ) from e
+        finally:
+            response.close()
+
+    def executor(
+        self, max_workers: int = DEFAULT_CONCURRENCY, rate_limit: Optional[float] = None
+    ) -> ClientExecutor:
+        """Create a thread pool that runs the calls of this client.
+
+        The executor has the same resources as the client, but their methods
+        return futures. The connection pool is grown to ``max_workers``.
+
+        Args:
+            max_workers: Number of worker threads.
+            rate_limit: Optional maximum number of calls started per second, on
+                top of the client's own rate limiter.
+
+        Returns:
+            The executor. Shut it down, or use it as a context manager.
+        """
+        return ClientExecutor(self, max_workers=max_workers, rate_limit=rate_limit)
+
+    def to_config(self) -> ClientConfig:
+        """Get the settings of this client as a picklable config.
+
+        Returns:
+            The config. The rate limiter, cache and transport are not part of it.
+        """
+        limiter = self.rate_limiter
+        return ClientConfig(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            api_version=self.api_version,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            rate_limit=limiter.rate if limiter is not None else None,
+            rate_limit_burst=limiter.burst if limiter is not None else None,
+            retry_policy=self.retry_policy,
+            pool_config=self.pool_config,
+            coalesce=self.coalescer is not None,
+            json_codec=self.json_codec,
+            validation=self.validator.mode,
+            validation_sample_rate=self.validator.sample_rate,
+            session_per_thread=getattr(self.transport, "session_per_thread", False),
+        )
+
+    @classmethod
+    def from_config(cls, config: ClientConfig) -> "HoldedClient":
+        """Create a client from a config.
+
+        Args:
+            config: The config, such as one returned by ``to_config``.
+
+        Returns:
+            A new client.
+        """
+        return cls(**config.to_kwargs())
+
+    def __reduce__(self) -> Any:
+        # Pickled as its config only; see ClientConfig
+        return (type(self).from_config, (self.to_config(),))
+
+    def __copy__(self) -> "HoldedClient":
+        # A copy through __reduce__ would silently drop the cache, hooks, metrics and shared rate limiter
+        raise TypeError(
+            f"{type(self).__name__} cannot be copied; use from_config(client.to_config()) and pass "
+            "the cache, hooks and metrics again"
+        )
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "HoldedClient":
+        return self.__copy__()
+
+    def _after_fork(self) -> None:
+        """Drop the connections, locks and in-flight requests inherited from the parent process."""
+        budget = getattr(self.retry_policy, "budget", None)
+        fork.reset_locks(self.rate_limiter, budget, self.cache, self.validator)
+        if self.coalescer is not None:
+            self.coalescer = RequestCoalescer()
+        self.transport.reset_after_fork()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get the usage of the connection pool.
+
+        Returns:
+            A dictionary with the pool size, connections in use, idle connections,
+            the saturation (in use divided by size) and the same figures per host.
+        """
+        return self.transport.pool_stats()
 
     def close(self) -> None:
-        """Close the client session."""
-        self.session.close()
+        """Close the client sessions and their connection pool."""
+        self.transport.close()
@@ -0,0 +1,156 @@
+"""
+Coalescing of concurrent identical requests.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Methods whose concurrent identical requests can share one response
+COALESCE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def coalesce_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> Hashable:
+    """Build the key that identifies identical requests.
+
+    Args:
+        method: The HTTP method.
+        url: The full URL.
+        params: The query parameters.
+
+    Returns:
+        The key.
+    """
+    return (method.upper(), url, json.dumps(params or {}, sort_keys=True, default=str))
+
+
+class _Call:
+    """A request in flight and the callers waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Share one request between threads that send the same request at once.
+
+    The first thread to send a request runs it; threads that send an identical
+    request while it is in flight wait for it and get a copy of its response or
+    its error. Nothing is kept once the request finishes, so responses are never
+    stale.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._coalesced = 0
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run a request, or wait for an identical request in flight.
+
+        Args:
+            key: The key returned by ``coalesce_key``.
+            fn: Function that sends the request.
+
+        Returns:
+            The response. Callers that shared a request each get their own copy.
+        """
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # The waiters copy the stored response, so the leader must not share it
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Get usage statistics.
+
+        Returns:
+            A dictionary with the number of requests, the number of requests that
+            shared another request's response, and the requests in flight.
+        """
+        with self._lock:
+            return {"requests": self._requests, "coalesced": self._coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncRequestCoalescer:
+    """Share one request between tasks that send the same request at once.
+
+    The request runs in its own task, so cancelling one of the callers does not
+    cancel it for the others. Must be used from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._calls: Dict[Hashable, List[Any]] = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run a request, or wait for an identical request in flight.
+
+        Args:
+            key: The key returned by ``coalesce_key``.
+            factory: Coroutine function that sends the request.
+
+        Returns:
+            The response. Callers that shared a request each get their own copy.
+        """
+        self._requests += 1
+        call = self._calls.get(key)
+        if call is not None:
+            self._coalesced += 1
+            call[1] += 1
+        else:
+            task = asyncio.ensure_future(factory())
+            call = self._calls[key] = [task, 0]
+            task.add_done_callback(lambda _: self._forget(key, task))
+
+        result = await asyncio.shield(call[0])
+        return copy.deepcopy(result) if call[1] else result
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        """Remove a finished request."""
+        call = self._calls.get(key)
+        if call is not None and call[0] is task:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get usage statistics.
+
+        Returns:
+            A dictionary with the number of requests, the number of requests that
+            shared another request's response, and the requests in flight.
+        """
+        return {"requests": self._requests, "coalesced": self._coalesced, "in_flight": len(self._calls)}
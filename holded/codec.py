@@ -0,0 +1,103 @@
+"""
+JSON codecs used by the Holded clients to encode request bodies and decode responses.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JSONCodec:
+    """JSON codec backed by the standard library.
+
+    Subclass it to plug in another JSON library: ``dumps`` must return UTF-8
+    bytes and ``loads`` must accept bytes and raise ``ValueError`` for invalid
+    documents.
+    """
+
+    name = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode data as JSON.
+
+        Args:
+            data: The data to encode.
+
+        Returns:
+            The UTF-8 encoded document.
+        """
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            content: The document, usually the raw response body.
+
+        Returns:
+            The decoded data.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        return json.loads(content)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``, which encodes to and decodes from bytes natively."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires orjson. Install it with: pip install "holded-python[speedups]"')
+
+    def dumps(self, data: Any) -> bytes:
+        """Encode data as JSON."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(content)
+
+
+def default_codec() -> JSONCodec:
+    """Get the fastest codec available.
+
+    Returns:
+        An ``OrjsonCodec`` if orjson is installed, otherwise a ``JSONCodec``.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+def resolve_codec(codec: Optional[Union[str, JSONCodec]]) -> JSONCodec:
+    """Turn the ``json_codec`` argument of a client into a codec.
+
+    Args:
+        codec: A codec, the name of a built-in codec (``"json"`` or ``"orjson"``),
+            or None for the fastest codec available.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == JSONCodec.name:
+        return JSONCodec()
+    if codec == OrjsonCodec.name:
+        return OrjsonCodec()
+    raise ValueError(f"Unknown JSON codec: {codec}")
@@ -0,0 +1,118 @@
+"""
+Picklable client configuration.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from .codec import JSONCodec
+from .pooling import PoolConfig
+from .retry import RetryPolicy
+from .validation import FULL
+
+if TYPE_CHECKING:
+    from .async_client import AsyncHoldedClient
+    from .client import HoldedClient
+
+
+class ClientConfig:
+    """The settings of a client, without its connections or shared state.
+
+    A config can be pickled, so it can be sent to the workers of a process
+    pool, which rebuild their clients from it cheaply. Rate limiters, caches,
+    custom transports and request hooks are not part of it, as they cannot be
+    shared between processes: every client built from a config gets its own
+    rate limiter, the default transport and no hooks.
+
+    Both clients build their config with ``to_config()`` and are pickled as
+    their config, so a client passed to a process pool arrives as a new client
+    with the same settings.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.holded.com/api/",
+        api_version: str = "v1",
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: int = 1,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_config: Optional[PoolConfig] = None,
+        coalesce: bool = False,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        validation: str = FULL,
+        validation_sample_rate: int = 100,
+        session_per_thread: bool = False,
+    ):
+        """Initialize the config.
+
+        Args:
+            api_key: Your Holded API key.
+            base_url: The base URL for the Holded API.
+            api_version: The API version to use.
+            timeout: Request timeout in seconds.
+            max_retries: Maximum number of attempts for failed requests.
+            retry_delay: Base delay between retries in seconds.
+            rate_limit: Optional maximum number of requests per second, per client.
+            rate_limit_burst: Number of requests allowed back to back when the
+                limiter is idle.
+            retry_policy: Optional retry policy. Pickling the config copies its
+                retry budget.
+            pool_config: Optional connection pool settings.
+            coalesce: Whether concurrent identical GET requests share one request.
+            json_codec: Optional JSON codec, or the name of a built-in one.
+            validation: The validation mode for response models.
+            validation_sample_rate: How often responses are validated in
+                ``"sampled"`` mode.
+            session_per_thread: Whether the synchronous client gives every thread
+                its own session. Ignored by the asynchronous client.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.api_version = api_version
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.retry_policy = retry_policy
+        self.pool_config = pool_config
+        self.coalesce = coalesce
+        self.json_codec = json_codec
+        self.validation = validation
+        self.validation_sample_rate = validation_sample_rate
+        self.session_per_thread = session_per_thread
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """Get the keyword arguments of ``HoldedClient`` for this config.
+
+        Returns:
+            A dictionary of keyword arguments.
+        """
+        return dict(vars(self))
+
+    def client(self) -> "HoldedClient":
+        """Create a synchronous client with these settings.
+
+        Returns:
+            A new client.
+        """
+        from .client import HoldedClient
+
+        return HoldedClient.from_config(self)
+
+    def async_client(self) -> "AsyncHoldedClient":
+        """Create an asynchronous client with these settings.
+
+        Returns:
+            A new client.
+        """
+        from .async_client import AsyncHoldedClient
+
+        return AsyncHoldedClient.from_config(self)
+
+    def __repr__(self) -> str:
+        settings = ", ".join(f"{name}={value!r}" for name, value in vars(self).items() if name != "api_key")
+        return f"ClientConfig(api_key='***', {settings})"
@@ -2,23 +2,31 @@
 Exceptions for the Holded API.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 class HoldedError(Exception):
     """Base exception for all Holded API errors."""
 
-    def __init__(self, message: str, status_code: Optional[int] = None, error_data: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        error_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
         """Initialize the exception.
 
         Args:
             message: The error message.
             status_code: The HTTP status code.
             error_data: Additional error data from the API.
+            headers: The response headers, if a response was received.
         """
         self.message = message
         self.status_code = status_code
         self.error_data = error_data or {}
+        self.headers = headers if headers is not None else {}
         super().__init__(self.message)
 
 
@@ -0,0 +1,181 @@
+"""
+Thread-pool execution of synchronous client calls.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from .batch import DEFAULT_CONCURRENCY
+from .lazy import LazyResource
+from .rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from .client import HoldedClient
+
+T = TypeVar("T")
+
+
+class _FutureResource:
+    """A resource whose methods run on the executor and return futures."""
+
+    def __init__(self, executor: "ClientExecutor", resource: Any):
+        self._executor = executor
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._resource, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        def submit(*args: Any, **kwargs: Any) -> "Future[Any]":
+            return self._executor.submit(attribute, *args, **kwargs)
+
+        submit.__name__ = name
+        submit.__doc__ = attribute.__doc__
+        return submit
+
+    def __repr__(self) -> str:
+        return f"<{self._resource.__class__.__name__} on {self._executor!r}>"
+
+
+class ClientExecutor:
+    """Run the calls of a ``HoldedClient`` on a thread pool.
+
+    The executor exposes the same resources as the client, but their methods
+    return ``concurrent.futures.Future`` objects instead of results. Calls
+    share the client's connection pool, retries, cache and rate limiter, and
+    can be capped to a number of calls started per second.
+
+    Use it as a context manager, or call ``shutdown`` when done::
+
+        with client.executor(max_workers=16) as executor:
+            futures = [executor.contacts.get(contact_id) for contact_id in ids]
+            for future in executor.as_completed(futures):
+                print(future.result())
+    """
+
+    def __init__(
+        self,
+        client: "HoldedClient",
+        max_workers: int = DEFAULT_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            client: The client whose calls are run.
+            max_workers: Number of worker threads. The client's connection pool
+                is grown to this size so that no worker waits for a connection.
+            rate_limit: Optional maximum number of calls started per second.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.client = client
+        self.max_workers = max_workers
+        self._limiter = RateLimiter(rate_limit, burst=1) if rate_limit is not None else None
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="holded")
+        client.transport.ensure_pool_size(max_workers)
+
+    def __getattr__(self, name: str) -> Any:
+        if isinstance(getattr(type(self.client), name, None), LazyResource):
+            resource = _FutureResource(self, getattr(self.client, name))
+            # Cache the proxy so later lookups do not go through __getattr__
+            setattr(self, name, resource)
+            return resource
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return f"ClientExecutor(max_workers={self.max_workers})"
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Run a function on the pool, after the rate cap allows it.
+
+        Args:
+            fn: The function, usually a client or resource method.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            A future for the result.
+        """
+        limiter = self._limiter
+        if limiter is None:
+            return self._pool.submit(fn, *args, **kwargs)
+
+        def call() -> T:
+            limiter.acquire()
+            return fn(*args, **kwargs)
+
+        return self._pool.submit(call)
+
+    def get(self, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Make a GET request on the pool; see ``HoldedClient.get``."""
+        return self.submit(self.client.get, *args, **kwargs)
+
+    def post(self, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Make a POST request on the pool; see ``HoldedClient.post``."""
+        return self.submit(self.client.post, *args, **kwargs)
+
+    def put(self, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Make a PUT request on the pool; see ``HoldedClient.put``."""
+        return self.submit(self.client.put, *args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Make a DELETE request on the pool; see ``HoldedClient.delete``."""
+        return self.submit(self.client.delete, *args, **kwargs)
+
+    def map(self, fn: Callable[..., T], *iterables: Iterable[Any]) -> Iterator[T]:
+        """Call a function for every input on the pool.
+
+        All calls are submitted at once, like ``ThreadPoolExecutor.map``.
+
+        Args:
+            fn: The function, such as ``client.contacts.get``.
+            *iterables: The arguments, one iterable per positional parameter.
+
+        Returns:
+            An iterator over the results, in input order. It raises the error of
+            the first failed call when it reaches that call.
+        """
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results() -> Iterator[T]:
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return results()
+
+    def as_completed(
+        self, futures: Iterable["Future[T]"], timeout: Optional[float] = None
+    ) -> Iterator["Future[T]"]:
+        """Iterate over futures as they finish.
+
+        Args:
+            futures: Futures returned by this executor.
+            timeout: Optional maximum number of seconds to wait overall.
+
+        Returns:
+            An iterator that yields each future once it is done.
+        """
+        return as_completed(futures, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads. The client stays open.
+
+        Args:
+            wait: Whether to wait for the calls submitted so far.
+        """
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ClientExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
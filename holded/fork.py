@@ -0,0 +1,73 @@
+"""
+Fork safety for clients created before the process forks.
+
+Pre-fork servers such as gunicorn and uwsgi create objects in a master process
+and fork workers from it. Without care, every worker would share the pooled
+sockets of the master and interleave requests on the same connections. Clients
+register here, and in every forked child they drop the connections they
+inherited and replace locks that another thread of the parent may have held.
+"""
+
+import logging
+import os
+import threading
+import weakref
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+_registered: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# Objects tied to the event loop of the parent; see ``keep_inherited``
+_inherited: List[Any] = []
+
+
+def register(obj: Any) -> None:
+    """Call ``obj._after_fork()`` in the child of every later fork.
+
+    Only a weak reference is kept, so registering does not keep the object alive.
+
+    Args:
+        obj: The object, usually a client.
+    """
+    _registered.add(obj)
+
+
+def reset_locks(*objects: Any) -> None:
+    """Give objects a fresh ``_lock``.
+
+    A lock held by another thread when the process forked stays locked forever
+    in the child, where that thread does not exist.
+
+    Args:
+        *objects: The objects. None and objects without a lock are skipped.
+    """
+    for obj in objects:
+        if obj is not None and hasattr(obj, "_lock"):
+            obj._lock = threading.Lock()
+
+
+def keep_inherited(obj: Any) -> None:
+    """Keep an object inherited from the parent alive for the life of the child.
+
+    Closing or collecting an async session in the child would unregister its
+    sockets from the event loop selector it shares with the parent, and a TLS
+    shutdown would corrupt the parent's connections. Keeping the session
+    referenced leaves them alone.
+
+    Args:
+        obj: The object, such as an abandoned ``aiohttp.ClientSession``.
+    """
+    _inherited.append(obj)
+
+
+def _after_fork_in_child() -> None:
+    """Reset every registered object in a newly forked child."""
+    for obj in list(_registered):
+        try:
+            obj._after_fork()
+        except Exception:
+            logger.exception("Failed to reset %r after fork", obj)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
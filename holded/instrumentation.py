@@ -0,0 +1,243 @@
+"""
+Per-request instrumentation.
+
+Both clients accept ``hooks``: callables that receive a ``RequestEvent`` after
+every attempt of every request, with the endpoint, the outcome, the bytes sent
+and received, and how long each phase took. The network phases are measured
+by the transport and the others by the client.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sub-paths that name an action or a sub-resource rather than a record
+ENDPOINT_ACTIONS = frozenset(
+    {
+        "attach",
+        "attachments",
+        "categories",
+        "clock-in",
+        "clock-out",
+        "dates",
+        "groups",
+        "image",
+        "images",
+        "locations",
+        "notes",
+        "pause",
+        "pay",
+        "pdf",
+        "pipeline",
+        "send",
+        "shipall",
+        "shipline",
+        "shipped",
+        "slots",
+        "stages",
+        "stock",
+        "summary",
+        "tasks",
+        "times",
+        "tracking",
+        "unpause",
+    }
+)
+# Endpoints whose first sub-path is a document type
+DOCUMENT_TYPE_ENDPOINTS = frozenset({"invoicing/documents", "invoicing/numberingseries"})
+
+# Phases reported by the transports, in seconds
+TRANSPORT_PHASES = ("pool_wait", "connect", "tls", "ttfb", "download")
+
+
+def endpoint_template(path: str) -> str:
+    """Turn an API path into the endpoint it calls, without record IDs.
+
+    Record IDs become ``{id}`` and document types ``{docType}``, so that all
+    requests to the same endpoint share one template::
+
+        endpoint_template("invoicing/documents/invoice/5f1a/pay")
+        # "invoicing/documents/{docType}/{id}/pay"
+
+    Args:
+        path: The API path, as passed to the client.
+
+    Returns:
+        The endpoint template.
+    """
+    segments = path.strip("/").split("/")
+    template = segments[:2]
+    document_types = "/".join(template) in DOCUMENT_TYPE_ENDPOINTS
+    for index, segment in enumerate(segments[2:]):
+        if index == 0 and document_types:
+            template.append("{docType}")
+        elif segment in ENDPOINT_ACTIONS:
+            template.append(segment)
+        else:
+            template.append("{id}")
+    return "/".join(template)
+
+
+class RequestEvent:
+    """What happened during one attempt of a request.
+
+    Durations are in seconds, and None when the phase did not happen or was
+    not measured: ``connect`` and ``tls`` are only set when the attempt opened
+    a new connection, and transports measure different phases (``aiohttp``
+    includes the TLS handshake in ``connect``). ``ttfb`` runs from sending the
+    request on an open connection to receiving the response headers, so it is
+    mostly time spent by the server.
+
+    For streamed lists the event is sent once the response headers arrive, so
+    ``download``, ``decode`` and ``bytes_received`` are not set. Responses
+    served from the cache send no event, and the validation of coalesced and
+    cached responses is not included.
+
+    Attributes:
+        method: The HTTP method.
+        url: The full URL.
+        endpoint: The endpoint template, such as ``"invoicing/contacts/{id}"``.
+        attempt: The attempt number, starting at 0; it equals the number of retries before it.
+        status: The HTTP status, or None if no response was received.
+        error: The error raised by the attempt, or None if it succeeded.
+        retry_delay: Seconds until the next attempt, or None if there is none.
+        bytes_sent: Size of the request body.
+        bytes_received: Size of the response body.
+        rate_limit_wait: Time spent waiting for the client-side rate limiter.
+        pool_wait: Time spent waiting for a free connection.
+        connect: Time spent opening the connection.
+        tls: Time spent on the TLS handshake.
+        ttfb: Time from sending the request to receiving the response headers.
+        download: Time spent receiving the response body.
+        decode: Time spent decoding the JSON body.
+        validation: Time spent building the response model.
+        total: Duration of the whole attempt, including the rate limit wait.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "attempt",
+        "status",
+        "error",
+        "retry_delay",
+        "bytes_sent",
+        "bytes_received",
+        "rate_limit_wait",
+        "pool_wait",
+        "connect",
+        "tls",
+        "ttfb",
+        "download",
+        "decode",
+        "validation",
+        "total",
+    )
+
+    def __init__(self, method: str, url: str, endpoint: str, attempt: int = 0, bytes_sent: int = 0):
+        """Initialize the event.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            endpoint: The endpoint template.
+            attempt: The attempt number, starting at 0.
+            bytes_sent: Size of the request body.
+        """
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.bytes_sent = bytes_sent
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None
+        self.bytes_received: Optional[int] = None
+        self.rate_limit_wait: Optional[float] = None
+        self.pool_wait: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.tls: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.validation: Optional[float] = None
+        self.total: Optional[float] = None
+
+    def record_response(self, status: int, timings: Mapping[str, float]) -> None:
+        """Record the status and the network phases measured by the transport.
+
+        Args:
+            status: The HTTP status.
+            timings: The ``timings`` of the transport response.
+        """
+        self.status = status
+        for phase in TRANSPORT_PHASES:
+            if phase in timings:
+                setattr(self, phase, timings[phase])
+
+    @property
+    def status_class(self) -> str:
+        """The status class, such as ``"2xx"``, or ``"error"`` if no response was received."""
+        if self.status is None:
+            return "error"
+        return f"{self.status // 100}xx"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the event as a dictionary, with the error as its class name.
+
+        Returns:
+            A dictionary that can be serialized as JSON.
+        """
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["error"] = type(self.error).__name__ if self.error is not None else None
+        return data
+
+    def __repr__(self) -> str:
+        total = f"{self.total * 1000:.1f}ms" if self.total is not None else "-"
+        return f"<RequestEvent {self.method} {self.endpoint} attempt={self.attempt} status={self.status} {total}>"
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+def emit(hooks: Iterable[RequestHook], event: RequestEvent) -> None:
+    """Send an event to every hook.
+
+    A failing hook is logged and does not affect the request or the other hooks.
+
+    Args:
+        hooks: The hooks of the client.
+        event: The event.
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Request hook %r failed", hook)
+
+
+def log_request(event: RequestEvent) -> None:
+    """Hook that logs every attempt at DEBUG level on the ``holded.instrumentation`` logger.
+
+    Args:
+        event: The event.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    phases: List[str] = []
+    for name in ("rate_limit_wait", "pool_wait", "connect", "tls", "ttfb", "download", "decode", "validation"):
+        value = getattr(event, name)
+        if value is not None:
+            phases.append(f"{name}={value * 1000:.1f}ms")
+    outcome = event.status if event.status is not None else type(event.error).__name__
+    logger.debug(
+        "%s %s attempt=%d -> %s in %.1fms (%s)",
+        event.method,
+        event.endpoint,
+        event.attempt,
+        outcome,
+        (event.total or 0.0) * 1000,
+        ", ".join(phases),
+    )
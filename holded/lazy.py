@@ -0,0 +1,106 @@
+"""
+Lazy loading of submodules and resources.
+
+Importing ``holded`` only loads what a program uses: packages resolve their
+exports on first access through a module ``__getattr__``, and clients create
+each resource the first time it is accessed.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    attributes: Optional[Mapping[str, str]] = None,
+    exports: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the ``__getattr__`` and ``__dir__`` of a package that loads its exports lazily.
+
+    Args:
+        package: The ``__name__`` of the package.
+        submodules: Names of the submodules that are loaded when accessed as
+            attributes. Names in ``exports`` that are not in ``attributes`` are
+            looked up in these submodules, in order.
+        attributes: Exported names mapped to the submodule that defines them,
+            relative to the package.
+        exports: Names exported by the package, usually its ``__all__``.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+    """
+    submodules = list(submodules)
+    attributes = dict(attributes or {})
+    exports = set(exports) | set(attributes)
+
+    def __getattr__(name: str) -> Any:
+        module = sys.modules[package]
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        elif name in exports:
+            for submodule in submodules:
+                candidate = importlib.import_module(f"{package}.{submodule}")
+                if hasattr(candidate, name):
+                    value = getattr(candidate, name)
+                    break
+            else:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache the value so later lookups do not go through __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | exports | set(submodules))
+
+    return __getattr__, __dir__
+
+
+class LazyResource:
+    """Client attribute that creates its resource on first access.
+
+    The resource class is imported only then, so creating a client does not
+    load the modules of resources it never uses.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the attribute.
+
+        Args:
+            path: The resource class as ``"module:Class"``, with the module
+                relative to the ``holded`` package, such as
+                ``".api.invoice.resources.contacts:ContactsResource"``.
+        """
+        self.path = path
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        module, _, cls = self.path.partition(":")
+        resource = getattr(importlib.import_module(module, "holded"), cls)(instance)
+        # Stored on the instance, which takes precedence over this non-data descriptor
+        instance.__dict__[self.name] = resource
+        return resource
+
+
+def lazy_resource(path: str) -> Any:
+    """Declare a client attribute that creates its resource on first access.
+
+    Args:
+        path: The resource class as ``"module:Class"``; see ``LazyResource``.
+
+    Returns:
+        The attribute, typed as ``Any`` so that it can be annotated with the
+        resource class.
+    """
+    return LazyResource(path)
+
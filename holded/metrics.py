@@ -0,0 +1,313 @@
+"""
+In-process request metrics.
+
+A ``MetricsRegistry`` is a request hook that counts requests and records their
+latency in fixed-bucket histograms, keyed by the endpoint template rather than
+the concrete URL. It can be exported in the Prometheus text format or as a
+JSON snapshot without any extra dependency.
+"""
+
+import bisect
+import json
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import fork
+from .instrumentation import RequestEvent
+
+# Upper bounds of the latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Phases whose durations are added up per endpoint
+PHASES = ("rate_limit_wait", "pool_wait", "connect", "tls", "ttfb", "download", "decode", "validation")
+
+# Labels of the request series: method, endpoint, status class and retries
+_Key = Tuple[str, str, str, int]
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, with their sum.
+
+    Buckets are upper bounds; an observation falls in the first bucket that is
+    at least as large, or in the implicit ``+Inf`` bucket after the last one.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: The upper bounds of the buckets, in increasing order.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get the number of observations at or below each bucket bound.
+
+        Returns:
+            A list of ``(bound, count)`` pairs ending with ``(inf, count)``.
+        """
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating inside its bucket.
+
+        This is the estimate of Prometheus ``histogram_quantile``: accurate to
+        the width of the bucket. Quantiles in the ``+Inf`` bucket return the
+        largest bound.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimate, or None if there are no observations.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower = 0.0
+        below = 0
+        for bound, total in self.cumulative():
+            if total >= rank and total > below:
+                if math.isinf(bound):
+                    return self.buckets[-1] if self.buckets else None
+                return lower + (bound - lower) * (rank - below) / (total - below)
+            lower = bound
+            below = total
+        return None
+
+
+class _Series:
+    """Metrics of the requests that share one set of labels."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class MetricsRegistry:
+    """Request counters and latency histograms, fed by the request hooks of the clients.
+
+    Pass the registry as ``metrics`` to a client, or append it to
+    ``client.hooks``; one registry can be shared by several clients and
+    threads. Every attempt is recorded under its method, endpoint template,
+    status class (``"2xx"``, ``"4xx"``, ``"error"`` when no response was
+    received, ...) and retry count, so retried attempts do not hide in the
+    latency of first attempts.
+
+    The registry is cleared in forked children, which export their own metrics.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "holded_client"):
+        """Initialize the registry.
+
+        Args:
+            buckets: The upper bounds of the latency buckets, in seconds.
+            namespace: Prefix of the Prometheus metric names.
+
+        Raises:
+            ValueError: If the buckets are not in increasing order.
+        """
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("buckets must be in increasing order")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._series: Dict[_Key, _Series] = {}
+        self._phases: Dict[Tuple[str, str, str], float] = {}
+        fork.register(self)
+
+    def __call__(self, event: RequestEvent) -> None:
+        """Record an attempt; this makes the registry a request hook.
+
+        Args:
+            event: The event of the attempt.
+        """
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        """Record an attempt.
+
+        Args:
+            event: The event of the attempt.
+        """
+        key = (event.method, event.endpoint, event.status_class, event.attempt)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self.buckets)
+            series.latency.observe(event.total or 0.0)
+            series.bytes_sent += event.bytes_sent
+            series.bytes_received += event.bytes_received or 0
+            for phase in PHASES:
+                value = getattr(event, phase)
+                if value is not None:
+                    phase_key = (event.method, event.endpoint, phase)
+                    self._phases[phase_key] = self._phases.get(phase_key, 0.0) + value
+
+    def latency(
+        self, endpoint: str, method: Optional[str] = None, status_class: Optional[str] = None
+    ) -> Histogram:
+        """Get the latency histogram of an endpoint, merged over the other labels.
+
+        Args:
+            endpoint: The endpoint template, such as ``"invoicing/contacts/{id}"``.
+            method: Optional method to restrict to.
+            status_class: Optional status class to restrict to.
+
+        Returns:
+            A new histogram; ``quantile(0.99)`` gives the p99 latency.
+        """
+        merged = Histogram(self.buckets)
+        with self._lock:
+            for (key_method, key_endpoint, key_status, _), series in self._series.items():
+                if key_endpoint != endpoint:
+                    continue
+                if method is not None and key_method != method:
+                    continue
+                if status_class is not None and key_status != status_class:
+                    continue
+                merged.counts = [a + b for a, b in zip(merged.counts, series.latency.counts)]
+                merged.count += series.latency.count
+                merged.sum += series.latency.sum
+        return merged
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the metrics as a dictionary that can be serialized as JSON.
+
+        Returns:
+            A dictionary with a ``requests`` list, one entry per set of labels
+            with its count, bytes, latency buckets (cumulative, as in
+            Prometheus) and estimated p50, p90 and p99, and a ``phases`` list
+            with the total seconds spent in each phase per endpoint.
+        """
+        with self._lock:
+            series = sorted(self._series.items())
+            phases = sorted(self._phases.items())
+            requests = []
+            for (method, endpoint, status_class, retries), values in series:
+                latency = values.latency
+                requests.append(
+                    {
+                        "method": method,
+                        "endpoint": endpoint,
+                        "status_class": status_class,
+                        "retries": retries,
+                        "count": latency.count,
+                        "bytes_sent": values.bytes_sent,
+                        "bytes_received": values.bytes_received,
+                        "latency": {
+                            "sum": latency.sum,
+                            "buckets": {_format_bound(bound): count for bound, count in latency.cumulative()},
+                            "p50": latency.quantile(0.5),
+                            "p90": latency.quantile(0.9),
+                            "p99": latency.quantile(0.99),
+                        },
+                    }
+                )
+        return {
+            "requests": requests,
+            "phases": [
+                {"method": method, "endpoint": endpoint, "phase": phase, "seconds": seconds}
+                for (method, endpoint, phase), seconds in phases
+            ],
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Get the snapshot as JSON.
+
+        Args:
+            **kwargs: Options for ``json.dumps``, such as ``indent``.
+
+        Returns:
+            The JSON text.
+        """
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self) -> str:
+        """Get the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The text, ready to serve on a ``/metrics`` endpoint.
+        """
+        name = self.namespace
+        with self._lock:
+            series = sorted(self._series.items())
+            phases = sorted(self._phases.items())
+            lines = [
+                f"# HELP {name}_requests_total Attempts of requests to the Holded API.",
+                f"# TYPE {name}_requests_total counter",
+            ]
+            for key, values in series:
+                lines.append(f"{name}_requests_total{{{_labels(key)}}} {values.latency.count}")
+            lines += [
+                f"# HELP {name}_request_duration_seconds Duration of the attempts, including the rate limit wait.",
+                f"# TYPE {name}_request_duration_seconds histogram",
+            ]
+            for key, values in series:
+                labels = _labels(key)
+                for bound, count in values.latency.cumulative():
+                    bucket_labels = f'{labels},le="{_format_bound(bound)}"'
+                    lines.append(f"{name}_request_duration_seconds_bucket{{{bucket_labels}}} {count}")
+                lines.append(f"{name}_request_duration_seconds_sum{{{labels}}} {values.latency.sum!r}")
+                lines.append(f"{name}_request_duration_seconds_count{{{labels}}} {values.latency.count}")
+            for metric, attribute, help_text in (
+                ("request_bytes_total", "bytes_sent", "Bytes of the request bodies."),
+                ("response_bytes_total", "bytes_received", "Bytes of the response bodies."),
+            ):
+                lines += [f"# HELP {name}_{metric} {help_text}", f"# TYPE {name}_{metric} counter"]
+                for key, values in series:
+                    lines.append(f"{name}_{metric}{{{_labels(key)}}} {getattr(values, attribute)}")
+            lines += [
+                f"# HELP {name}_phase_seconds_total Time spent in each phase of the attempts.",
+                f"# TYPE {name}_phase_seconds_total counter",
+            ]
+            for (method, endpoint, phase), seconds in phases:
+                labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}",phase="{phase}"'
+                lines.append(f"{name}_phase_seconds_total{{{labels}}} {seconds!r}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self._series.clear()
+            self._phases.clear()
+
+    def _after_fork(self) -> None:
+        """Start the forked child with a fresh lock and no metrics of the parent."""
+        fork.reset_locks(self)
+        self.reset()
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: _Key) -> str:
+    """Format the labels of a request series."""
+    method, endpoint, status_class, retries = key
+    return f'method="{_escape(method)}",endpoint="{_escape(endpoint)}",status_class="{status_class}",retries="{retries}"'
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound as Prometheus does."""
+    return "+Inf" if math.isinf(bound) else repr(bound)
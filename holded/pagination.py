@@ -0,0 +1,360 @@
+"""
+Pagination helpers for the Holded API.
+
+List endpoints that accept a ``page`` parameter only return one page per call.
+The helpers in this module walk those pages lazily, so callers can process
+items one at a time without buffering the whole collection in memory.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Union
+
+from pydantic import BaseModel
+
+# Keys under which list endpoints wrap their items when they do not return a bare list
+ITEM_KEYS = ("items", "data", "results")
+
+PageParams = Optional[Union[Dict[str, Any], BaseModel]]
+
+
+def normalize_params(params: PageParams) -> Dict[str, Any]:
+    """Convert query parameters into a mutable dictionary.
+
+    Args:
+        params: Query parameters as a dictionary or Pydantic model.
+
+    Returns:
+        A new dictionary with the query parameters.
+    """
+    if params is None:
+        return {}
+    if isinstance(params, BaseModel):
+        return params.model_dump(exclude_none=True)
+    return dict(params)
+
+
+def extract_items(page: Any) -> List[Any]:
+    """Extract the list of items from a page response.
+
+    Args:
+        page: The response returned for a single page.
+
+    Returns:
+        The items contained in the page.
+    """
+    if page is None:
+        return []
+    if isinstance(page, BaseModel):
+        page = page.model_dump()
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        for key in ITEM_KEYS:
+            if isinstance(page.get(key), list):
+                return page[key]
+        for value in page.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+class _PageTracker:
+    """Decide when a paged walk has reached its last page."""
+
+    def __init__(self, page_size: Optional[int]):
+        """Initialize the tracker.
+
+        Args:
+            page_size: The requested page size, or None to infer it from the first page.
+        """
+        self.page_size = page_size
+        self._previous: Optional[List[Any]] = None
+
+    def is_last(self, items: List[Any]) -> bool:
+        """Check whether the given page is the last one.
+
+        Args:
+            items: The items of the page that was just fetched.
+
+        Returns:
+            True if no further pages should be requested.
+        """
+        if not items:
+            return True
+        if self.page_size is None:
+            self.page_size = len(items)
+        return len(items) < self.page_size
+
+    def is_repeat(self, items: List[Any]) -> bool:
+        """Check whether the given page repeats the previous one.
+
+        Endpoints that ignore the ``page`` parameter return the same page forever.
+
+        Args:
+            items: The items of the page that was just fetched.
+
+        Returns:
+            True if the page has the same boundaries as the previous page.
+        """
+        previous, self._previous = self._previous, items
+        if not previous or not items:
+            return False
+        return previous[0] == items[0] and previous[-1] == items[-1]
+
+
+def iter_pages(fetch: Callable[[Dict[str, Any]], Any], params: PageParams = None) -> Iterator[List[Any]]:
+    """Iterate over the pages of a list endpoint.
+
+    Pages are fetched lazily and the walk stops on the first short or empty page.
+
+    Args:
+        fetch: Callable that receives the query parameters and returns one page.
+        params: Optional query parameters. ``page`` sets the first page (default 1)
+            and ``limit`` sets the page size.
+
+    Yields:
+        The items of each page.
+    """
+    query = normalize_params(params)
+    page = int(query.get("page") or 1)
+    tracker = _PageTracker(query.get("limit"))
+    while True:
+        query["page"] = page
+        items = extract_items(fetch(dict(query)))
+        if tracker.is_repeat(items):
+            return
+        if items:
+            yield items
+        if tracker.is_last(items):
+            return
+        page += 1
+
+
+def iter_items(fetch: Callable[[Dict[str, Any]], Any], params: PageParams = None) -> Iterator[Any]:
+    """Iterate over every item of a list endpoint, one page at a time.
+
+    Args:
+        fetch: Callable that receives the query parameters and returns one page.
+        params: Optional query parameters.
+
+    Yields:
+        Each item of each page.
+    """
+    for items in iter_pages(fetch, params):
+        yield from items
+
+
+async def aiter_pages(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Any]], params: PageParams = None, concurrency: int = 1
+) -> AsyncIterator[List[Any]]:
+    """Asynchronously iterate over the pages of a list endpoint.
+
+    Args:
+        fetch: Coroutine function that receives the query parameters and returns one page.
+        params: Optional query parameters.
+        concurrency: Number of pages fetched at once. Values above 1 switch to
+            parallel mode (see ``aiter_pages_parallel``).
+
+    Yields:
+        The items of each page.
+    """
+    if concurrency > 1:
+        async for items in aiter_pages_parallel(fetch, params, concurrency):
+            yield items
+        return
+
+    query = normalize_params(params)
+    page = int(query.get("page") or 1)
+    tracker = _PageTracker(query.get("limit"))
+    while True:
+        query["page"] = page
+        items = extract_items(await fetch(dict(query)))
+        if tracker.is_repeat(items):
+            return
+        if items:
+            yield items
+        if tracker.is_last(items):
+            return
+        page += 1
+
+
+async def aiter_items(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Any]], params: PageParams = None, concurrency: int = 1
+) -> AsyncIterator[Any]:
+    """Asynchronously iterate over every item of a list endpoint.
+
+    Args:
+        fetch: Coroutine function that receives the query parameters and returns one page.
+        params: Optional query parameters.
+        concurrency: Number of pages fetched at once.
+
+    Yields:
+        Each item of each page.
+    """
+    async for items in aiter_pages(fetch, params, concurrency):
+        for item in items:
+            yield item
+
+
+def _total_pages(page: Any, page_size: int) -> Optional[int]:
+    """Read the page count from a page that reports the total number of items.
+
+    Args:
+        page: The raw response of the first page.
+        page_size: The number of items per page.
+
+    Returns:
+        The number of pages, or None if the response carries no total.
+    """
+    if isinstance(page, BaseModel):
+        page = page.model_dump()
+    if not isinstance(page, dict):
+        return None
+    total = page.get("total")
+    if not isinstance(total, int) or isinstance(total, bool):
+        return None
+    return max(1, math.ceil(total / page_size))
+
+
+async def find_last_page(
+    fetch_items: Callable[[int], Awaitable[List[Any]]],
+    first_page: int,
+    first_items: List[Any],
+    page_size: int,
+    probed: Optional[Dict[int, List[Any]]] = None,
+) -> int:
+    """Find the last non-empty page of a list endpoint that reports no total.
+
+    Pages ``first + 1``, ``first + 2``, ``first + 4``... are probed until one comes
+    back short or empty, then the gap between the last full page and the first
+    empty one is narrowed with a binary search. This takes ``O(log n)`` requests.
+
+    Args:
+        fetch_items: Coroutine function that returns the items of a page number.
+        first_page: The first page of the walk.
+        first_items: The items of the first page.
+        page_size: The number of items in a full page.
+        probed: Optional dictionary that receives the non-empty pages fetched
+            while probing, so they do not have to be fetched again.
+
+    Returns:
+        The number of the last non-empty page.
+    """
+    if probed is None:
+        probed = {}
+
+    def is_end(items: List[Any]) -> bool:
+        # Endpoints that ignore the page parameter keep returning the first page
+        return not items or (items[0] == first_items[0] and items[-1] == first_items[-1])
+
+    if not first_items or len(first_items) < page_size:
+        return first_page
+
+    low, step = first_page, 1
+    while True:
+        page = first_page + step
+        items = await fetch_items(page)
+        if is_end(items):
+            high = page
+            break
+        probed[page] = items
+        if len(items) < page_size:
+            return page
+        low, step = page, step * 2
+
+    # low is a full page and high is past the end
+    while high - low > 1:
+        middle = (low + high) // 2
+        items = await fetch_items(middle)
+        if is_end(items):
+            high = middle
+            continue
+        probed[middle] = items
+        if len(items) < page_size:
+            return middle
+        low = middle
+    return low
+
+
+async def aiter_pages_parallel(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Any]], params: PageParams = None, concurrency: int = 4
+) -> AsyncIterator[List[Any]]:
+    """Asynchronously iterate over the pages of a list endpoint, fetching pages concurrently.
+
+    The page count is read from the ``total`` of the first page when the endpoint
+    reports one, and discovered with ``find_last_page`` otherwise. The remaining
+    pages are then fetched with at most ``concurrency`` requests in flight and
+    yielded in page order.
+
+    Args:
+        fetch: Coroutine function that receives the query parameters and returns one page.
+        params: Optional query parameters. ``page`` sets the first page (default 1)
+            and ``limit`` sets the page size.
+        concurrency: Maximum number of pages fetched at once.
+
+    Yields:
+        The items of each page.
+
+    Raises:
+        ValueError: If concurrency is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    query = normalize_params(params)
+    first_page = int(query.get("page") or 1)
+
+    async def fetch_items(page: int) -> List[Any]:
+        return extract_items(await fetch(dict(query, page=page)))
+
+    first_response = await fetch(dict(query, page=first_page))
+    first_items = extract_items(first_response)
+    if not first_items:
+        return
+    page_size = int(query.get("limit") or len(first_items))
+
+    probed: Dict[int, List[Any]] = {}
+    last_page = _total_pages(first_response, page_size)
+    if last_page is None:
+        last_page = await find_last_page(fetch_items, first_page, first_items, page_size, probed)
+
+    yield first_items
+
+    async def load(page: int) -> List[Any]:
+        if page in probed:
+            return probed.pop(page)
+        return await fetch_items(page)
+
+    pending: Deque["asyncio.Future[List[Any]]"] = deque()
+    next_page = first_page + 1
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < concurrency:
+                pending.append(asyncio.ensure_future(load(next_page)))
+                next_page += 1
+            items = await pending.popleft()
+            if items:
+                yield items
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aiter_items_parallel(
+    fetch: Callable[[Dict[str, Any]], Awaitable[Any]], params: PageParams = None, concurrency: int = 4
+) -> AsyncIterator[Any]:
+    """Asynchronously iterate over every item of a list endpoint, fetching pages concurrently.
+
+    Args:
+        fetch: Coroutine function that receives the query parameters and returns one page.
+        params: Optional query parameters.
+        concurrency: Maximum number of pages fetched at once.
+
+    Yields:
+        Each item of each page, in page order.
+    """
+    async for items in aiter_pages_parallel(fetch, params, concurrency):
+        for item in items:
+            yield item
@@ -0,0 +1,155 @@
+"""
+Connection pool configuration for the Holded clients.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class PoolConfig:
+    """Connection pool settings shared by both HTTP stacks.
+
+    The synchronous client applies them to the ``requests`` adapter mounted on
+    its session and the asynchronous client to the ``aiohttp`` connector of its
+    session. Settings that one stack does not support are ignored by it.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = 15.0,
+        dns_cache_ttl: Optional[float] = 10.0,
+        block: bool = False,
+    ):
+        """Initialize the pool configuration.
+
+        Args:
+            max_connections: Maximum number of open connections (async client only,
+                0 for no limit).
+            max_connections_per_host: Maximum number of connections kept per host.
+                Defaults to 10 for the synchronous client and no limit for the
+                asynchronous client.
+            keepalive_timeout: Seconds an idle connection is kept open (async client
+                only). None keeps connections until the server closes them.
+            dns_cache_ttl: Seconds DNS lookups are cached (async client only).
+                0 disables the cache and None caches forever.
+            block: Whether the synchronous client waits for a free connection when
+                the pool is full instead of opening a connection it will discard.
+                The asynchronous client always waits.
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.block = block
+
+    def create_adapter(self, adapter_class: Type[HTTPAdapter] = HTTPAdapter) -> HTTPAdapter:
+        """Create a ``requests`` adapter with these settings.
+
+        Args:
+            adapter_class: The adapter class, ``HTTPAdapter`` or a subclass.
+
+        Returns:
+            An adapter to mount on a session.
+        """
+        pool_size = self.max_connections_per_host or DEFAULT_POOLSIZE
+        return adapter_class(pool_maxsize=pool_size, pool_block=self.block)
+
+    def create_connector(self) -> "aiohttp.TCPConnector":
+        """Create an ``aiohttp`` connector with these settings.
+
+        Must be called from a running event loop.
+
+        Returns:
+            A TCPConnector for a ClientSession.
+        """
+        import aiohttp
+
+        return aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host or 0,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl != 0,
+            ttl_dns_cache=int(self.dns_cache_ttl) if self.dns_cache_ttl is not None else None,
+        )
+
+
+def adapter_pool_stats(adapter: HTTPAdapter) -> Dict[str, Any]:
+    """Describe the usage of the connection pools behind a ``requests`` adapter.
+
+    Args:
+        adapter: The adapter mounted on the session.
+
+    Returns:
+        A dictionary with the pool size, connections in use and idle connections
+        in total and per host, and the saturation (in use divided by size).
+    """
+    hosts = {}
+    pools = adapter.poolmanager.pools
+    for key in list(pools.keys()):
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        queue = pool.pool
+        if queue is None:
+            continue
+        size = queue.maxsize
+        idle = sum(1 for conn in list(queue.queue) if conn is not None)
+        hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+            "size": size,
+            "in_use": size - queue.qsize(),
+            "idle": idle,
+            "created": pool.num_connections,
+        }
+    size = adapter._pool_maxsize
+    return _summarize(size * max(1, len(hosts)), hosts)
+
+
+def connector_pool_stats(connector: Optional["aiohttp.BaseConnector"]) -> Dict[str, Any]:
+    """Describe the usage of an ``aiohttp`` connector.
+
+    Args:
+        connector: The connector of the session, or None if no session exists yet.
+
+    Returns:
+        A dictionary with the pool size, connections in use and idle connections
+        in total and per host, and the saturation (in use divided by size).
+    """
+    if connector is None:
+        return _summarize(0, {})
+    hosts: Dict[str, Dict[str, int]] = {}
+    # aiohttp does not expose pool usage publicly, so read the bookkeeping it keeps
+    for key, conns in getattr(connector, "_conns", {}).items():
+        host = hosts.setdefault(f"{key.host}:{key.port}", {"in_use": 0, "idle": 0})
+        host["idle"] += len(conns)
+    for key, acquired in getattr(connector, "_acquired_per_host", {}).items():
+        host = hosts.setdefault(f"{key.host}:{key.port}", {"in_use": 0, "idle": 0})
+        host["in_use"] += len(acquired)
+    for host in hosts.values():
+        host["size"] = connector.limit_per_host or connector.limit
+    return _summarize(connector.limit, hosts)
+
+
+def _summarize(size: int, hosts: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+    """Add totals to per-host pool statistics.
+
+    Args:
+        size: The total pool size, 0 when unlimited.
+        hosts: Statistics per host.
+
+    Returns:
+        The pool statistics.
+    """
+    in_use = sum(host["in_use"] for host in hosts.values())
+    return {
+        "size": size,
+        "in_use": in_use,
+        "idle": sum(host["idle"] for host in hosts.values()),
+        "saturation": in_use / size if size else 0.0,
+        "hosts": hosts,
+    }
@@ -0,0 +1,132 @@
+"""
+Client-side rate limiting for the Holded API.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class RateLimiter:
+    """Token bucket that paces requests before they are sent.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    second. Every request takes one token and waits until the token is
+    available. Waiting happens outside the internal lock, so the same limiter
+    can be shared by several threads, by several asyncio tasks, and by a
+    synchronous and an asynchronous client that use the same API key.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Sustained number of requests per second.
+            burst: Maximum number of requests sent back to back when the bucket
+                is full. Defaults to ``rate`` rounded up (at least 1).
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, math.ceil(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _reserve(self, tokens: int) -> float:
+        """Take tokens from the bucket and compute how long to wait for them.
+
+        Args:
+            tokens: The number of tokens to take.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self._requests += 1
+            if wait > 0:
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Block the current thread until the request may be sent.
+
+        Args:
+            tokens: The number of tokens to take.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """Suspend the current task until the request may be sent.
+
+        Args:
+            tokens: The number of tokens to take.
+
+        Returns:
+            The number of seconds spent waiting.
+
+        Raises:
+            asyncio.CancelledError: If the task is cancelled while waiting. The
+                reserved tokens are returned to the bucket first.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                with self._lock:
+                    self._tokens += tokens
+                raise
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Get wait-time metrics for the limiter.
+
+        Returns:
+            A dictionary with the number of requests paced, how many of them had
+            to wait, and the total, average and maximum wait in seconds.
+        """
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "requests": self._requests,
+                "delayed": self._delayed,
+                "total_wait": self._total_wait,
+                "average_wait": self._total_wait / self._requests if self._requests else 0.0,
+                "max_wait": self._max_wait,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the wait-time metrics."""
+        with self._lock:
+            self._requests = 0
+            self._delayed = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
@@ -0,0 +1,219 @@
+"""
+Retry policy shared by the synchronous and asynchronous Holded clients.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Collection, Dict, Optional
+
+from .exceptions import (
+    HoldedConnectionError,
+    HoldedError,
+    HoldedRateLimitError,
+    HoldedServerError,
+    HoldedTimeoutError,
+)
+
+# Methods that can be sent again without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse the value of a ``Retry-After`` header.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        The number of seconds to wait, or None if the value cannot be parsed.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Limit retries to a fraction of the regular request volume.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one. The
+    budget also refills at ``min_per_second`` tokens per second so that a client
+    with little traffic can still retry. During an outage the retries stop once
+    the budget is spent, so failures cannot multiply the request volume.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0):
+        """Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per regular request.
+            min_per_second: Retries allowed per second regardless of traffic.
+            max_tokens: Maximum number of retries that can be saved up.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the time-based tokens. Must be called with the lock held."""
+        now = time.monotonic()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a regular request."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take the token for one retry.
+
+        Returns:
+            True if the retry is within budget.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        """The number of retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryPolicy:
+    """Decide whether a failed request is retried and how long to wait.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay`` and use
+    full jitter, so clients that failed together do not retry together. A
+    ``Retry-After`` header sent with a 429 or 5xx response takes precedence.
+
+    Rate limit errors are retried for every method, because the server refused
+    the request before processing it. Server errors, timeouts and connection
+    errors are only retried for idempotent methods, so a ``POST`` that may have
+    reached the server is never sent twice.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Maximum number of attempts per request, including the first one.
+            base_delay: Delay before the first retry in seconds.
+            max_delay: Upper bound for the computed delay in seconds.
+            jitter: Whether to pick a random delay between 0 and the computed delay.
+            respect_retry_after: Whether to wait for the ``Retry-After`` header when present.
+            max_retry_after: Upper bound for the ``Retry-After`` wait in seconds.
+            retry_methods: Methods retried on server, timeout and connection errors.
+            budget: Optional retry budget. Defaults to a new ``RetryBudget``.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, method: str, error: HoldedError) -> bool:
+        """Check whether an error is worth retrying for the given method.
+
+        Args:
+            method: The HTTP method of the failed request.
+            error: The error raised by the request.
+
+        Returns:
+            True if the request can safely be sent again.
+        """
+        if isinstance(error, HoldedRateLimitError):
+            return True
+        if isinstance(error, (HoldedServerError, HoldedTimeoutError, HoldedConnectionError)):
+            return method.upper() in self.retry_methods
+        return False
+
+    def compute_delay(self, attempt: int, error: Optional[HoldedError] = None) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed.
+            error: The error raised by the request.
+
+        Returns:
+            The number of seconds to wait.
+        """
+        if self.respect_retry_after and error is not None:
+            retry_after = parse_retry_after(error.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        delay = min(self.max_delay, self.base_delay * (2**attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def record_request(self) -> None:
+        """Record a new request in the retry budget."""
+        self.budget.deposit()
+
+    def get_retry_delay(self, method: str, error: HoldedError, attempt: int) -> Optional[float]:
+        """Decide whether to retry a failed attempt.
+
+        Args:
+            method: The HTTP method of the failed request.
+            error: The error raised by the request.
+            attempt: Zero-based index of the attempt that failed.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the error
+            should be raised.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, error):
+            return None
+        if not self.budget.withdraw():
+            return None
+        return self.compute_delay(attempt, error)
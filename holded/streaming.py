@@ -0,0 +1,155 @@
+"""
+Incremental parsing of large JSON list responses.
+"""
+
+import re
+from typing import Any, List, Optional
+
+from .codec import JSONCodec, default_codec
+from .pagination import extract_items
+
+# Size of the chunks read from the connection while streaming
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Bytes that change the nesting of a document outside strings
+_STRUCTURE = re.compile(rb'["\[\]{},]')
+# Bytes that end or escape inside a string
+_STRING = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class JSONArrayParser:
+    """Parse the items of a top-level JSON array as its bytes arrive.
+
+    Feed the body in chunks of any size; every item is decoded with the codec
+    as soon as its closing byte is seen, and only the bytes of the item being
+    received are kept in memory. A body that is not an array, such as an object
+    that wraps the list, is buffered and its items are returned by ``close``.
+    """
+
+    def __init__(self, codec: Optional[JSONCodec] = None):
+        """Initialize the parser.
+
+        Args:
+            codec: Optional codec to decode items with. Defaults to the fastest
+                codec available.
+        """
+        self.codec = codec or default_codec()
+        self._buffer = bytearray()
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._count = 0
+        # One of "start", "array", "document" or "done"
+        self._state = "start"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body.
+
+        Args:
+            chunk: The bytes received.
+
+        Returns:
+            The items completed by the chunk.
+
+        Raises:
+            ValueError: If an item is not valid JSON or data follows the array.
+        """
+        buffer = self._buffer
+        buffer.extend(chunk)
+        if self._state == "start":
+            self._pos = self._skip_whitespace(0)
+            if self._pos == len(buffer):
+                return []
+            if buffer[self._pos] != ord("["):
+                self._state = "document"
+                return []
+            self._state = "array"
+            self._depth = 1
+            self._pos += 1
+            self._start = self._pos
+        if self._state == "document":
+            return []
+        if self._state == "done":
+            if self._skip_whitespace(self._pos) != len(buffer):
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+
+        items: List[Any] = []
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING.search(buffer, pos)
+                if match is None:
+                    pos = max(pos, len(buffer))
+                    break
+                if buffer[match.start()] == ord("\\"):
+                    # Skip the escaped byte, which may not have arrived yet
+                    pos = match.end() + 1
+                else:
+                    self._in_string = False
+                    pos = match.end()
+                continue
+
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            byte = buffer[match.start()]
+            pos = match.end()
+            if byte == ord('"'):
+                self._in_string = True
+            elif byte in b"[{":
+                self._depth += 1
+            elif byte in b"]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buffer[self._start : match.start()], items, last=True)
+                    self._state = "done"
+                    break
+            elif self._depth == 1:
+                self._emit(buffer[self._start : match.start()], items, last=False)
+                self._start = pos
+
+        # Drop the bytes of the items already decoded
+        offset = pos if self._state == "done" else self._start
+        offset = min(offset, len(buffer))
+        del buffer[:offset]
+        self._pos = pos - offset
+        self._start -= min(self._start, offset)
+        if self._state == "done" and self._skip_whitespace(self._pos) != len(buffer):
+            raise ValueError("Unexpected data after the end of the JSON array")
+        return items
+
+    def close(self) -> List[Any]:
+        """Finish parsing once the whole body has been fed.
+
+        Returns:
+            The items of a body that is not an array; otherwise an empty list.
+
+        Raises:
+            ValueError: If the body is truncated or not valid JSON.
+        """
+        if self._state == "document":
+            return extract_items(self.codec.loads(bytes(self._buffer)))
+        if self._state == "array":
+            raise ValueError("Truncated JSON array")
+        return []
+
+    def _emit(self, segment: bytearray, items: List[Any], last: bool) -> None:
+        """Decode one item of the array."""
+        segment = segment.strip(_WHITESPACE)
+        if segment:
+            items.append(self.codec.loads(bytes(segment)))
+            self._count += 1
+        elif not last or self._count:
+            # Only the closing bracket of an empty array may follow no item
+            raise ValueError("Empty item in JSON array")
+
+    def _skip_whitespace(self, pos: int) -> int:
+        """Get the position of the next byte that is not whitespace."""
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
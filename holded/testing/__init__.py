@@ -0,0 +1,27 @@
+"""
+Tools for testing and benchmarking code that uses the Holded clients offline.
+"""
+
+from .faults import (
+    ConnectionResets,
+    Fault,
+    FaultProfile,
+    RateLimitBursts,
+    RecordedLatency,
+    ServerErrorStorms,
+    SlowResponses,
+    get_profile,
+)
+from .server import FakeHoldedServer
+
+__all__ = [
+    "FakeHoldedServer",
+    "FaultProfile",
+    "Fault",
+    "RateLimitBursts",
+    "ServerErrorStorms",
+    "SlowResponses",
+    "ConnectionResets",
+    "RecordedLatency",
+    "get_profile",
+]
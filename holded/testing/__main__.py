@@ -0,0 +1,7 @@
+"""
+Run the Holded API stand-in: ``python -m holded.testing --help``.
+"""
+
+from .server import main
+
+main()
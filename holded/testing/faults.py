@@ -0,0 +1,346 @@
+"""
+Fault injection for the Holded API stand-in.
+
+A ``FaultProfile`` makes ``FakeHoldedServer`` misbehave the way the real API
+and the networks in front of it do: bursts of 429 responses with
+``Retry-After``, storms of 5xx responses, responses that trickle in slowly,
+connections reset halfway through the body, and latency drawn from a recorded
+histogram. Faults are scripted by request number and a seeded random
+generator, so a profile misbehaves the same way on every run::
+
+    profile = get_profile("rate-limited")
+    with FakeHoldedServer(profile=profile) as server:
+        ...
+    print(profile.stats())  # {"rate_limit_bursts": 40}
+"""
+
+import asyncio
+import random
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Sequence
+
+from aiohttp import web
+
+if TYPE_CHECKING:
+    from ..metrics import Histogram
+
+Handler = Callable[[], Awaitable[web.StreamResponse]]
+
+
+class Fault:
+    """A kind of misbehavior, applied around the normal handling of a request.
+
+    Subclasses override ``apply``, and either answer the request themselves or
+    call ``handler`` to get the normal response. ``injected`` counts the
+    requests the fault affected.
+    """
+
+    name = "fault"
+
+    def __init__(self) -> None:
+        self.injected = 0
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        """Answer a request.
+
+        Args:
+            request: The request.
+            handler: Returns the normal response, or the response of the next fault.
+            index: The number of the request in the profile, starting at 0.
+            rng: The random generator of the profile.
+
+        Returns:
+            The response.
+        """
+        return await handler()
+
+
+def _error(status: int, message: str, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    return web.json_response({"message": message}, status=status, headers=headers)
+
+
+class RateLimitBursts(Fault):
+    """Refuse the last ``length`` requests of every ``every`` with 429 and ``Retry-After``."""
+
+    name = "rate_limit_bursts"
+
+    def __init__(self, every: int = 100, length: int = 10, retry_after: float = 1.0):
+        """Initialize the fault.
+
+        Args:
+            every: Number of requests in each cycle.
+            length: Number of requests refused at the end of each cycle.
+            retry_after: Seconds sent in the ``Retry-After`` header.
+        """
+        super().__init__()
+        self.every = every
+        self.length = length
+        self.retry_after = retry_after
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        if index % self.every < self.every - self.length:
+            return await handler()
+        self.injected += 1
+        return _error(429, "Too many requests", {"Retry-After": f"{self.retry_after:g}"})
+
+
+class ServerErrorStorms(Fault):
+    """Fail requests with 5xx responses during the last ``length`` requests of every ``every``."""
+
+    name = "server_error_storms"
+
+    def __init__(
+        self, every: int = 200, length: int = 20, statuses: Sequence[int] = (500, 502, 503), rate: float = 1.0
+    ):
+        """Initialize the fault.
+
+        Args:
+            every: Number of requests in each cycle.
+            length: Number of requests at the end of each cycle that form the storm.
+            statuses: Statuses to answer with, chosen at random.
+            rate: Share of the requests in a storm that fail.
+        """
+        super().__init__()
+        self.every = every
+        self.length = length
+        self.statuses = tuple(statuses)
+        self.rate = rate
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        if index % self.every < self.every - self.length or rng.random() >= self.rate:
+            return await handler()
+        self.injected += 1
+        return _error(rng.choice(self.statuses), "Service unavailable")
+
+
+class SlowResponses(Fault):
+    """Send the headers at once and trickle the body over ``duration`` seconds, like a slow-loris peer."""
+
+    name = "slow_responses"
+
+    def __init__(self, rate: float = 0.1, duration: float = 1.0, chunks: int = 10):
+        """Initialize the fault.
+
+        Args:
+            rate: Share of the requests that are slow.
+            duration: Seconds spent sending the body.
+            chunks: Number of pieces the body is sent in.
+        """
+        super().__init__()
+        self.rate = rate
+        self.duration = duration
+        self.chunks = chunks
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        response = await handler()
+        if rng.random() >= self.rate or not isinstance(response, web.Response):
+            return response
+        self.injected += 1
+        body = response.body or b""
+        stream = await _start_stream(request, response, len(body))
+        size = max(1, -(-len(body) // self.chunks))
+        for start in range(0, len(body), size):
+            await asyncio.sleep(self.duration / self.chunks)
+            await stream.write(body[start : start + size])
+        await stream.write_eof()
+        return stream
+
+
+class ConnectionResets(Fault):
+    """Close the connection after sending the headers and part of the body."""
+
+    name = "connection_resets"
+
+    def __init__(self, rate: float = 0.05, fraction: float = 0.5):
+        """Initialize the fault.
+
+        Args:
+            rate: Share of the requests whose connection is reset.
+            fraction: Share of the body sent before the connection is closed.
+        """
+        super().__init__()
+        self.rate = rate
+        self.fraction = fraction
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        response = await handler()
+        if rng.random() >= self.rate or not isinstance(response, web.Response) or request.transport is None:
+            return response
+        self.injected += 1
+        body = response.body or b""
+        stream = await _start_stream(request, response, len(body))
+        await stream.write(body[: int(len(body) * self.fraction)])
+        request.transport.close()
+        return stream
+
+
+class RecordedLatency(Fault):
+    """Delay every request by a latency drawn from a recorded histogram.
+
+    A bucket is picked in proportion to its count and the latency is drawn
+    uniformly within it. Use ``from_histogram`` with a histogram recorded by
+    ``MetricsRegistry.latency()`` to replay production latencies.
+    """
+
+    name = "recorded_latency"
+
+    def __init__(self, buckets: Sequence[float], counts: Sequence[int]):
+        """Initialize the fault.
+
+        Args:
+            buckets: The upper bounds of the buckets, in seconds.
+            counts: The number of observations in each bucket, optionally
+                followed by the number above the last bound, which are drawn
+                at the last bound.
+
+        Raises:
+            ValueError: If the counts do not match the buckets or are all zero.
+        """
+        super().__init__()
+        if len(counts) not in (len(buckets), len(buckets) + 1) or not any(counts):
+            raise ValueError("counts must match the buckets and not all be zero")
+        self.buckets = tuple(buckets)
+        self.counts = tuple(counts)
+
+    @classmethod
+    def from_histogram(cls, histogram: "Histogram") -> "RecordedLatency":
+        """Create the fault from a histogram of the metrics registry.
+
+        Args:
+            histogram: The histogram, such as ``metrics.latency("invoicing/contacts")``.
+
+        Returns:
+            The fault.
+        """
+        return cls(histogram.buckets, histogram.counts)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw a latency.
+
+        Args:
+            rng: The random generator.
+
+        Returns:
+            The latency in seconds.
+        """
+        (index,) = rng.choices(range(len(self.counts)), weights=self.counts)
+        if index >= len(self.buckets):
+            return self.buckets[-1]
+        lower = self.buckets[index - 1] if index else 0.0
+        return rng.uniform(lower, self.buckets[index])
+
+    async def apply(
+        self, request: web.Request, handler: Handler, index: int, rng: random.Random
+    ) -> web.StreamResponse:
+        self.injected += 1
+        await asyncio.sleep(self.sample(rng))
+        return await handler()
+
+
+async def _start_stream(request: web.Request, response: web.Response, length: int) -> web.StreamResponse:
+    """Send the status and headers of a response, leaving the body to the caller."""
+    stream = web.StreamResponse(status=response.status, headers={"Content-Type": response.content_type})
+    stream.content_length = length
+    await stream.prepare(request)
+    return stream
+
+
+class FaultProfile:
+    """A scripted set of faults applied to every request of the server.
+
+    Faults apply in order: the first one sees the request first and the
+    response last. The profile numbers the requests and owns the random
+    generator, so the same seed and the same sequence of requests produce the
+    same faults.
+    """
+
+    def __init__(self, name: str, faults: Sequence[Fault] = (), seed: Optional[int] = 0):
+        """Initialize the profile.
+
+        Args:
+            name: The name of the profile, for reports.
+            faults: The faults.
+            seed: Seed of the random generator; None seeds it from the system.
+        """
+        self.name = name
+        self.faults = list(faults)
+        self.rng = random.Random(seed)
+        self.requests = 0
+
+    async def handle(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        """Answer a request through the faults.
+
+        Args:
+            request: The request.
+            handler: Returns the normal response.
+
+        Returns:
+            The response.
+        """
+        index = self.requests
+        self.requests += 1
+        for fault in reversed(self.faults):
+            handler = _bind(fault, request, handler, index, self.rng)
+        return await handler()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of requests each fault affected.
+
+        Returns:
+            A dictionary keyed by fault name.
+        """
+        return {fault.name: fault.injected for fault in self.faults}
+
+    def __repr__(self) -> str:
+        return f"FaultProfile({self.name!r}, requests={self.requests}, injected={self.stats()})"
+
+
+def _bind(fault: Fault, request: web.Request, handler: Handler, index: int, rng: random.Random) -> Handler:
+    return lambda: fault.apply(request, handler, index, rng)
+
+
+# An illustrative latency histogram of a busy API: most responses in 50-250 ms with a long tail
+SAMPLE_LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SAMPLE_LATENCY_COUNTS = (2, 18, 40, 28, 8, 3, 1)
+
+PROFILES: Dict[str, Callable[[], Sequence[Fault]]] = {
+    "healthy": lambda: [],
+    "rate-limited": lambda: [RateLimitBursts(every=50, length=10, retry_after=0.5)],
+    "server-errors": lambda: [ServerErrorStorms(every=100, length=20, rate=0.8)],
+    "slow": lambda: [SlowResponses(rate=0.05, duration=1.0)],
+    "resets": lambda: [ConnectionResets(rate=0.05)],
+    "latency": lambda: [RecordedLatency(SAMPLE_LATENCY_BUCKETS, SAMPLE_LATENCY_COUNTS)],
+    "degraded": lambda: [
+        RecordedLatency(SAMPLE_LATENCY_BUCKETS, SAMPLE_LATENCY_COUNTS),
+        RateLimitBursts(every=100, length=5, retry_after=0.5),
+        ServerErrorStorms(every=200, length=10, rate=0.5),
+        ConnectionResets(rate=0.02),
+    ],
+}
+
+
+def get_profile(name: str, seed: Optional[int] = 0) -> FaultProfile:
+    """Create one of the built-in profiles.
+
+    Args:
+        name: The name of the profile: one of ``PROFILES``.
+        seed: Seed of the random generator; None seeds it from the system.
+
+    Returns:
+        A new profile.
+
+    Raises:
+        ValueError: If there is no profile with that name.
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unknown fault profile {name!r}; choose from {', '.join(sorted(PROFILES))}")
+    return FaultProfile(name, PROFILES[name](), seed)
@@ -0,0 +1,491 @@
+"""
+Local stand-in for the Holded API.
+
+``FakeHoldedServer`` serves the routes used by the resources of both clients
+from in-memory state, so the clients can be load-tested and benchmarked
+without network access or an API key::
+
+    with FakeHoldedServer(latency=0.02) as server:
+        server.seed("invoicing/contacts", [{"name": f"Contact {i}"} for i in range(1000)])
+        client = HoldedClient(api_key="test", base_url=server.base_url)
+        contacts = list(client.contacts.iter_all())
+
+The server runs on its own event loop thread, so synchronous and asynchronous
+clients can both use it. It can also be started from the command line with
+``python -m holded.testing``.
+"""
+
+import argparse
+import asyncio
+import base64
+import random
+import re
+import threading
+import uuid
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+from aiohttp import web
+
+from ..codec import resolve_codec
+from .faults import PROFILES, FaultProfile, get_profile
+
+# Number of records per page when a list request asks for a page without a limit
+DEFAULT_PAGE_SIZE = 100
+
+Record = Dict[str, Any]
+# Builds the response of an action from the record it applies to and the route variables
+Payload = Callable[[Record, Dict[str, str]], Any]
+
+
+class _APIError(Exception):
+    """An error answered with a status and a JSON message, like the API does."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _done(record: Record, variables: Dict[str, str]) -> Any:
+    return {"status": 1, "info": "Done", "id": record["id"]}
+
+
+def _pdf(record: Record, variables: Dict[str, str]) -> Any:
+    return {"status": 1, "data": base64.b64encode(b"%PDF-1.4 " + record["id"].encode()).decode()}
+
+
+def _image(record: Record, variables: Dict[str, str]) -> Any:
+    return {"status": 1, "data": base64.b64encode(b"\x89PNG " + record["id"].encode()).decode()}
+
+
+def _empty_list(record: Record, variables: Dict[str, str]) -> Any:
+    return []
+
+
+def _not_found(record: Record, variables: Dict[str, str]) -> Any:
+    raise _APIError(404, "Not found")
+
+
+class _Route:
+    """A route of the API, matched against the path without the API version."""
+
+    def __init__(self, method: str, template: str, kind: str, collection: str, payload: Payload = _done):
+        """Initialize the route.
+
+        Args:
+            method: The HTTP method.
+            template: The path, with variables such as ``{id}``.
+            kind: What the route does: ``list``, ``create``, ``get``, ``update``,
+                ``delete``, or ``action`` to answer with ``payload`` for a record.
+            collection: The collection of records the route works on.
+            payload: The response of an ``action`` route.
+        """
+        self.method = method
+        self.template = template
+        self.kind = kind
+        self.collection = collection
+        self.payload = payload
+        names = re.findall(r"{(\w+)}", template)
+        # Variables before the record ID are fields that scope the records,
+        # such as the document type; the ones after it are action arguments
+        self.scope = names[: names.index("id")] if "id" in names else names
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template))
+        self.pattern: Pattern[str] = re.compile(f"^{pattern}$")
+
+
+def _crud(template: str, collection: str, methods: str = "list create get update delete") -> List[_Route]:
+    """Build the list and create routes of a collection and the routes of its records."""
+    kinds = methods.split()
+    routes = []
+    for kind, method in (("list", "GET"), ("create", "POST")):
+        if kind in kinds:
+            routes.append(_Route(method, template, kind, collection))
+    for kind, method in (("get", "GET"), ("update", "PUT"), ("delete", "DELETE")):
+        if kind in kinds:
+            routes.append(_Route(method, template + "/{id}", kind, collection))
+    return routes
+
+
+def _actions(template: str, collection: str, method: str, names: Iterable[str]) -> List[_Route]:
+    """Build ``action`` routes that confirm an operation on a record."""
+    return [_Route(method, f"{template}/{{id}}/{name}", "action", collection) for name in names]
+
+
+# Routes in matching order: literal segments come before variables in the same position
+ROUTES: List[_Route] = [
+    # Invoicing
+    *_crud("invoicing/contacts/groups", "invoicing/contacts/groups"),
+    _Route("GET", "invoicing/contacts/{id}/attachments", "action", "invoicing/contacts", _empty_list),
+    _Route("GET", "invoicing/contacts/{id}/attachments/{name}", "action", "invoicing/contacts", _not_found),
+    *_crud("invoicing/contacts", "invoicing/contacts"),
+    *_actions("invoicing/documents", "invoicing/documents", "POST", ["shipall", "shipline"]),
+    *_actions(
+        "invoicing/documents/{docType}",
+        "invoicing/documents",
+        "POST",
+        ["pay", "send", "attach", "tracking", "pipeline"],
+    ),
+    _Route("GET", "invoicing/documents/{docType}/{id}/pdf", "action", "invoicing/documents", _pdf),
+    _Route(
+        "GET",
+        "invoicing/documents/{docType}/{id}/shipped/{itemId}",
+        "action",
+        "invoicing/documents",
+        lambda record, variables: {"itemId": variables["itemId"], "units": 0},
+    ),
+    *_crud("invoicing/documents/{docType}", "invoicing/documents"),
+    *_crud("invoicing/paymentmethods", "invoicing/paymentmethods", "list"),
+    *_crud("invoicing/expensesaccounts", "invoicing/expensesaccounts"),
+    *_crud("invoicing/numberingseries/{docType}", "invoicing/numberingseries", "list create update delete"),
+    *_crud("invoicing/payments", "invoicing/payments"),
+    *_crud("invoicing/products/categories", "invoicing/products/categories", "list create update delete"),
+    _Route("GET", "invoicing/products/{id}/image", "action", "invoicing/products", _image),
+    _Route("GET", "invoicing/products/{id}/images", "action", "invoicing/products", _empty_list),
+    _Route("GET", "invoicing/products/{id}/image/{filename}", "action", "invoicing/products", _image),
+    _Route("PUT", "invoicing/products/{id}/stock", "update", "invoicing/products"),
+    *_crud("invoicing/products", "invoicing/products"),
+    *_crud("invoicing/remittances", "invoicing/remittances", "list get"),
+    *_crud("invoicing/saleschannels", "invoicing/saleschannels"),
+    *_crud("invoicing/services", "invoicing/services"),
+    *_crud("invoicing/taxes", "invoicing/taxes", "list"),
+    *_crud("invoicing/treasury", "invoicing/treasury", "list create get"),
+    _Route(
+        "GET",
+        "invoicing/warehouses/{id}/stock",
+        "action",
+        "invoicing/warehouses",
+        lambda record, variables: {"warehouseId": record["id"], "products": []},
+    ),
+    *_crud("invoicing/warehouses", "invoicing/warehouses"),
+    # CRM
+    *_crud("crm/bookings/locations", "crm/bookings/locations", "list"),
+    _Route("GET", "crm/bookings/locations/{id}/slots", "action", "crm/bookings/locations", _empty_list),
+    *_crud("crm/bookings", "crm/bookings"),
+    *_crud("crm/events", "crm/events"),
+    *_crud("crm/funnels", "crm/funnels"),
+    *_actions("crm/leads", "crm/leads", "POST", ["notes", "tasks"]),
+    *_actions("crm/leads", "crm/leads", "PUT", ["notes", "tasks"]),
+    *_actions("crm/leads", "crm/leads", "DELETE", ["tasks"]),
+    _Route("PUT", "crm/leads/{id}/dates", "update", "crm/leads"),
+    _Route("PUT", "crm/leads/{id}/stages", "update", "crm/leads"),
+    *_crud("crm/leads", "crm/leads"),
+    # Projects
+    *_crud("projects/projects/times", "projects/times", "list"),
+    *_crud("projects/projects/{projectId}/times", "projects/times"),
+    _Route(
+        "GET",
+        "projects/projects/{id}/summary",
+        "action",
+        "projects/projects",
+        lambda record, variables: {"id": record["id"], "name": record.get("name"), "tasks": 0, "times": 0},
+    ),
+    *_crud("projects/projects", "projects/projects"),
+    *_crud("projects/tasks", "projects/tasks", "list create get delete"),
+    # Team
+    *_crud("team/employees/times", "team/times", "list get update delete"),
+    *_crud("team/employees/{employeeId}/times", "team/times", "list create"),
+    *_actions("team/employees", "team/employees", "POST", ["clock-in", "clock-out", "pause", "unpause"]),
+    *_crud("team/employees", "team/employees"),
+    # Accounting
+    *_crud("accounting/chartofaccounts", "accounting/accounts", "list"),
+    _Route("POST", "accounting/v1/account", "create", "accounting/accounts"),
+    *_crud("accounting/dailyledger", "accounting/entries", "list"),
+    _Route("POST", "accounting/entry", "create", "accounting/entries"),
+]
+
+# Reference data served before anything is seeded
+DEFAULT_DATA: Dict[str, List[Record]] = {
+    "invoicing/taxes": [
+        {"id": "s_iva_21", "name": "IVA 21%", "amount": 21, "scope": "sales"},
+        {"id": "s_iva_10", "name": "IVA 10%", "amount": 10, "scope": "sales"},
+        {"id": "p_iva_21", "name": "IVA 21%", "amount": 21, "scope": "purchases"},
+    ],
+    "invoicing/paymentmethods": [{"id": "transfer", "name": "Bank transfer", "dueDays": 30}],
+    "accounting/accounts": [
+        {"id": "43000000", "num": 43000000, "name": "Clientes"},
+        {"id": "70000000", "num": 70000000, "name": "Ventas de mercaderías"},
+    ],
+    "crm/bookings/locations": [{"id": "main", "name": "Main office"}],
+}
+
+
+def _new_id() -> str:
+    """Create a record ID shaped like the 24 hex digit IDs of the API."""
+    return uuid.uuid4().hex[:24]
+
+
+class FakeHoldedServer:
+    """In-memory stand-in for the Holded API, for offline tests and benchmarks.
+
+    Records live in collections named after the endpoint that lists them,
+    such as ``"invoicing/contacts"``; documents of every type share
+    ``"invoicing/documents"`` and keep their type in ``docType``. Time
+    entries live in ``"projects/times"`` and ``"team/times"``. Creating,
+    updating and deleting records changes the state seen by later requests,
+    and list requests that pass ``page`` are paginated with ``limit`` items
+    per page. Operations such as paying or sending a document only confirm
+    that the record exists.
+
+    Every request must send a ``Key`` header, which must match ``api_key``
+    when it is set. ``hits`` counts the requests per method and route that
+    reached the API, so requests refused by a fault profile are not counted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        api_key: Optional[str] = None,
+        profile: Optional[FaultProfile] = None,
+    ):
+        """Initialize the server; ``start`` or a ``with`` block runs it.
+
+        Args:
+            host: The interface to listen on.
+            port: The port to listen on; 0 picks a free port.
+            latency: Seconds to wait before answering each request, or a
+                function that returns them, such as
+                ``lambda: random.uniform(0.01, 0.05)``.
+            page_size: Number of records per page when a request passes
+                ``page`` without ``limit``.
+            api_key: Optional API key that requests must send.
+            profile: Optional fault profile that makes the server misbehave,
+                such as ``get_profile("rate-limited")``. It can be replaced
+                while the server runs.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.page_size = page_size
+        self.api_key = api_key
+        self.profile = profile
+        self.hits: "Counter[Tuple[str, str]]" = Counter()
+        self.codec = resolve_codec(None)
+        self._collections: Dict[str, Dict[str, Record]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+        self.reset()
+
+    @property
+    def base_url(self) -> str:
+        """The URL to pass as ``base_url`` to the clients."""
+        return f"http://{self.host}:{self.port}/api/"
+
+    def reset(self) -> None:
+        """Drop every record and hit count, and restore the reference data."""
+        with self._lock:
+            self._collections = {}
+            self.hits.clear()
+        for collection, records in DEFAULT_DATA.items():
+            self.seed(collection, [dict(record) for record in records])
+
+    def seed(self, collection: str, records: Iterable[Record]) -> List[str]:
+        """Add records to a collection.
+
+        Args:
+            collection: The collection, such as ``"invoicing/contacts"``.
+            records: The records. Records without an ``id`` get a new one.
+
+        Returns:
+            The IDs of the records, in order.
+        """
+        ids = []
+        with self._lock:
+            stored = self._collections.setdefault(collection, {})
+            for record in records:
+                record = dict(record)
+                record.setdefault("id", _new_id())
+                stored[record["id"]] = record
+                ids.append(record["id"])
+        return ids
+
+    def records(self, collection: str) -> List[Record]:
+        """Get a copy of the records of a collection, in insertion order.
+
+        Args:
+            collection: The collection, such as ``"invoicing/contacts"``.
+
+        Returns:
+            The records.
+        """
+        with self._lock:
+            return [dict(record) for record in self._collections.get(collection, {}).values()]
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application that serves the API.
+
+        Returns:
+            The application, for use with aiohttp's own runners and test utilities.
+        """
+        app = web.Application()
+        app.router.add_route("*", "/api/{path:.*}", self._handle)
+        return app
+
+    async def _delay(self) -> None:
+        """Wait for the configured latency."""
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Authenticate a request, then answer it through the fault profile, if any."""
+        key = request.headers.get("Key")
+        if not key or (self.api_key is not None and key != self.api_key):
+            return self._json({"message": "Unauthorized"}, 401)
+        await self._delay()
+        profile = self.profile
+        if profile is None:
+            return await self._respond(request)
+        return await profile.handle(request, lambda: self._respond(request))
+
+    async def _respond(self, request: web.Request) -> web.Response:
+        """Route and answer a request."""
+        # The path is "{service}/{version}/{endpoint}/..."; routes omit the version
+        segments = request.match_info["path"].strip("/").split("/")
+        path = "/".join(segments[:1] + segments[2:])
+        for route in ROUTES:
+            if route.method != request.method:
+                continue
+            match = route.pattern.match(path)
+            if match is not None:
+                break
+        else:
+            return self._json({"message": f"No route for {request.method} {path}"}, 404)
+
+        self.hits[(route.method, route.template)] += 1
+        data: Any = None
+        if request.can_read_body:
+            try:
+                data = self.codec.loads(await request.read())
+            except ValueError:
+                return self._json({"message": "Invalid JSON body"}, 400)
+        try:
+            return self._json(self._dispatch(route, match.groupdict(), request.query, data))
+        except _APIError as e:
+            return self._json({"message": e.message}, e.status)
+
+    def _dispatch(self, route: _Route, variables: Dict[str, str], query: Any, data: Any) -> Any:
+        """Apply a route to the state and build the response data."""
+        scope = {name: variables[name] for name in route.scope}
+        with self._lock:
+            records = self._collections.setdefault(route.collection, {})
+            if route.kind == "list":
+                items = [record for record in records.values() if _in_scope(record, scope)]
+                return _paginate(items, query, self.page_size)
+            if route.kind == "create":
+                record = {**(data if isinstance(data, dict) else {}), **scope, "id": _new_id()}
+                records[record["id"]] = record
+                return {"status": 1, "info": "Created", "id": record["id"]}
+
+            record = records.get(variables["id"])
+            if record is None or not _in_scope(record, scope):
+                raise _APIError(404, "Not found")
+            if route.kind == "get":
+                return dict(record)
+            if route.kind == "update":
+                if isinstance(data, dict):
+                    record.update({name: value for name, value in data.items() if name != "id"})
+                return {"status": 1, "info": "Updated", "id": record["id"]}
+            if route.kind == "delete":
+                del records[record["id"]]
+                return {"status": 1, "info": "Deleted", "id": record["id"]}
+            return route.payload(dict(record), variables)
+
+    def _json(self, data: Any, status: int = 200) -> web.Response:
+        return web.Response(body=self.codec.dumps(data), status=status, content_type="application/json")
+
+    def start(self) -> "FakeHoldedServer":
+        """Start serving on a background event loop thread.
+
+        Returns:
+            The server, with ``port`` set to the port it listens on.
+        """
+        if self._thread is not None:
+            return self
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="holded-fake-server", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    async def _start(self) -> None:
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    def stop(self) -> None:
+        """Stop serving and wait for the event loop thread to finish."""
+        if self._thread is None or self._loop is None:
+            return
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._runner = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+        self._loop = None
+
+    def __enter__(self) -> "FakeHoldedServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        state = "running" if self._thread is not None else "stopped"
+        return f"FakeHoldedServer({self.base_url!r}, {state})"
+
+
+def _in_scope(record: Record, scope: Dict[str, str]) -> bool:
+    return all(record.get(name) == value for name, value in scope.items())
+
+
+def _paginate(items: List[Record], query: Any, page_size: int) -> List[Record]:
+    """Return one page of a list when the request asks for a page or a limit."""
+    if "page" not in query and "limit" not in query:
+        return items
+    try:
+        page = max(1, int(query.get("page", 1)))
+        limit = max(1, int(query.get("limit", page_size)))
+    except ValueError:
+        raise _APIError(400, "Invalid page or limit")
+    return items[(page - 1) * limit : page * limit]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the server from the command line until it is interrupted."""
+    parser = argparse.ArgumentParser(description="Serve an in-memory stand-in for the Holded API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum seconds added to or taken from it")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--contacts", type=int, default=0, help="number of contacts to seed")
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="fault profile to serve with")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the fault profile")
+    args = parser.parse_args(argv)
+
+    latency: Union[float, Callable[[], float]] = args.latency
+    if args.jitter:
+        latency = lambda: max(0.0, args.latency + random.uniform(-args.jitter, args.jitter))  # noqa: E731
+    profile = get_profile(args.profile, seed=args.seed) if args.profile else None
+    server = FakeHoldedServer(args.host, args.port, latency=latency, page_size=args.page_size, profile=profile)
+    server.seed("invoicing/contacts", ({"name": f"Contact {index}"} for index in range(args.contacts)))
+    with server:
+        print(f"Serving the Holded API stand-in at {server.base_url} with profile {args.profile or 'none'}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Pluggable HTTP transports for the Holded clients.
+
+Each transport is imported on first access, so the HTTP libraries of unused
+transports are never loaded.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+if TYPE_CHECKING:
+    from .aiohttp_transport import AiohttpResponse, AiohttpTransport
+    from .base import AsyncTransport, AsyncTransportResponse, Transport, TransportResponse
+    from .httpx_transport import AsyncHttpxTransport, HttpxTransport
+    from .memory import AsyncMemoryTransport, MemoryRequest, MemoryResponse, MemoryTransport
+    from .requests_transport import RequestsResponse, RequestsTransport
+
+__all__ = [
+    "Transport",
+    "TransportResponse",
+    "AsyncTransport",
+    "AsyncTransportResponse",
+    "RequestsTransport",
+    "RequestsResponse",
+    "AiohttpTransport",
+    "AiohttpResponse",
+    "HttpxTransport",
+    "AsyncHttpxTransport",
+    "MemoryTransport",
+    "AsyncMemoryTransport",
+    "MemoryRequest",
+    "MemoryResponse",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "Transport": ".base",
+        "TransportResponse": ".base",
+        "AsyncTransport": ".base",
+        "AsyncTransportResponse": ".base",
+        "RequestsTransport": ".requests_transport",
+        "RequestsResponse": ".requests_transport",
+        "AiohttpTransport": ".aiohttp_transport",
+        "AiohttpResponse": ".aiohttp_transport",
+        "HttpxTransport": ".httpx_transport",
+        "AsyncHttpxTransport": ".httpx_transport",
+        "MemoryTransport": ".memory",
+        "AsyncMemoryTransport": ".memory",
+        "MemoryRequest": ".memory",
+        "MemoryResponse": ".memory",
+    },
+)
@@ -0,0 +1,245 @@
+"""
+Transport backed by ``aiohttp``.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+
+import aiohttp
+from aiohttp import ClientTimeout
+
+from .. import fork
+from ..exceptions import HoldedConnectionError, HoldedTimeoutError
+from ..pooling import PoolConfig, connector_pool_stats
+from .base import AsyncTransport, AsyncTransportResponse, Content
+
+
+class _Timings(dict):
+    """Phase timings of one request, filled in by the trace callbacks of the session."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started: Dict[str, float] = {}
+
+    def start(self, phase: str) -> None:
+        self.started[phase] = time.perf_counter()
+
+    def end(self, phase: str) -> None:
+        if phase in self.started:
+            self[phase] = self.get(phase, 0.0) + time.perf_counter() - self.started.pop(phase)
+
+
+def _timings(context: SimpleNamespace) -> Optional[_Timings]:
+    """Get the timings passed to the request, if the request was sent by the transport."""
+    timings = context.trace_request_ctx
+    return timings if isinstance(timings, _Timings) else None
+
+
+async def _on_request_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings.start("request")
+
+
+async def _on_connection_queued_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings.start("pool_wait")
+
+
+async def _on_connection_queued_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings.end("pool_wait")
+
+
+async def _on_connection_create_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings.start("connect")
+
+
+async def _on_connection_create_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None:
+        timings.end("connect")
+
+
+async def _on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timings = _timings(context)
+    if timings is not None and "request" in timings.started:
+        # The request phase covers everything up to the response headers
+        elapsed = time.perf_counter() - timings.started.pop("request")
+        timings["ttfb"] = max(0.0, elapsed - timings.get("pool_wait", 0.0) - timings.get("connect", 0.0))
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    """Create the trace configuration that measures the phases of each request.
+
+    ``aiohttp`` opens the connection and performs the TLS handshake in one
+    step, so ``connect`` includes the handshake.
+    """
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_queued_start.append(_on_connection_queued_start)
+    config.on_connection_queued_end.append(_on_connection_queued_end)
+    config.on_connection_create_start.append(_on_connection_create_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    config.on_request_end.append(_on_request_end)
+    return config
+
+
+class AiohttpResponse(AsyncTransportResponse):
+    """Response wrapping an ``aiohttp.ClientResponse``."""
+
+    def __init__(self, response: aiohttp.ClientResponse, timings: Optional[Dict[str, float]] = None):
+        """Initialize the response.
+
+        Args:
+            response: The underlying response.
+            timings: The durations of the network phases; ``read`` adds the download.
+        """
+        self.raw = response
+        self.timings = timings if timings is not None else {}
+
+    @property
+    def status(self) -> int:  # type: ignore[override]
+        """The HTTP status code."""
+        return self.raw.status
+
+    @property
+    def headers(self) -> Mapping[str, str]:  # type: ignore[override]
+        """The response headers."""
+        return self.raw.headers
+
+    async def read(self) -> bytes:
+        """Read the raw response body."""
+        start = time.perf_counter()
+        content = await self.raw.read()
+        self.timings.setdefault("download", time.perf_counter() - start)
+        return content
+
+    async def text(self) -> str:
+        """Read the response body as text."""
+        return await self.raw.text()
+
+    async def json(self) -> Any:
+        """Read the response body as JSON."""
+        return await self.raw.json()
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Iterate over the response body as it is received."""
+        async for chunk in self.raw.content.iter_chunked(chunk_size):
+            yield chunk
+
+
+class AiohttpTransport(AsyncTransport):
+    """Asynchronous transport backed by an ``aiohttp.ClientSession``.
+
+    This is the default transport of ``AsyncHoldedClient``. The session is
+    created on first use, under a lock so that concurrent first requests share
+    one session.
+    """
+
+    def __init__(self, timeout: float = 30, pool_config: Optional[PoolConfig] = None):
+        """Initialize the transport.
+
+        Args:
+            timeout: Total request timeout in seconds.
+            pool_config: Optional connection pool settings.
+        """
+        super().__init__()
+        self.timeout = timeout
+        self.pool_config = pool_config or PoolConfig()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp ClientSession.
+
+        Returns:
+            The session.
+        """
+        if self.session is not None and not self.session.closed:
+            return self.session
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(
+                    headers=self.headers,
+                    timeout=ClientTimeout(total=self.timeout),
+                    connector=self.pool_config.create_connector(),
+                    trace_configs=[_trace_config()],
+                )
+        return self.session
+
+    async def open(self) -> None:
+        """Create the session."""
+        await self.get_session()
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        stream: bool = False,
+    ) -> AsyncIterator[AiohttpResponse]:
+        """Send a request through the session.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            stream: Unused; aiohttp always reads the body on demand.
+
+        Yields:
+            The response.
+
+        Raises:
+            HoldedConnectionError: If the connection fails or drops.
+            HoldedTimeoutError: If the request times out.
+        """
+        session = await self.get_session()
+        timings = _Timings()
+        try:
+            async with session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=content,
+                ssl=True,
+                trace_request_ctx=timings,
+            ) as response:
+                yield AiohttpResponse(response, timings)
+        except asyncio.TimeoutError as e:
+            raise HoldedTimeoutError("Request timed out") from e
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise HoldedConnectionError(f"Connection error: {str(e)}") from e
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get the usage of the connection pool."""
+        connector = self.session.connector if self.session is not None and not self.session.closed else None
+        return connector_pool_stats(connector)
+
+    def reset_after_fork(self) -> None:
+        """Drop the inherited session; the next request creates a new one.
+
+        The inherited session is kept alive rather than closed, because closing
+        it would use the event loop of the parent.
+        """
+        if self.session is not None:
+            fork.keep_inherited(self.session)
+        self.session = None
+        self._session_lock = None
+
+    async def close(self) -> None:
+        """Close the session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
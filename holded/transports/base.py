@@ -0,0 +1,244 @@
+"""
+Transport interfaces used by the Holded clients.
+
+A transport sends one HTTP request and returns the response. The clients build
+URLs, serialize bodies, apply rate limits and retries, and map status codes to
+exceptions on top of it, so the HTTP library underneath can be swapped.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Iterator, Mapping, Optional, Union
+
+Content = Optional[Union[str, bytes]]
+
+# Shared by responses whose transport measures no phase
+NO_TIMINGS: Mapping[str, float] = MappingProxyType({})
+
+
+class TransportResponse(ABC):
+    """Response returned by a synchronous transport.
+
+    ``timings`` holds the durations in seconds of the network phases that the
+    transport measured: ``"pool_wait"``, ``"connect"``, ``"tls"``, ``"ttfb"``
+    and ``"download"``. Phases that did not happen, such as connecting on a
+    reused connection, are missing.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    timings: Mapping[str, float] = NO_TIMINGS
+
+    @property
+    @abstractmethod
+    def content(self) -> bytes:
+        """The raw response body."""
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Decode the response body as JSON.
+
+        Returns:
+            The decoded body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the response body as it is received.
+
+        Args:
+            chunk_size: Maximum number of bytes per chunk.
+
+        Yields:
+            The chunks of the body.
+        """
+        yield self.content
+
+    def close(self) -> None:
+        """Release the connection held by the response."""
+
+
+class AsyncTransportResponse(ABC):
+    """Response returned by an asynchronous transport.
+
+    ``timings`` holds the durations of the network phases that the transport
+    measured, like ``TransportResponse.timings``. It is complete once the body
+    has been read.
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    timings: Mapping[str, float] = NO_TIMINGS
+
+    @abstractmethod
+    async def read(self) -> bytes:
+        """Read the raw response body.
+
+        Returns:
+            The response body.
+        """
+
+    async def text(self) -> str:
+        """Read the response body as text.
+
+        Returns:
+            The decoded body.
+        """
+        return (await self.read()).decode("utf-8", errors="replace")
+
+    async def json(self) -> Any:
+        """Read the response body as JSON.
+
+        Returns:
+            The decoded body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(await self.read())
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Iterate over the response body as it is received.
+
+        Args:
+            chunk_size: Maximum number of bytes per chunk.
+
+        Yields:
+            The chunks of the body.
+        """
+        yield await self.read()
+
+
+class Transport(ABC):
+    """Interface for sending requests from the synchronous client.
+
+    Implementations must raise ``HoldedConnectionError`` or ``HoldedTimeoutError``
+    for network failures and return responses for every HTTP status.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.headers: Dict[str, str] = {}
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        """Send a request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            timeout: Optional timeout in seconds.
+            stream: Whether to leave the body unread so that ``iter_content``
+                can consume it as it arrives. The caller must close the response.
+
+        Returns:
+            The response.
+        """
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get the usage of the connection pool.
+
+        Returns:
+            A dictionary with the pool size, connections in use, idle connections,
+            the saturation and the same figures per host.
+        """
+        return {"size": 0, "in_use": 0, "idle": 0, "saturation": 0.0, "hosts": {}}
+
+    def ensure_pool_size(self, size: int) -> None:
+        """Grow the connection pool to keep at least ``size`` connections per host.
+
+        Transports whose pool cannot be resized ignore it.
+
+        Args:
+            size: The number of connections, such as the number of threads
+                sharing the transport.
+        """
+
+    def reset_after_fork(self) -> None:
+        """Drop the connections inherited from the parent process.
+
+        Called by the clients in a forked child, before it sends any request.
+        Implementations must not use the inherited connections, which the
+        parent still owns, and must keep their default headers.
+        """
+
+    def close(self) -> None:
+        """Close the transport and its connections."""
+
+
+class AsyncTransport(ABC):
+    """Interface for sending requests from the asynchronous client.
+
+    ``request`` returns an async context manager; the connection is released
+    when the block exits. Implementations must raise ``HoldedConnectionError``
+    or ``HoldedTimeoutError`` for network failures, including failures while
+    the body is read inside the block.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.headers: Dict[str, str] = {}
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        stream: bool = False,
+    ) -> AsyncContextManager[AsyncTransportResponse]:
+        """Send a request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            stream: Whether to leave the body unread so that ``iter_chunks``
+                can consume it as it arrives.
+
+        Returns:
+            An async context manager that yields the response.
+        """
+
+    async def open(self) -> None:
+        """Prepare the transport before the first request."""
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get the usage of the connection pool.
+
+        Returns:
+            A dictionary with the pool size, connections in use, idle connections,
+            the saturation and the same figures per host.
+        """
+        return {"size": 0, "in_use": 0, "idle": 0, "saturation": 0.0, "hosts": {}}
+
+    def reset_after_fork(self) -> None:
+        """Drop the connections inherited from the parent process.
+
+        Called by the clients in a forked child, outside of any event loop.
+        Implementations must not use the inherited connections, which the
+        parent still owns, and must keep their default headers.
+        """
+
+    async def close(self) -> None:
+        """Close the transport and its connections."""
@@ -0,0 +1,322 @@
+"""
+Transports backed by ``httpx``, with optional HTTP/2 multiplexing.
+
+Requires the optional dependency: ``pip install "holded-python[http2]"``.
+With HTTP/2 many concurrent requests share a single connection instead of
+opening one connection each.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Mapping, Optional
+
+from .. import fork
+from ..exceptions import HoldedConnectionError, HoldedTimeoutError
+from ..pooling import PoolConfig
+from .base import NO_TIMINGS, AsyncTransport, AsyncTransportResponse, Content, Transport, TransportResponse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None
+
+
+def _require_httpx() -> None:
+    """Raise a helpful error when httpx is not installed."""
+    if httpx is None:
+        raise ImportError(
+            'The httpx transports require httpx. Install them with: pip install "holded-python[http2]"'
+        )
+
+
+def _limits(pool_config: PoolConfig) -> "httpx.Limits":
+    """Translate pool settings into httpx limits.
+
+    Args:
+        pool_config: The connection pool settings.
+
+    Returns:
+        The httpx limits.
+    """
+    return httpx.Limits(
+        max_connections=pool_config.max_connections or None,
+        max_keepalive_connections=pool_config.max_connections_per_host,
+        keepalive_expiry=pool_config.keepalive_timeout,
+    )
+
+
+class _Trace:
+    """Collect the phase timings of one request from the ``trace`` extension of httpx."""
+
+    # Prefixes of the httpcore events for each phase
+    PHASES = {"connection.connect_tcp": "connect", "connection.start_tls": "tls"}
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self.headers_received: Optional[float] = None
+        self._started: Dict[str, float] = {}
+        self._sent = 0.0
+
+    def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        prefix, _, stage = name.rpartition(".")
+        phase = self.PHASES.get(prefix)
+        if phase is not None:
+            if stage == "started":
+                self._started[phase] = now
+            elif stage == "complete" and phase in self._started:
+                self.timings[phase] = now - self._started.pop(phase)
+        elif prefix.endswith(".send_request_headers") and stage == "started":
+            self._sent = now
+        elif prefix.endswith(".receive_response_headers") and stage == "complete":
+            self.timings["ttfb"] = now - self._sent
+            self.headers_received = now
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self(name, info)
+
+    def finish(self, stream: bool) -> Dict[str, float]:
+        """Record the download once ``send`` returns, unless the body is streamed."""
+        if not stream and self.headers_received is not None:
+            self.timings["download"] = time.perf_counter() - self.headers_received
+        return self.timings
+
+
+class HttpxResponse(TransportResponse):
+    """Response wrapping an ``httpx.Response``."""
+
+    def __init__(self, response: "httpx.Response", timings: Mapping[str, float] = NO_TIMINGS):
+        """Initialize the response.
+
+        Args:
+            response: The underlying response.
+            timings: The durations of the network phases.
+        """
+        self.raw = response
+        self.timings = timings
+
+    @property
+    def status_code(self) -> int:  # type: ignore[override]
+        """The HTTP status code."""
+        return self.raw.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:  # type: ignore[override]
+        """The response headers."""
+        return self.raw.headers
+
+    @property
+    def content(self) -> bytes:
+        """The raw response body."""
+        return self.raw.content
+
+    @property
+    def http_version(self) -> str:
+        """The HTTP version negotiated for the request."""
+        return self.raw.http_version
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the response body as it is received.
+
+        httpx yields the bytes as they arrive, so ``chunk_size`` is ignored.
+
+        Raises:
+            HoldedConnectionError: If the connection drops while reading.
+        """
+        try:
+            yield from self.raw.iter_bytes()
+        except httpx.TransportError as e:
+            raise HoldedConnectionError(message=f"Connection error: {str(e)}") from e
+
+    def close(self) -> None:
+        """Release the connection held by the response."""
+        self.raw.close()
+
+
+class AsyncHttpxResponse(AsyncTransportResponse):
+    """Response wrapping an ``httpx.Response`` read by an async client."""
+
+    def __init__(self, response: "httpx.Response", timings: Mapping[str, float] = NO_TIMINGS):
+        """Initialize the response.
+
+        Args:
+            response: The underlying response.
+            timings: The durations of the network phases.
+        """
+        self.raw = response
+        self.timings = timings
+
+    @property
+    def status(self) -> int:  # type: ignore[override]
+        """The HTTP status code."""
+        return self.raw.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:  # type: ignore[override]
+        """The response headers."""
+        return self.raw.headers
+
+    @property
+    def http_version(self) -> str:
+        """The HTTP version negotiated for the request."""
+        return self.raw.http_version
+
+    async def read(self) -> bytes:
+        """Read the raw response body."""
+        return await self.raw.aread()
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Iterate over the response body as it is received; ``chunk_size`` is ignored."""
+        async for chunk in self.raw.aiter_bytes():
+            yield chunk
+
+
+class HttpxTransport(Transport):
+    """Synchronous transport backed by an ``httpx.Client``."""
+
+    def __init__(self, http2: bool = True, pool_config: Optional[PoolConfig] = None):
+        """Initialize the transport.
+
+        Args:
+            http2: Whether to negotiate HTTP/2 with the server.
+            pool_config: Optional connection pool settings.
+        """
+        _require_httpx()
+        self.http2 = http2
+        self.pool_config = pool_config or PoolConfig()
+        self.client = httpx.Client(http2=http2, limits=_limits(self.pool_config))
+
+    @property
+    def headers(self) -> Any:  # type: ignore[override]
+        """The default headers of the client."""
+        return self.client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> HttpxResponse:
+        """Send a request through the client.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            timeout: Optional timeout in seconds.
+            stream: Whether to leave the body unread until ``iter_content``.
+
+        Returns:
+            The response.
+
+        Raises:
+            HoldedConnectionError: If the connection fails.
+            HoldedTimeoutError: If the request times out.
+        """
+        trace = _Trace()
+        try:
+            request = self.client.build_request(
+                method, url, params=params, content=content, timeout=timeout, extensions={"trace": trace}
+            )
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as e:
+            raise HoldedTimeoutError(message=f"Request timed out: {str(e)}") from e
+        except httpx.TransportError as e:
+            raise HoldedConnectionError(message=f"Connection error: {str(e)}") from e
+        return HttpxResponse(response, trace.finish(stream))
+
+    def reset_after_fork(self) -> None:
+        """Replace the inherited client with a new one that has the same headers."""
+        headers = self.client.headers
+        self.client = httpx.Client(http2=self.http2, limits=_limits(self.pool_config))
+        self.client.headers = headers
+
+    def close(self) -> None:
+        """Close the client."""
+        self.client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """Asynchronous transport backed by an ``httpx.AsyncClient``."""
+
+    def __init__(self, http2: bool = True, timeout: float = 30, pool_config: Optional[PoolConfig] = None):
+        """Initialize the transport.
+
+        Args:
+            http2: Whether to negotiate HTTP/2 with the server.
+            timeout: Request timeout in seconds.
+            pool_config: Optional connection pool settings.
+        """
+        _require_httpx()
+        self.http2 = http2
+        self.timeout = timeout
+        self.pool_config = pool_config or PoolConfig()
+        self.client = httpx.AsyncClient(http2=http2, timeout=timeout, limits=_limits(self.pool_config))
+
+    @property
+    def headers(self) -> Any:  # type: ignore[override]
+        """The default headers of the client."""
+        return self.client.headers
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        stream: bool = False,
+    ) -> AsyncIterator[AsyncHttpxResponse]:
+        """Send a request through the client.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            stream: Whether to leave the body unread until ``iter_chunks``.
+
+        Yields:
+            The response.
+
+        Raises:
+            HoldedConnectionError: If the connection fails or drops.
+            HoldedTimeoutError: If the request times out.
+        """
+        trace = _Trace()
+        try:
+            request = self.client.build_request(
+                method, url, params=params, content=content, extensions={"trace": trace.atrace}
+            )
+            response = await self.client.send(request, stream=stream)
+        except httpx.TimeoutException as e:
+            raise HoldedTimeoutError("Request timed out") from e
+        except httpx.TransportError as e:
+            raise HoldedConnectionError(f"Connection error: {str(e)}") from e
+        try:
+            yield AsyncHttpxResponse(response, trace.finish(stream))
+        except httpx.TimeoutException as e:
+            raise HoldedTimeoutError("Request timed out") from e
+        except httpx.TransportError as e:
+            raise HoldedConnectionError(f"Connection error: {str(e)}") from e
+        finally:
+            await response.aclose()
+
+    def reset_after_fork(self) -> None:
+        """Replace the inherited client with a new one that has the same headers.
+
+        The inherited client is kept alive rather than closed, because closing
+        it would use the event loop of the parent.
+        """
+        headers = self.client.headers
+        fork.keep_inherited(self.client)
+        self.client = httpx.AsyncClient(http2=self.http2, timeout=self.timeout, limits=_limits(self.pool_config))
+        self.client.headers = headers
+
+    async def close(self) -> None:
+        """Close the client."""
+        await self.client.aclose()
@@ -0,0 +1,174 @@
+"""
+In-memory transports for tests.
+
+The handler receives a ``MemoryRequest`` and returns a ``MemoryResponse``; no
+network connection is opened.
+"""
+
+import inspect
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Union
+
+from .base import AsyncTransport, AsyncTransportResponse, Content, Transport, TransportResponse
+
+
+class MemoryRequest:
+    """Request received by an in-memory transport handler."""
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        content: Content,
+        headers: Mapping[str, str],
+    ):
+        """Initialize the request.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: The query parameters.
+            content: The request body.
+            headers: The default headers of the transport.
+        """
+        self.method = method
+        self.url = url
+        self.params = params or {}
+        self.content = content.encode("utf-8") if isinstance(content, str) else content
+        self.headers = dict(headers)
+
+    def json(self) -> Any:
+        """Decode the request body as JSON.
+
+        Returns:
+            The decoded body, or None if the request has no body.
+        """
+        return json.loads(self.content) if self.content else None
+
+
+class MemoryResponse:
+    """Response returned by an in-memory transport handler."""
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Any = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize the response.
+
+        Args:
+            status_code: The HTTP status code.
+            json_data: Data to send as a JSON body.
+            content: Raw body, used when ``json_data`` is None.
+            headers: Response headers.
+        """
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        if json_data is not None:
+            self.content = json.dumps(json_data).encode("utf-8")
+            self.headers.setdefault("Content-Type", "application/json")
+        else:
+            self.content = content or b""
+
+
+class _SyncMemoryResponse(TransportResponse):
+    """Adapt a ``MemoryResponse`` to the synchronous response interface."""
+
+    def __init__(self, response: MemoryResponse):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self._content = response.content
+
+    @property
+    def content(self) -> bytes:
+        """The raw response body."""
+        return self._content
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the response body in chunks."""
+        for start in range(0, len(self._content), chunk_size):
+            yield self._content[start : start + chunk_size]
+
+
+class _AsyncMemoryResponse(AsyncTransportResponse):
+    """Adapt a ``MemoryResponse`` to the asynchronous response interface."""
+
+    def __init__(self, response: MemoryResponse):
+        self.status = response.status_code
+        self.headers = response.headers
+        self._content = response.content
+
+    async def read(self) -> bytes:
+        """Read the raw response body."""
+        return self._content
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Iterate over the response body in chunks."""
+        for start in range(0, len(self._content), chunk_size):
+            yield self._content[start : start + chunk_size]
+
+
+Handler = Callable[[MemoryRequest], Union[MemoryResponse, Awaitable[MemoryResponse]]]
+
+
+class MemoryTransport(Transport):
+    """Synchronous transport that calls a handler instead of the network."""
+
+    def __init__(self, handler: Callable[[MemoryRequest], MemoryResponse]):
+        """Initialize the transport.
+
+        Args:
+            handler: Function that turns a request into a response.
+        """
+        super().__init__()
+        self.handler = handler
+        self.requests: List[MemoryRequest] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> TransportResponse:
+        """Pass the request to the handler and record it."""
+        request = MemoryRequest(method, url, params, content, self.headers)
+        self.requests.append(request)
+        return _SyncMemoryResponse(self.handler(request))
+
+
+class AsyncMemoryTransport(AsyncTransport):
+    """Asynchronous transport that calls a handler instead of the network."""
+
+    def __init__(self, handler: Handler):
+        """Initialize the transport.
+
+        Args:
+            handler: Function or coroutine function that turns a request into a response.
+        """
+        super().__init__()
+        self.handler = handler
+        self.requests: List[MemoryRequest] = []
+
+    @asynccontextmanager
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        stream: bool = False,
+    ) -> AsyncIterator[AsyncTransportResponse]:
+        """Pass the request to the handler and record it."""
+        request = MemoryRequest(method, url, params, content, self.headers)
+        self.requests.append(request)
+        response = self.handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        yield _AsyncMemoryResponse(response)
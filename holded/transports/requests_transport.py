@@ -0,0 +1,288 @@
+"""
+Transport backed by ``requests``.
+"""
+
+import threading
+import time
+import weakref
+from datetime import timedelta
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..exceptions import HoldedConnectionError, HoldedTimeoutError
+from ..pooling import PoolConfig, adapter_pool_stats
+from .base import NO_TIMINGS, Content, Transport, TransportResponse
+
+# Phases measured by the connections of the calling thread's current request
+_current = threading.local()
+
+
+def _record(phase: str, seconds: float) -> None:
+    """Add a phase duration to the timings of the current request, if any."""
+    timings = getattr(_current, "timings", None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Connection that records how long opening the socket takes."""
+
+    _connect_time = 0.0
+
+    def _new_conn(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._connect_time = time.perf_counter() - start
+            _record("connect", self._connect_time)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """Connection that records how long opening the socket and the TLS handshake take."""
+
+    _connect_time = 0.0
+
+    def _new_conn(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self._connect_time = time.perf_counter() - start
+            _record("connect", self._connect_time)
+
+    def connect(self) -> None:
+        self._connect_time = 0.0
+        start = time.perf_counter()
+        super().connect()
+        _record("tls", time.perf_counter() - start - self._connect_time)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """Pool of ``TimedHTTPConnection``."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Pool of ``TimedHTTPSConnection``."""
+
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Adapter whose connections record the connect and TLS handshake times."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class RequestsResponse(TransportResponse):
+    """Response wrapping a ``requests.Response``."""
+
+    def __init__(self, response: requests.Response, timings: Mapping[str, float] = NO_TIMINGS):
+        """Initialize the response.
+
+        Args:
+            response: The underlying response.
+            timings: The durations of the network phases.
+        """
+        self.raw = response
+        self.timings = timings
+
+    @property
+    def status_code(self) -> int:  # type: ignore[override]
+        """The HTTP status code."""
+        return self.raw.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:  # type: ignore[override]
+        """The response headers."""
+        return self.raw.headers
+
+    @property
+    def content(self) -> bytes:
+        """The raw response body."""
+        return self.raw.content
+
+    @property
+    def text(self) -> str:
+        """The response body decoded as text."""
+        return self.raw.text
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return self.raw.json()
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the response body as it is received.
+
+        Raises:
+            HoldedConnectionError: If the connection drops while reading.
+        """
+        try:
+            yield from self.raw.iter_content(chunk_size)
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            raise HoldedConnectionError(message=f"Connection error: {str(e)}") from e
+
+    def close(self) -> None:
+        """Release the connection held by the response."""
+        self.raw.close()
+
+
+class RequestsTransport(Transport):
+    """Synchronous transport backed by a ``requests.Session``.
+
+    This is the default transport of ``HoldedClient``. A ``requests.Session``
+    is not guaranteed to be thread-safe; with ``session_per_thread`` every
+    thread gets its own session, with its own cookies, while all of them share
+    one adapter and therefore one connection pool.
+    """
+
+    def __init__(self, pool_config: Optional[PoolConfig] = None, session_per_thread: bool = False):
+        """Initialize the transport.
+
+        Args:
+            pool_config: Optional connection pool settings.
+            session_per_thread: Whether to give every thread its own session
+                over the shared connection pool.
+        """
+        self.pool_config = pool_config or PoolConfig()
+        self.session_per_thread = session_per_thread
+        self._adapter = self.pool_config.create_adapter(TimedHTTPAdapter)
+        self._headers = requests.utils.default_headers()
+        self._local = threading.local()
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._shared_session = None if session_per_thread else self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session that uses the shared adapter and headers."""
+        session = requests.Session()
+        session.headers = self._headers
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        with self._lock:
+            self._sessions.add(session)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used by the calling thread."""
+        if self._shared_session is not None:
+            return self._shared_session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._create_session()
+        return session
+
+    @property
+    def headers(self) -> Any:  # type: ignore[override]
+        """The default headers, shared by every session."""
+        return self._headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Content = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> RequestsResponse:
+        """Send a request through the session.
+
+        Args:
+            method: The HTTP method.
+            url: The full URL.
+            params: Optional query parameters.
+            content: Optional request body.
+            timeout: Optional timeout in seconds.
+            stream: Whether to leave the body unread until ``iter_content``.
+
+        Returns:
+            The response.
+
+        Raises:
+            HoldedConnectionError: If the connection fails or drops while reading the body.
+            HoldedTimeoutError: If the request times out.
+        """
+        timings: Dict[str, float] = {}
+        _current.timings = timings
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=content,
+                timeout=timeout,
+                stream=stream,
+            )
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.SSLError,
+            # The connection dropped while the body was read
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            raise HoldedConnectionError(message=f"Connection error: {str(e)}") from e
+        except requests.exceptions.Timeout as e:
+            raise HoldedTimeoutError(message=f"Request timed out: {str(e)}") from e
+        finally:
+            _current.timings = None
+        # ``elapsed`` runs until the headers are parsed; the body is read after it.
+        # Sessions with custom adapters may not set it.
+        if isinstance(response.elapsed, timedelta):
+            headers_received = response.elapsed.total_seconds()
+            timings["ttfb"] = max(0.0, headers_received - timings.get("connect", 0.0) - timings.get("tls", 0.0))
+            if not stream:
+                timings["download"] = max(0.0, time.perf_counter() - start - headers_received)
+        return RequestsResponse(response, timings)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get the usage of the connection pool."""
+        return adapter_pool_stats(self._adapter)
+
+    def ensure_pool_size(self, size: int) -> None:
+        """Grow the connection pool to keep at least ``size`` connections per host.
+
+        Idle connections of the previous pool are closed.
+        """
+        with self._lock:
+            adapter = self._adapter
+            if adapter._pool_maxsize >= size:
+                return
+            previous = adapter.poolmanager
+            adapter.init_poolmanager(adapter._pool_connections, size, block=adapter._pool_block)
+        previous.clear()
+
+    def reset_after_fork(self) -> None:
+        """Create new sessions over a new connection pool of the same size.
+
+        The inherited sessions are dropped without being closed; collecting
+        them closes the child's copies of the sockets, which leaves the
+        parent's connections open.
+        """
+        previous = self._adapter
+        self._lock = threading.Lock()
+        self._adapter = self.pool_config.create_adapter(TimedHTTPAdapter)
+        self._local = threading.local()
+        self._sessions = weakref.WeakSet()
+        self._shared_session = None if self.session_per_thread else self._create_session()
+        self.ensure_pool_size(previous._pool_maxsize)
+
+    def close(self) -> None:
+        """Close every session and the shared connection pool."""
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+        self._adapter.close()
@@ -0,0 +1,191 @@
+"""
+Validation modes for response models.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, RootModel, ValidationError
+from typing_extensions import get_args, get_origin
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Validate every response (the default)
+FULL = "full"
+# Validate one in every ``sample_rate`` responses and log schema drift
+SAMPLED = "sampled"
+# Build models without validation
+TRUSTED = "trusted"
+
+VALIDATION_MODES = (FULL, SAMPLED, TRUSTED)
+
+Converter = Callable[[Any], Any]
+
+
+def _converter(annotation: Any) -> Optional[Converter]:
+    """Build a function that turns raw data into the models inside an annotation.
+
+    Args:
+        annotation: The type annotation of a field.
+
+    Returns:
+        The converter, or None if the annotation contains no model or is
+        ambiguous (such as a union of several models).
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: construct(model, value) if isinstance(value, dict) else value
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        candidates = [arg for arg in args if arg is not type(None)]
+        return _converter(candidates[0]) if len(candidates) == 1 else None
+    if origin in (list, tuple, set, frozenset) and args:
+        item = _converter(args[0])
+        if item is None:
+            return None
+        return lambda value: [item(element) for element in value] if isinstance(value, list) else value
+    if origin is dict and len(args) == 2:
+        item = _converter(args[1])
+        if item is None:
+            return None
+        return lambda value: (
+            {key: item(element) for key, element in value.items()} if isinstance(value, dict) else value
+        )
+    return None
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> Dict[str, Converter]:
+    """Find the fields of a model that hold other models.
+
+    Args:
+        model: The model class.
+
+    Returns:
+        The converter for every key (alias and field name) that holds models.
+    """
+    plan = {}
+    for name, field in model.model_fields.items():
+        converter = _converter(field.annotation)
+        if converter is not None:
+            plan[name] = converter
+            if field.alias:
+                plan[field.alias] = converter
+    return plan
+
+
+def construct(model: Type[T], data: Any) -> T:
+    """Build a model from trusted data without validating it.
+
+    Nested models are built as well, except inside unions of several models,
+    which are left as plain data. Values are not coerced, so dates stay strings.
+
+    Args:
+        model: The model class.
+        data: The decoded response data.
+
+    Returns:
+        The model instance.
+    """
+    if issubclass(model, RootModel):  # type: ignore[arg-type]
+        converter = _converter(model.model_fields["root"].annotation)  # type: ignore[attr-defined]
+        return model.model_construct(converter(data) if converter else data)  # type: ignore[attr-defined]
+    if not isinstance(data, dict):
+        # Nothing sensible can be built; let validation report the problem
+        return model.model_validate(data)  # type: ignore[attr-defined]
+    values = dict(data)
+    for key, converter in _plan(model).items():  # type: ignore[arg-type]
+        if key in values:
+            values[key] = converter(values[key])
+    return model.model_construct(**values)  # type: ignore[attr-defined]
+
+
+class ResponseValidator:
+    """Turn decoded responses into models according to a validation mode.
+
+    ``"full"`` validates every response. ``"sampled"`` validates one in every
+    ``sample_rate`` responses, logs a warning when the data no longer matches
+    the model, and builds the other responses without validation.
+    ``"trusted"`` never validates.
+    """
+
+    def __init__(self, mode: str = FULL, sample_rate: int = 100):
+        """Initialize the validator.
+
+        Args:
+            mode: The default validation mode.
+            sample_rate: How often responses are validated in ``"sampled"`` mode.
+
+        Raises:
+            ValueError: If the mode is unknown or the sample rate is not positive.
+        """
+        self.mode = self._check_mode(mode)
+        if sample_rate < 1:
+            raise ValueError("sample_rate must be at least 1")
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._validated = 0
+        self._constructed = 0
+        self._drift = 0
+
+    @staticmethod
+    def _check_mode(mode: str) -> str:
+        """Reject unknown validation modes."""
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode: {mode}. Use one of {', '.join(VALIDATION_MODES)}")
+        return mode
+
+    def validate(self, model: Type[T], data: Any, mode: Optional[str] = None) -> T:
+        """Turn decoded response data into a model.
+
+        Args:
+            model: The model class.
+            data: The decoded response data.
+            mode: Optional mode for this response, overriding the default.
+
+        Returns:
+            The model instance.
+
+        Raises:
+            ValidationError: If the data is invalid in ``"full"`` mode.
+        """
+        mode = self._check_mode(mode) if mode is not None else self.mode
+        if mode == FULL:
+            with self._lock:
+                self._validated += 1
+            return model.model_validate(data)  # type: ignore[attr-defined]
+
+        if mode == SAMPLED:
+            with self._lock:
+                sample = self._seen % self.sample_rate == 0
+                self._seen += 1
+            if sample:
+                with self._lock:
+                    self._validated += 1
+                try:
+                    return model.model_validate(data)  # type: ignore[attr-defined]
+                except ValidationError as e:
+                    with self._lock:
+                        self._drift += 1
+                    logger.warning(f"Response no longer matches {model.__name__}: {e}")
+
+        with self._lock:
+            self._constructed += 1
+        return construct(model, data)
+
+    def stats(self) -> Dict[str, int]:
+        """Get usage statistics.
+
+        Returns:
+            A dictionary with the number of validated responses, responses built
+            without validation, and sampled responses that failed validation.
+        """
+        with self._lock:
+            return {"validated": self._validated, "constructed": self._constructed, "drift": self._drift}
@@ -44,6 +44,10 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "http2": ["httpx[http2]>=0.23.0"],
+        "speedups": ["orjson>=3.6.0"],
+    },
     keywords=["holded", "api", "wrapper", "client", "erp", "crm"],
     include_package_data=True,
 )
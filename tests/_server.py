@@ -0,0 +1,32 @@
+"""
+Local HTTP server shared by the tests that need real connections.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Type
+
+
+class LocalServerMixin:
+    """Serve ``handler`` on a local HTTP server for the tests of a ``unittest.TestCase``.
+
+    The server and its ``base_url`` are class attributes, started once for the
+    class and stopped after its last test.
+    """
+
+    handler: Type[BaseHTTPRequestHandler]
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a local HTTP server."""
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), cls.handler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/api/"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the local HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
@@ -3,6 +3,7 @@ Unit tests for the Holded async client.
 """
 
 import asyncio
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -36,16 +37,36 @@ class TestAsyncHoldedClient(unittest.TestCase):
         self.assertIsNone(self.client.session)  # Session is created on first request
         self.assertEqual(self.client.headers["Key"], self.api_key)
 
+    def test_concurrent_session_creation(self):
+        """Test that concurrent first calls share one session."""
+
+        async def create_sessions():
+            return await asyncio.gather(*(self.client.transport.get_session() for _ in range(10)))
+
+        sessions = self.loop.run_until_complete(create_sessions())
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+
+    def test_async_context_manager(self):
+        """Test that the client opens and closes its session in an async with block."""
+
+        async def use_client():
+            async with AsyncHoldedClient(api_key=self.api_key) as client:
+                self.assertFalse(client.session.closed)
+            return client
+
+        client = self.loop.run_until_complete(use_client())
+        self.assertTrue(client.session.closed)
+
     @patch("aiohttp.ClientSession.request")
     def test_get(self, mock_request):
         """Test GET request."""
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"id": "123", "name": "Test"}
+        async def mock_read():
+            return json.dumps({"id": "123", "name": "Test"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -64,10 +85,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"id": "123", "name": "Test"}
+        async def mock_read():
+            return json.dumps({"id": "123", "name": "Test"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -87,10 +108,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"id": "123", "name": "Updated"}
+        async def mock_read():
+            return json.dumps({"id": "123", "name": "Updated"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -110,10 +131,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"success": True}
+        async def mock_read():
+            return json.dumps({"success": True}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -132,10 +153,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"error": "Invalid API key"}
+        async def mock_read():
+            return json.dumps({"error": "Invalid API key"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 401
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -150,10 +171,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"error": "Resource not found"}
+        async def mock_read():
+            return json.dumps({"error": "Resource not found"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 404
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -168,10 +189,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"error": "Validation failed"}
+        async def mock_read():
+            return json.dumps({"error": "Validation failed"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 422
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -186,10 +207,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"error": "Rate limit exceeded"}
+        async def mock_read():
+            return json.dumps({"error": "Rate limit exceeded"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 429
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -204,10 +225,10 @@ class TestAsyncHoldedClient(unittest.TestCase):
         # Setup mock
         mock_response = MagicMock()
 
-        async def mock_json():
-            return {"error": "Internal server error"}
+        async def mock_read():
+            return json.dumps({"error": "Internal server error"}).encode()
 
-        mock_response.json = mock_json
+        mock_response.read = mock_read
         mock_response.status = 500
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
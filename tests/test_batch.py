@@ -0,0 +1,179 @@
+"""
+Unit tests for batch operations.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from holded.async_client import AsyncHoldedClient
+from holded.batch import arun_batch, run_batch
+from holded.client import HoldedClient
+from holded.exceptions import HoldedAuthError, HoldedNotFoundError, HoldedValidationError
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+
+def _handler(request):
+    record_id = request.url.rstrip("/").rsplit("/", 1)[-1]
+    if record_id.startswith("missing"):
+        return MemoryResponse(404, json_data={"message": "Not found"})
+    return MemoryResponse(json_data={"id": record_id})
+
+
+class TestBatch(unittest.TestCase):
+    """Test cases for the batch helpers."""
+
+    def test_run_batch_is_concurrent(self):
+        """Test that calls run on several threads and keep input order."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fn(item):
+            with lock:
+                active.append(item)
+                peak.append(len(active))
+            time.sleep(0.02 if item % 2 else 0.01)
+            with lock:
+                active.remove(item)
+            return item * 2
+
+        result = run_batch(fn, range(8), concurrency=4)
+        self.assertEqual(list(result), [item * 2 for item in range(8)])
+        self.assertLessEqual(max(peak), 4)
+        self.assertGreater(max(peak), 1)
+        self.assertTrue(result.ok)
+
+    def test_arun_batch_bounds_concurrency(self):
+        """Test that at most ``concurrency`` coroutines run at once."""
+        active = [0]
+        peak = [0]
+
+        async def fn(item):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.001)
+            active[0] -= 1
+            return item
+
+        result = asyncio.run(arun_batch(fn, list(range(50)), concurrency=5))
+        self.assertEqual(list(result), list(range(50)))
+        self.assertEqual(peak[0], 5)
+
+
+class TestGetMany(unittest.TestCase):
+    """Test cases for get_many on the resources."""
+
+    def test_sync_get_many(self):
+        """Test that failed IDs are collected without aborting the batch."""
+        client = HoldedClient(api_key="key", transport=MemoryTransport(_handler))
+        result = client.contacts.get_many(["1", "missing", "3"], concurrency=2)
+
+        self.assertEqual(list(result), [{"id": "1"}, None, {"id": "3"}])
+        self.assertFalse(result.ok)
+        self.assertEqual(result.successes(), [{"id": "1"}, {"id": "3"}])
+        failures = result.failures()
+        self.assertEqual(failures[0][0], "missing")
+        self.assertIsInstance(failures[0][1], HoldedNotFoundError)
+        with self.assertRaises(HoldedNotFoundError):
+            result.raise_for_errors()
+
+    def test_async_get_many_with_extra_arguments(self):
+        """Test that extra arguments are passed on to get."""
+        transport = AsyncMemoryTransport(_handler)
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=transport)
+            return await client.documents.get_many(["a", "b"], "invoice")
+
+        result = asyncio.run(run())
+        self.assertEqual(list(result), [{"id": "a"}, {"id": "b"}])
+        self.assertTrue(all("/documents/invoice/" in request.url for request in transport.requests))
+
+    def test_get_many_with_parent_id(self):
+        """Test that time tracking entries are fetched under their project on both clients."""
+        transport = MemoryTransport(_handler)
+        client = HoldedClient(api_key="key", transport=transport)
+        self.assertEqual(list(client.time_tracking.get_many(["t1", "t2"], "p1")), [{"id": "t1"}, {"id": "t2"}])
+        self.assertTrue(all("/projects/p1/times/t" in request.url for request in transport.requests))
+
+        async_transport = AsyncMemoryTransport(_handler)
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=async_transport)
+            return await client.time_tracking.get_many(["t1"], "p1", concurrency=1)
+
+        self.assertEqual(list(asyncio.run(run())), [{"id": "t1"}])
+        self.assertIn("/projects/p1/times/t1", async_transport.requests[0].url)
+
+
+class TestWriteMany(unittest.TestCase):
+    """Test cases for create_many and update_many on the resources."""
+
+    def test_create_many_collects_errors(self):
+        """Test that a validation error does not stop the batch."""
+
+        def handler(request):
+            if not request.json().get("name"):
+                return MemoryResponse(422, json_data={"message": "name is required"})
+            return MemoryResponse(json_data={"id": request.json()["name"]})
+
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler))
+        items = [{"name": "a"}, {"name": ""}, {"name": "c"}]
+        outcomes = sorted(client.products.create_many(items, concurrency=2), key=lambda outcome: outcome.index)
+
+        self.assertEqual([outcome.ok for outcome in outcomes], [True, False, True])
+        self.assertEqual(outcomes[2].result, {"id": "c"})
+        self.assertIsInstance(outcomes[1].error, HoldedValidationError)
+        self.assertTrue(all(outcome.elapsed >= 0 for outcome in outcomes))
+
+    def test_fatal_error_cancels_rest(self):
+        """Test that an authentication error cancels the items not yet started."""
+        transport = MemoryTransport(lambda request: MemoryResponse(401, json_data={"message": "Bad key"}))
+        client = HoldedClient(api_key="key", transport=transport)
+        outcomes = list(client.contacts.update_many([(str(i), {"name": "x"}) for i in range(10)], concurrency=2))
+
+        self.assertEqual(len(outcomes), 10)
+        self.assertLessEqual(len(transport.requests), 3)
+        self.assertTrue(all(outcome.cancelled for outcome in outcomes[len(transport.requests) :]))
+        self.assertIsInstance(outcomes[0].error, HoldedAuthError)
+
+    def test_update_many_with_parent_id(self):
+        """Test that time tracking entries are updated under their project on both clients."""
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data={"url": request.url}))
+        client = HoldedClient(api_key="key", transport=transport)
+        outcomes = list(client.time_tracking.update_many([("t1", {"duration": 60})], "p1"))
+        self.assertTrue(outcomes[0].ok)
+        self.assertTrue(transport.requests[0].url.endswith("/projects/p1/times/t1"))
+
+        async_transport = AsyncMemoryTransport(lambda request: MemoryResponse(json_data={}))
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=async_transport)
+            return [outcome async for outcome in client.time_tracking.update_many([("t1", {"duration": 60})], "p1")]
+
+        self.assertTrue(asyncio.run(run())[0].ok)
+        self.assertTrue(async_transport.requests[0].url.endswith("/projects/p1/times/t1"))
+
+    def test_async_create_many(self):
+        """Test that extra arguments go before the data and the rate is capped."""
+        transport = AsyncMemoryTransport(lambda request: MemoryResponse(json_data={"url": request.url}))
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=transport)
+            start = time.monotonic()
+            outcomes = [
+                outcome
+                async for outcome in client.documents.create_many([{}, {}, {}], "invoice", rate_limit=50)
+            ]
+            return outcomes, time.monotonic() - start
+
+        outcomes, elapsed = asyncio.run(run())
+        self.assertTrue(all(outcome.ok for outcome in outcomes))
+        self.assertTrue(all("/documents/invoice" in request.url for request in transport.requests))
+        self.assertGreaterEqual(elapsed, 0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the benchmark suite.
+"""
+
+import json
+import unittest
+
+from holded.bench import WORKLOADS, Workload, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for run_benchmarks."""
+
+    def test_every_workload_and_client(self):
+        """Test that every workload runs with every client setup."""
+        report = run_benchmarks(requests=10, warmup=2, threads=(2,), concurrency=(4,), isolate=False)
+
+        results = report["results"]
+        self.assertEqual(len(results), len(WORKLOADS) * 3)
+        self.assertEqual(
+            [(result["client"], result["concurrency"]) for result in results[:3]],
+            [("sync", 1), ("threads", 2), ("async", 4)],
+        )
+        for result in results:
+            with self.subTest(workload=result["workload"], client=result["client"]):
+                self.assertEqual(result["requests"], 10)
+                self.assertEqual(result["errors"], 0)
+                self.assertEqual(result["attempts"], {"2xx": 10})
+                self.assertGreater(result["requests_per_second"], 0)
+                self.assertLessEqual(result["latency_ms"]["p50"], result["latency_ms"]["p99"])
+                self.assertNotIn("vs_healthy", result)
+        json.dumps(report)
+
+    def test_profiles_are_compared_with_healthy(self):
+        """Test that results under faults are compared with a healthy run."""
+        report = run_benchmarks(
+            workloads=["read-heavy"],
+            clients=["async"],
+            concurrency=(4,),
+            profiles=["slow"],
+            requests=20,
+            isolate=False,
+        )
+
+        healthy, slow = report["results"]
+        self.assertEqual((healthy["profile"], slow["profile"]), ("healthy", "slow"))
+        self.assertEqual(set(slow["vs_healthy"]), {"throughput", "p99", "error_rate"})
+        self.assertEqual(slow["faults"], {"slow_responses": 1})
+
+    def test_isolated_processes(self):
+        """Test a scenario run in its own process against a server in another."""
+        report = run_benchmarks(workloads=["write-heavy"], clients=["sync"], requests=5, warmup=1)
+
+        (result,) = report["results"]
+        self.assertEqual(result["attempts"], {"2xx": 5})
+        self.assertTrue(report["settings"]["isolate"])
+
+    def test_unknown_names(self):
+        """Test that unknown workloads and profiles are rejected."""
+        with self.assertRaises(ValueError):
+            run_benchmarks(workloads=["unknown"])
+        with self.assertRaises(ValueError):
+            run_benchmarks(profiles=["unknown"])
+
+    def test_workloads_must_send_requests(self):
+        """Test that a workload without ``call`` cannot be created."""
+
+        class Empty(Workload):
+            name = "empty"
+
+        with self.assertRaises(TypeError):
+            Empty()
+
+
+if __name__ == "__main__":
+    unittest.main()
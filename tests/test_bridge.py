@@ -0,0 +1,112 @@
+"""
+Unit tests for the sync-over-async bridge.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from holded.bridge import AsyncBridge
+from holded.exceptions import HoldedNotFoundError
+from holded.transports import AsyncMemoryTransport, MemoryResponse
+
+DELAY = 0.05
+
+
+async def _handler(request):
+    await asyncio.sleep(DELAY)
+    record_id = request.url.rstrip("/").rsplit("/", 1)[-1]
+    if record_id.startswith("missing"):
+        return MemoryResponse(404, json_data={"message": "Not found"})
+    if record_id == "invoice":
+        return MemoryResponse(json_data=[{"id": str(index)} for index in range(5)])
+    return MemoryResponse(json_data={"id": record_id, "thread": threading.current_thread().name})
+
+
+class TestAsyncBridge(unittest.TestCase):
+    """Test cases for AsyncBridge."""
+
+    def setUp(self):
+        """Set up a bridge over an in-memory transport."""
+        self.bridge = AsyncBridge(api_key="key", transport=AsyncMemoryTransport(_handler))
+
+    def tearDown(self):
+        """Close the bridge."""
+        self.bridge.close()
+
+    def test_blocking_calls(self):
+        """Test that resource and raw calls block and run on the loop thread."""
+        contact = self.bridge.contacts.get("c1")
+        raw = self.bridge.get("invoicing/contacts/c2")
+
+        self.assertEqual(contact["id"], "c1")
+        self.assertEqual(contact["thread"], "holded-async-bridge")
+        self.assertEqual(raw["id"], "c2")
+        with self.assertRaises(HoldedNotFoundError):
+            self.bridge.contacts.get("missing")
+
+    def test_run_many_is_concurrent(self):
+        """Test that run_many overlaps the calls on one thread."""
+        threads = threading.active_count()
+        start = time.monotonic()
+        results = self.bridge.run_many(self.bridge.client.contacts.get(f"c{index}") for index in range(50))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([result["id"] for result in results], [f"c{index}" for index in range(50)])
+        self.assertLess(elapsed, DELAY * 10)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_run_many_concurrency(self):
+        """Test that the concurrency cap bounds the calls running at once."""
+        start = time.monotonic()
+        self.bridge.run_many((self.bridge.client.contacts.get(str(index)) for index in range(4)), concurrency=2)
+
+        self.assertGreaterEqual(time.monotonic() - start, DELAY * 2)
+
+    def test_run_many_errors(self):
+        """Test that run_many raises the first error or returns errors in place."""
+        contacts = self.bridge.client.contacts
+        with self.assertRaises(HoldedNotFoundError):
+            self.bridge.run_many([contacts.get("a"), contacts.get("missing")])
+
+        results = self.bridge.run_many([contacts.get("a"), contacts.get("missing")], return_exceptions=True)
+        self.assertEqual(results[0]["id"], "a")
+        self.assertIsInstance(results[1], HoldedNotFoundError)
+
+    def test_async_iterators_become_blocking(self):
+        """Test that methods returning async iterators return blocking iterators."""
+        documents = self.bridge.documents.stream_list("invoice")
+
+        self.assertEqual([document["id"] for document in documents], ["0", "1", "2", "3", "4"])
+
+    def test_submit(self):
+        """Test that submit returns a future without waiting."""
+        future = self.bridge.submit(self.bridge.client.contacts.get("c1"))
+
+        self.assertEqual(future.result()["id"], "c1")
+
+    def test_run_from_loop_thread(self):
+        """Test that blocking on the loop from the loop itself is refused."""
+
+        async def nested():
+            return self.bridge.run(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            self.bridge.run(nested())
+
+    def test_close(self):
+        """Test that close stops the loop thread and refuses new calls."""
+        bridge = AsyncBridge(api_key="key", transport=AsyncMemoryTransport(_handler))
+        thread = bridge._thread
+        with bridge:
+            bridge.contacts.get("c1")
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(bridge.loop.is_closed())
+        with self.assertRaises(RuntimeError):
+            bridge.get("invoicing/contacts")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Unit tests for the response cache.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from holded.async_client import AsyncHoldedClient
+from holded.cache import ResponseCache
+from holded.client import HoldedClient
+from holded.exceptions import HoldedError
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+
+class _Strict(BaseModel):
+    """A model the cached responses do not match."""
+
+    required: int
+
+
+def _handler(request):
+    return MemoryResponse(json_data=[{"id": "1", "url": request.url, "params": request.params}])
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the ResponseCache class."""
+
+    def test_ttl_rules(self):
+        """Test that only GETs of reference-data endpoints are cacheable."""
+        cache = ResponseCache(ttls={"invoicing/warehouses/*": None})
+        self.assertEqual(cache.ttl_for("/invoicing/taxes"), 3600.0)
+        self.assertEqual(cache.ttl_for("invoicing/numberingseries/invoice"), 3600.0)
+        self.assertIsNone(cache.ttl_for("invoicing/numberingseries"))
+        self.assertIsNone(cache.ttl_for("invoicing/warehouses/1"))
+        self.assertIsNone(cache.ttl_for("invoicing/contacts"))
+        self.assertIsNone(cache.key("POST", "invoicing/taxes"))
+        self.assertEqual(
+            cache.key("GET", "invoicing/taxes", {"b": 1, "a": 2}),
+            cache.key("GET", "/invoicing/taxes/", {"a": 2, "b": 1}),
+        )
+
+    def test_specific_patterns_win(self):
+        """Test that an override of one path beats a default wildcard that matches it."""
+        cache = ResponseCache(ttls={"invoicing/warehouses/abc": 0})
+        self.assertIsNone(cache.ttl_for("invoicing/warehouses/abc"))
+        self.assertIsNone(cache.key("GET", "invoicing/warehouses/abc"))
+        self.assertEqual(cache.ttl_for("invoicing/warehouses/xyz"), 3600.0)
+
+    @patch("holded.cache.time.monotonic")
+    def test_expiry(self, mock_monotonic):
+        """Test that entries expire after their TTL."""
+        mock_monotonic.return_value = 100.0
+        cache = ResponseCache(ttls={"invoicing/taxes": 10})
+        key = cache.key("GET", "invoicing/taxes")
+        cache.store(key, [1])
+        self.assertEqual(cache.lookup(key), (True, [1]))
+
+        mock_monotonic.return_value = 111.0
+        self.assertEqual(cache.lookup(key), (False, None))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expirations"]), (1, 1, 1))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(maxsize=2)
+        keys = [cache.key("GET", "invoicing/taxes", {"page": page}) for page in range(3)]
+        cache.store(keys[0], 0)
+        cache.store(keys[1], 1)
+        cache.lookup(keys[0])
+        cache.store(keys[2], 2)
+
+        self.assertTrue(cache.lookup(keys[0])[0])
+        self.assertFalse(cache.lookup(keys[1])[0])
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_values_are_copied(self):
+        """Test that callers cannot modify cached values."""
+        cache = ResponseCache()
+        key = cache.key("GET", "invoicing/taxes")
+        value = [{"id": "1"}]
+        cache.store(key, value)
+        value[0]["id"] = "2"
+        cache.lookup(key)[1][0]["id"] = "3"
+        self.assertEqual(cache.lookup(key)[1], [{"id": "1"}])
+
+    def test_invalidate(self):
+        """Test explicit invalidation by path."""
+        cache = ResponseCache()
+        cache.store(cache.key("GET", "invoicing/warehouses"), [])
+        cache.store(cache.key("GET", "invoicing/warehouses/1"), {})
+        cache.store(cache.key("GET", "invoicing/taxes"), [])
+
+        self.assertEqual(cache.invalidate_resource("invoicing/warehouses/1/stock"), 2)
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class TestClientCache(unittest.TestCase):
+    """Test cases for the cache in the clients."""
+
+    def test_sync_client(self):
+        """Test that repeated GETs are served from the cache until a write."""
+        transport = MemoryTransport(_handler)
+        client = HoldedClient(api_key="key", transport=transport, cache=ResponseCache())
+
+        first = client.taxes.list()
+        second = client.taxes.list()
+        client.contacts.list()
+        client.contacts.list()
+        self.assertEqual(first, second)
+        self.assertEqual(len(transport.requests), 3)
+
+        client.warehouse.list()
+        client.warehouse.update("1", {"name": "Main"})
+        client.warehouse.list()
+        self.assertEqual(len(transport.requests), 6)
+
+    def test_async_client_shares_cache(self):
+        """Test that a cache filled by one client serves another."""
+        cache = ResponseCache()
+        HoldedClient(api_key="key", transport=MemoryTransport(_handler), cache=cache).taxes.list()
+        transport = AsyncMemoryTransport(_handler)
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=transport, cache=cache)
+            return await client.taxes.list()
+
+        self.assertEqual(asyncio.run(run())[0]["id"], "1")
+        self.assertEqual(transport.requests, [])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_accounts_do_not_share_entries(self):
+        """Test that clients of different accounts or hosts sharing a cache get their own responses."""
+        cache = ResponseCache()
+        transport = MemoryTransport(_handler)
+        default = "https://api.holded.com/api/"
+        for api_key, base_url in [("a", default), ("a", default), ("b", default), ("a", "https://other.test/api/")]:
+            HoldedClient(api_key=api_key, base_url=base_url, transport=transport, cache=cache).taxes.list()
+        self.assertEqual(len(transport.requests), 3)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_validation_errors(self):
+        """Test that a cached response that fails validation raises HoldedError, as without a cache."""
+        client = HoldedClient(api_key="key", transport=MemoryTransport(_handler), cache=ResponseCache())
+        for _ in range(2):
+            with self.assertRaises(HoldedError):
+                client._request("GET", "invoicing/taxes", response_model=_Strict)
+
+        async def run():
+            client = AsyncHoldedClient(
+                api_key="key", transport=AsyncMemoryTransport(_handler), cache=ResponseCache()
+            )
+            await client.request("GET", "invoicing/taxes", response_model=_Strict)
+
+        with self.assertRaises(HoldedError):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Unit tests for the Holded client.
 """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -40,7 +41,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test GET request."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "123", "name": "Test"}
+        mock_response.content = json.dumps({"id": "123", "name": "Test"}).encode()
         mock_response.status_code = 200
         mock_request.return_value = mock_response
 
@@ -57,7 +58,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test POST request."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "123", "name": "Test"}
+        mock_response.content = json.dumps({"id": "123", "name": "Test"}).encode()
         mock_response.status_code = 200
         mock_request.return_value = mock_response
 
@@ -75,7 +76,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test PUT request."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"id": "123", "name": "Updated"}
+        mock_response.content = json.dumps({"id": "123", "name": "Updated"}).encode()
         mock_response.status_code = 200
         mock_request.return_value = mock_response
 
@@ -93,7 +94,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test DELETE request."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.status_code = 200
         mock_request.return_value = mock_response
 
@@ -110,7 +111,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test authentication error."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Invalid API key"}
+        mock_response.content = json.dumps({"error": "Invalid API key"}).encode()
         mock_response.status_code = 401
         mock_response.text = "401 Client Error"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
@@ -127,7 +128,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test not found error."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Resource not found"}
+        mock_response.content = json.dumps({"error": "Resource not found"}).encode()
         mock_response.status_code = 404
         mock_response.text = "404 Client Error"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
@@ -144,7 +145,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test validation error."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Validation failed"}
+        mock_response.content = json.dumps({"error": "Validation failed"}).encode()
         mock_response.status_code = 422
         mock_response.text = "422 Client Error"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
@@ -161,7 +162,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test rate limit error."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Rate limit exceeded"}
+        mock_response.content = json.dumps({"error": "Rate limit exceeded"}).encode()
         mock_response.status_code = 429
         mock_response.text = "429 Client Error"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
@@ -178,7 +179,7 @@ class TestHoldedClient(unittest.TestCase):
         """Test server error."""
         # Setup mock
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": "Internal server error"}
+        mock_response.content = json.dumps({"error": "Internal server error"}).encode()
         mock_response.status_code = 500
         mock_response.text = "500 Server Error"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
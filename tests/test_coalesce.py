@@ -0,0 +1,121 @@
+"""
+Unit tests for request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from pydantic import BaseModel
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.coalesce import AsyncRequestCoalescer, RequestCoalescer
+from holded.exceptions import HoldedError, HoldedNotFoundError
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+
+class TestRequestCoalescer(unittest.TestCase):
+    """Test cases for the RequestCoalescer class."""
+
+    def test_threads_share_request(self):
+        """Test that concurrent identical calls run once and get separate copies."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"id": "1"}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(coalescer.run("key", fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while coalescer.stats()["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"id": "1"}] * 5)
+        self.assertEqual(len({id(result) for result in results}), 5)
+        self.assertEqual(coalescer.stats(), {"requests": 5, "coalesced": 4, "in_flight": 0})
+
+    def test_errors_are_shared(self):
+        """Test that waiters get the error of the shared request."""
+        coalescer = AsyncRequestCoalescer()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise HoldedNotFoundError("Not found")
+
+        async def run():
+            return await asyncio.gather(*(coalescer.run("key", fetch) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, HoldedNotFoundError) for result in results))
+        self.assertEqual(coalescer.stats()["in_flight"], 0)
+
+
+class TestClientCoalescing(unittest.TestCase):
+    """Test cases for coalescing in the clients."""
+
+    def test_async_client(self):
+        """Test that concurrent identical GETs send one request."""
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return MemoryResponse(json_data={"id": request.url.rsplit("/", 1)[-1]})
+
+        transport = AsyncMemoryTransport(handler)
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=transport, coalesce=True)
+            same = await asyncio.gather(*(client.contacts.get("1") for _ in range(50)))
+            other = await client.contacts.get("2")
+            return same, other
+
+        same, other = asyncio.run(run())
+        self.assertEqual(same, [{"id": "1"}] * 50)
+        self.assertEqual(other, {"id": "2"})
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_writes_are_not_coalesced(self):
+        """Test that POST requests are always sent."""
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data={"id": "1"}))
+        client = HoldedClient(api_key="key", transport=transport, coalesce=True)
+        client.contacts.create({"name": "A"})
+        client.contacts.create({"name": "A"})
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(client.coalescer.stats()["requests"], 0)
+
+    def test_validation_errors(self):
+        """Test that a coalesced response that fails validation raises HoldedError, as without coalescing."""
+
+        class Strict(BaseModel):
+            required: int
+
+        def handler(request):
+            return MemoryResponse(json_data={"id": "1"})
+
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler), coalesce=True)
+        with self.assertRaises(HoldedError):
+            client._request("GET", "invoicing/contacts/1", response_model=Strict)
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=AsyncMemoryTransport(handler), coalesce=True)
+            await client.request("GET", "invoicing/contacts/1", response_model=Strict)
+
+        with self.assertRaises(HoldedError):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the JSON codecs.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.codec import JSONCodec, OrjsonCodec, default_codec, resolve_codec
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+try:
+    import orjson  # noqa: F401
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class CountingCodec(JSONCodec):
+    """Codec that records how it is used."""
+
+    def __init__(self):
+        self.encoded = []
+        self.decoded = []
+
+    def dumps(self, data):
+        self.encoded.append(data)
+        return super().dumps(data)
+
+    def loads(self, content):
+        self.decoded.append(content)
+        return super().loads(content)
+
+
+class TestCodec(unittest.TestCase):
+    """Test cases for the JSON codecs."""
+
+    def test_stdlib_codec(self):
+        """Test that the stdlib codec encodes compact UTF-8 bytes."""
+        codec = JSONCodec()
+        encoded = codec.dumps({"name": "Café", "items": [1, 2]})
+        self.assertEqual(encoded, '{"name":"Café","items":[1,2]}'.encode("utf-8"))
+        self.assertEqual(codec.loads(encoded), {"name": "Café", "items": [1, 2]})
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html>")
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson_codec(self):
+        """Test that the orjson codec matches the stdlib codec."""
+        codec = OrjsonCodec()
+        data = {"name": "Café", "total": 12.5, 1: None}
+        self.assertEqual(JSONCodec().loads(codec.dumps(data)), {"name": "Café", "total": 12.5, "1": None})
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html>")
+        self.assertIsInstance(default_codec(), OrjsonCodec)
+
+    @patch("holded.codec.orjson", None)
+    def test_fallback_without_orjson(self):
+        """Test that the stdlib codec is used when orjson is missing."""
+        self.assertIs(type(default_codec()), JSONCodec)
+        with self.assertRaises(ImportError):
+            OrjsonCodec()
+
+    def test_resolve_codec(self):
+        """Test resolving codec names."""
+        codec = JSONCodec()
+        self.assertIs(resolve_codec(codec), codec)
+        self.assertIs(type(resolve_codec("json")), JSONCodec)
+        with self.assertRaises(ValueError):
+            resolve_codec("yaml")
+
+    def test_clients_use_codec(self):
+        """Test that both clients encode and decode through the codec."""
+        codec = CountingCodec()
+        handler = lambda request: MemoryResponse(json_data={"echo": request.json()})  # noqa: E731
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler), json_codec=codec)
+        self.assertEqual(client.post("invoicing/contacts", data={"name": "A"}), {"echo": {"name": "A"}})
+
+        async def run():
+            async_client = AsyncHoldedClient(api_key="key", transport=AsyncMemoryTransport(handler), json_codec=codec)
+            return await async_client.post("invoicing/contacts", data={"name": "B"})
+
+        self.assertEqual(asyncio.run(run()), {"echo": {"name": "B"}})
+        self.assertEqual(codec.encoded, [{"name": "A"}, {"name": "B"}])
+        self.assertTrue(all(isinstance(content, bytes) for content in codec.decoded))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unit tests for the thread-pool executor of the sync client.
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+
+from holded.client import HoldedClient
+from holded.exceptions import HoldedNotFoundError
+from holded.transports import MemoryResponse, MemoryTransport, RequestsTransport
+
+
+def _handler(request):
+    record_id = request.url.rstrip("/").rsplit("/", 1)[-1]
+    if record_id.startswith("missing"):
+        return MemoryResponse(404, json_data={"message": "Not found"})
+    return MemoryResponse(json_data={"id": record_id, "thread": threading.current_thread().name})
+
+
+class TestClientExecutor(unittest.TestCase):
+    """Test cases for ClientExecutor."""
+
+    def setUp(self):
+        """Set up a client over an in-memory transport."""
+        self.client = HoldedClient(api_key="key", transport=MemoryTransport(_handler))
+
+    def test_resource_methods_return_futures(self):
+        """Test that resource calls run on worker threads."""
+        with self.client.executor(max_workers=4) as executor:
+            futures = [executor.contacts.get(f"c{index}") for index in range(8)]
+            missing = executor.documents.get("missing", "invoice")
+            raw = executor.get("invoicing/contacts/c9")
+
+        self.assertTrue(all(isinstance(future, Future) for future in futures))
+        results = [future.result() for future in futures]
+        self.assertEqual([result["id"] for result in results], [f"c{index}" for index in range(8)])
+        self.assertTrue(all(result["thread"].startswith("holded") for result in results))
+        self.assertIsInstance(missing.exception(), HoldedNotFoundError)
+        self.assertEqual(raw.result()["id"], "c9")
+
+    def test_map_and_as_completed(self):
+        """Test the map and as_completed helpers."""
+        with self.client.executor(max_workers=3) as executor:
+            mapped = list(executor.map(self.client.contacts.get, ["a", "b", "c"]))
+            futures = [executor.products.get(product_id) for product_id in ("x", "y")]
+            completed = [future.result()["id"] for future in executor.as_completed(futures)]
+
+        self.assertEqual([result["id"] for result in mapped], ["a", "b", "c"])
+        self.assertEqual(sorted(completed), ["x", "y"])
+
+    def test_map_raises_first_error(self):
+        """Test that map raises the error of a failed call when it reaches it."""
+        with self.client.executor(max_workers=2) as executor:
+            results = executor.map(self.client.contacts.get, ["a", "missing"])
+            self.assertEqual(next(results)["id"], "a")
+            with self.assertRaises(HoldedNotFoundError):
+                next(results)
+
+    def test_rate_limit(self):
+        """Test that the rate cap spaces out the calls."""
+        starts = []
+
+        def handler(request):
+            starts.append(time.monotonic())
+            return MemoryResponse(json_data={})
+
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler))
+        with client.executor(max_workers=4, rate_limit=20) as executor:
+            for future in [executor.get("invoicing/contacts") for _ in range(4)]:
+                future.result()
+
+        starts.sort()
+        self.assertGreaterEqual(starts[-1] - starts[0], 0.14)
+
+    def test_unknown_attribute(self):
+        """Test that only resources are proxied."""
+        with self.client.executor() as executor:
+            with self.assertRaises(AttributeError):
+                executor.api_key  # noqa: B018
+
+    def test_grows_connection_pool(self):
+        """Test that the requests pool is grown to the worker count."""
+        transport = RequestsTransport()
+        client = HoldedClient(api_key="key", transport=transport)
+        with client.executor(max_workers=32):
+            pass
+
+        adapter = transport.session.get_adapter("https://api.holded.com/")
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Unit tests for the local Holded API stand-in.
+"""
+
+import asyncio
+import inspect
+import time
+import unittest
+from urllib.parse import urlsplit
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import HoldedAuthError, HoldedNotFoundError
+from holded.lazy import LazyResource
+from holded.testing import FakeHoldedServer
+from holded.testing.server import ROUTES
+from holded.transports import MemoryResponse, MemoryTransport
+
+# Resource methods that do not send a request of their own
+_SKIPPED = {"iter_all", "stream_list", "get_many", "create_many", "update_many"}
+
+
+def _argument(name):
+    """Build a placeholder argument for a resource method parameter."""
+    if name == "data":
+        return {"name": "x"}
+    if name in ("params", "page"):
+        return None
+    if name == "stock":
+        return 1
+    return f"{name}-1"
+
+
+class TestRouteCoverage(unittest.TestCase):
+    """Test that the stand-in serves every route the resources use."""
+
+    def test_every_resource_request_has_a_route(self):
+        """Test that every request sent by a resource method matches a route."""
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data={}))
+        client = HoldedClient(api_key="key", transport=transport)
+        for name, attribute in vars(HoldedClient).items():
+            if not isinstance(attribute, LazyResource):
+                continue
+            resource = getattr(client, name)
+            for method_name, method in inspect.getmembers(resource, inspect.ismethod):
+                if method_name.startswith("_") or method_name in _SKIPPED:
+                    continue
+                parameters = list(inspect.signature(method).parameters)
+                method(*(_argument(parameter) for parameter in parameters))
+
+        self.assertGreater(len(transport.requests), 100)
+        for request in transport.requests:
+            segments = urlsplit(request.url).path.strip("/").split("/")[1:]
+            path = "/".join(segments[:1] + segments[2:])
+            with self.subTest(method=request.method, path=path):
+                self.assertTrue(
+                    any(route.method == request.method and route.pattern.match(path) for route in ROUTES)
+                )
+
+
+class TestFakeHoldedServer(unittest.TestCase):
+    """Test the stand-in server with both clients."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the server."""
+        cls.server = FakeHoldedServer(page_size=20).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Start every test from the reference data."""
+        self.server.reset()
+        self.client = HoldedClient(api_key="key", base_url=self.server.base_url)
+
+    def tearDown(self):
+        """Close the client."""
+        self.client.close()
+
+    def test_crud(self):
+        """Test that created records can be read, updated and deleted."""
+        contact_id = self.client.contacts.create({"name": "Acme"})["id"]
+        self.client.contacts.update(contact_id, {"email": "info@acme.test"})
+
+        self.assertEqual(
+            self.client.contacts.get(contact_id), {"id": contact_id, "name": "Acme", "email": "info@acme.test"}
+        )
+        self.assertEqual(self.client.contacts.list(), [self.client.contacts.get(contact_id)])
+        self.client.contacts.delete(contact_id)
+        with self.assertRaises(HoldedNotFoundError):
+            self.client.contacts.get(contact_id)
+        self.assertEqual(self.server.hits[("GET", "invoicing/contacts/{id}")], 3)
+
+    def test_pagination(self):
+        """Test that pages split seeded records and that lists without a page are complete."""
+        self.server.seed("invoicing/contacts", ({"name": f"Contact {index}"} for index in range(45)))
+
+        self.assertEqual(len(self.client.contacts.list({"page": 3})), 5)
+        self.assertEqual(len(self.client.contacts.list({"page": 1, "limit": 40})), 40)
+        self.assertEqual(len(self.client.contacts.list()), 45)
+        names = [contact["name"] for contact in self.client.contacts.iter_all()]
+        self.assertEqual(names, [f"Contact {index}" for index in range(45)])
+
+    def test_documents_are_scoped_by_type(self):
+        """Test that documents are listed and found under their own type only."""
+        invoice_id = self.client.documents.create("invoice", {"contactId": "c1"})["id"]
+        self.server.seed("invoicing/documents", [{"docType": "estimate"}] * 3)
+
+        self.assertEqual([document["id"] for document in self.client.documents.list("invoice")], [invoice_id])
+        self.assertEqual(len(list(self.client.documents.stream_list("estimate"))), 3)
+        self.assertEqual(self.client.documents.pay(invoice_id, "invoice", {"amount": 10})["id"], invoice_id)
+        with self.assertRaises(HoldedNotFoundError):
+            self.client.documents.get(invoice_id, "estimate")
+
+    def test_reference_data_and_nested_records(self):
+        """Test the reference data and records created under a parent."""
+        self.assertEqual(len(self.client.taxes.list()), 3)
+        employee_id = self.client.employees.create({"name": "Ana"})["id"]
+        entry_id = self.client.employee_time_tracking.create(employee_id, {"startTmp": 1, "endTmp": 2})["id"]
+
+        self.assertEqual(self.client.employee_time_tracking.get(entry_id)["employeeId"], employee_id)
+        self.assertEqual(len(self.client.employee_time_tracking.list(employee_id)), 1)
+        self.assertEqual(self.client.employee_time_tracking.list("other"), [])
+        self.assertEqual(self.client.employee_time_tracking.clock_in(employee_id)["status"], 1)
+
+    def test_api_key_and_latency(self):
+        """Test that requests need a key and wait for the configured latency."""
+        with FakeHoldedServer(api_key="secret", latency=0.05) as server:
+            client = HoldedClient(api_key="wrong", base_url=server.base_url)
+            with self.assertRaises(HoldedAuthError):
+                client.taxes.list()
+            client.close()
+
+            client = HoldedClient(api_key="secret", base_url=server.base_url)
+            start = time.perf_counter()
+            client.taxes.list()
+            self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+            client.close()
+
+    def test_async_client(self):
+        """Test the stand-in with the asynchronous client."""
+        self.server.seed("invoicing/products", ({"name": f"Product {index}"} for index in range(10)))
+
+        async def run():
+            async with AsyncHoldedClient(api_key="key", base_url=self.server.base_url) as client:
+                products = await asyncio.gather(*(client.products.list({"page": page}) for page in (1, 2)))
+                product_id = products[0][0]["id"]
+                await client.products.update_stock(product_id, 7)
+                return await client.products.get(product_id)
+
+        self.assertEqual(asyncio.run(run())["stock"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
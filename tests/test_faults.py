@@ -0,0 +1,164 @@
+"""
+Unit tests for the fault profiles of the Holded API stand-in.
+"""
+
+import asyncio
+import random
+import time
+import unittest
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import HoldedConnectionError, HoldedServerError
+from holded.metrics import Histogram
+from holded.retry import RetryPolicy
+from holded.testing import (
+    ConnectionResets,
+    FakeHoldedServer,
+    FaultProfile,
+    RateLimitBursts,
+    RecordedLatency,
+    ServerErrorStorms,
+    SlowResponses,
+    get_profile,
+)
+
+
+class TestFaultProfiles(unittest.TestCase):
+    """Test the faults against both clients."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the server."""
+        cls.server = FakeHoldedServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Start every test without faults or hits."""
+        self.server.reset()
+        self.server.profile = None
+        self.events = []
+
+    def client(self, max_attempts=1):
+        """Create a synchronous client that records its request events."""
+        client = HoldedClient(
+            api_key="key",
+            base_url=self.server.base_url,
+            retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0.01),
+            hooks=[self.events.append],
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_rate_limit_bursts(self):
+        """Test that bursts answer 429 with Retry-After, which the client honors."""
+        profile = FaultProfile("bursts", [RateLimitBursts(every=4, length=2, retry_after=0.05)])
+        self.server.profile = profile
+        client = self.client(max_attempts=3)
+
+        for _ in range(3):
+            self.assertEqual(len(client.taxes.list()), 3)
+
+        self.assertEqual([event.status for event in self.events], [200, 200, 429, 429, 200])
+        self.assertEqual(self.events[2].retry_delay, 0.05)
+        self.assertEqual(profile.stats(), {"rate_limit_bursts": 2})
+        self.assertEqual(self.server.hits[("GET", "invoicing/taxes")], 3)
+
+    def test_server_error_storms(self):
+        """Test that storms fail the last requests of every cycle with 5xx."""
+        self.server.profile = FaultProfile("storms", [ServerErrorStorms(every=3, length=1, statuses=(502,))])
+        client = self.client()
+
+        client.taxes.list()
+        client.taxes.list()
+        with self.assertRaises(HoldedServerError) as context:
+            client.taxes.list()
+        self.assertEqual(context.exception.status_code, 502)
+        client.taxes.list()
+
+    def test_connection_resets(self):
+        """Test that both clients report a body cut short as a connection error."""
+        self.server.profile = FaultProfile("resets", [ConnectionResets(rate=1.0)])
+
+        with self.assertRaises(HoldedConnectionError):
+            self.client().taxes.list()
+
+        async def run():
+            async with AsyncHoldedClient(
+                api_key="key", base_url=self.server.base_url, retry_policy=RetryPolicy(max_attempts=1)
+            ) as client:
+                await client.taxes.list()
+
+        with self.assertRaises(HoldedConnectionError):
+            asyncio.run(run())
+        self.assertEqual(self.server.profile.stats(), {"connection_resets": 2})
+
+    def test_slow_responses(self):
+        """Test that slow responses arrive whole after the configured duration."""
+        self.server.profile = FaultProfile("slow", [SlowResponses(rate=1.0, duration=0.2, chunks=4)])
+
+        start = time.perf_counter()
+        taxes = self.client().taxes.list()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+        self.assertEqual(len(taxes), 3)
+        self.assertGreaterEqual(self.events[0].download, 0.1)
+
+    def test_profiles_are_reproducible(self):
+        """Test that the same seed injects the same faults."""
+
+        def statuses(seed):
+            self.server.profile = FaultProfile("random", [ServerErrorStorms(every=1, length=1, rate=0.5)], seed)
+            client = self.client()
+            results = []
+            for _ in range(12):
+                try:
+                    client.taxes.list()
+                    results.append(200)
+                except HoldedServerError as e:
+                    results.append(e.status_code)
+            return results
+
+        first = statuses(7)
+        self.assertEqual(statuses(7), first)
+        self.assertIn(200, first)
+        self.assertNotEqual(set(first), {200})
+
+
+class TestRecordedLatency(unittest.TestCase):
+    """Test cases for RecordedLatency."""
+
+    def test_samples_follow_the_histogram(self):
+        """Test that samples fall in the buckets in proportion to their counts."""
+        fault = RecordedLatency([0.1, 0.2, 0.4], [1, 0, 3, 1])
+        rng = random.Random(1)
+        samples = [fault.sample(rng) for _ in range(4000)]
+
+        self.assertFalse(any(0.1 < sample <= 0.2 for sample in samples))
+        share = sum(0.2 < sample < 0.4 for sample in samples) / len(samples)
+        self.assertAlmostEqual(share, 0.6, delta=0.05)
+        self.assertAlmostEqual(samples.count(0.4) / len(samples), 0.2, delta=0.05)
+
+    def test_from_histogram(self):
+        """Test that a histogram of the metrics registry can be replayed."""
+        histogram = Histogram([0.01, 0.02])
+        histogram.observe(0.015)
+        fault = RecordedLatency.from_histogram(histogram)
+        self.assertTrue(0.01 <= fault.sample(random.Random()) <= 0.02)
+
+        with self.assertRaises(ValueError):
+            RecordedLatency([0.1], [0, 0])
+
+    def test_named_profiles(self):
+        """Test that the named profiles can be created."""
+        self.assertEqual(get_profile("degraded").name, "degraded")
+        self.assertEqual(get_profile("healthy").faults, [])
+        with self.assertRaises(ValueError):
+            get_profile("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
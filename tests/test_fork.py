@@ -0,0 +1,200 @@
+"""
+Unit tests for fork safety and the picklable client config.
+"""
+
+import asyncio
+import copy
+import json
+import os
+import pickle
+import signal
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+from holded import fork
+from holded.async_client import AsyncHoldedClient
+from holded.cache import ResponseCache
+from holded.client import HoldedClient
+from holded.config import ClientConfig
+from holded.pooling import PoolConfig
+from holded.retry import RetryPolicy
+from holded.transports.aiohttp_transport import AiohttpTransport
+
+from _server import LocalServerMixin
+
+
+class _PortHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that returns the client port of the connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"port": self.client_address[1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _in_child(fn):
+    """Run a function in a forked child and return what it returns as JSON."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.close(read_fd)
+        # Kill a stuck child so that the test fails instead of hanging
+        signal.alarm(10)
+        try:
+            result = fn()
+        except BaseException as e:
+            result = {"error": repr(e)}
+        os.write(write_fd, json.dumps(result).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        output = pipe.read()
+    os.waitpid(pid, 0)
+    return json.loads(output)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+class TestForkSafety(LocalServerMixin, unittest.TestCase):
+    """Test that forked children do not reuse the connections of the parent."""
+
+    handler = _PortHandler
+
+    def test_child_opens_new_connections(self):
+        """Test that the child connects anew and the parent keeps its connection."""
+        client = HoldedClient(api_key="key", base_url=self.base_url)
+        client.transport.ensure_pool_size(20)
+        parent_port = client.get("invoicing/taxes")["port"]
+
+        child = _in_child(
+            lambda: {
+                "port": client.get("invoicing/taxes")["port"],
+                "pool_size": client.transport._adapter._pool_maxsize,
+                "key": client.transport.headers["Key"],
+            }
+        )
+
+        self.assertNotEqual(child["port"], parent_port)
+        self.assertEqual(child["pool_size"], 20)
+        self.assertEqual(child["key"], "key")
+        self.assertEqual(client.get("invoicing/taxes")["port"], parent_port)
+        client.close()
+
+    def test_locks_held_at_fork_are_replaced(self):
+        """Test that a lock held by another thread of the parent is free in the child."""
+        client = HoldedClient(api_key="key", base_url=self.base_url, rate_limit=100, coalesce=True)
+        coalescer = client.coalescer
+
+        def child_state():
+            acquired = client.rate_limiter._lock.acquire(timeout=1)
+            if acquired:
+                client.rate_limiter._lock.release()
+            return {
+                "limiter": acquired,
+                "new_coalescer": client.coalescer is not coalescer,
+                "response": "port" in client.get("invoicing/taxes"),
+            }
+
+        client.rate_limiter._lock.acquire()
+        try:
+            child = _in_child(child_state)
+        finally:
+            client.rate_limiter._lock.release()
+
+        self.assertEqual(child, {"limiter": True, "new_coalescer": True, "response": True})
+        client.close()
+
+
+class TestAsyncTransportReset(unittest.TestCase):
+    """Test the fork reset of the asynchronous transport."""
+
+    def test_aiohttp_session_is_kept_and_replaced(self):
+        """Test that the inherited session is kept alive and a new one is created."""
+
+        async def run():
+            transport = AiohttpTransport()
+            transport.headers["Key"] = "key"
+            inherited = await transport.get_session()
+            transport.reset_after_fork()
+            session = await transport.get_session()
+            await transport.close()
+            await inherited.close()
+            return inherited, session
+
+        inherited, session = asyncio.run(run())
+        self.assertIsNot(session, inherited)
+        self.assertIn(inherited, fork._inherited)
+        self.assertEqual(session.headers["Key"], "key")
+        fork._inherited.remove(inherited)
+
+
+class TestClientConfig(unittest.TestCase):
+    """Test cases for ClientConfig."""
+
+    def test_pickled_client_keeps_settings(self):
+        """Test that a pickled client is rebuilt with the same settings."""
+        client = HoldedClient(
+            api_key="key",
+            timeout=5,
+            rate_limit=3,
+            coalesce=True,
+            validation="trusted",
+            session_per_thread=True,
+            retry_policy=RetryPolicy(max_attempts=5),
+            pool_config=PoolConfig(max_connections_per_host=20),
+        )
+
+        restored = pickle.loads(pickle.dumps(client))
+        self.assertIsInstance(restored, HoldedClient)
+        self.assertEqual(restored.api_key, "key")
+        self.assertEqual(restored.timeout, 5)
+        self.assertEqual((restored.rate_limiter.rate, restored.rate_limiter.burst), (3.0, 3))
+        self.assertIsNot(restored.rate_limiter, client.rate_limiter)
+        self.assertIsNotNone(restored.coalescer)
+        self.assertEqual(restored.validator.mode, "trusted")
+        self.assertTrue(restored.transport.session_per_thread)
+        self.assertEqual(restored.retry_policy.max_attempts, 5)
+        self.assertEqual(restored.retry_policy.budget.available, client.retry_policy.budget.available)
+        self.assertEqual(restored.pool_config.max_connections_per_host, 20)
+        client.close()
+        restored.close()
+
+    def test_config_builds_both_clients(self):
+        """Test that a config builds synchronous and asynchronous clients."""
+        config = pickle.loads(pickle.dumps(ClientConfig(api_key="key", api_version="v2", session_per_thread=True)))
+
+        client = config.client()
+        async_client = config.async_client()
+        self.assertEqual(client.api_version, "v2")
+        self.assertEqual(async_client.api_version, "v2")
+        self.assertNotIn("'key'", repr(config))
+        client.close()
+
+    def test_pickled_async_client(self):
+        """Test that the asynchronous client is pickled as its config."""
+        client = AsyncHoldedClient(api_key="key", validation="sampled", validation_sample_rate=10)
+
+        restored = pickle.loads(pickle.dumps(client))
+        self.assertIsInstance(restored, AsyncHoldedClient)
+        self.assertEqual((restored.validator.mode, restored.validator.sample_rate), ("sampled", 10))
+        self.assertEqual(restored.base_url, client.base_url)
+
+    def test_clients_cannot_be_copied(self):
+        """Test that copying a client fails instead of dropping its cache and hooks."""
+        for client in (HoldedClient(api_key="key", cache=ResponseCache()), AsyncHoldedClient(api_key="key")):
+            with self.subTest(client=type(client).__name__):
+                with self.assertRaisesRegex(TypeError, "to_config"):
+                    copy.copy(client)
+                with self.assertRaises(TypeError):
+                    copy.deepcopy(client)
+
+
+if __name__ == "__main__":
+    unittest.main()
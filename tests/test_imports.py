@@ -0,0 +1,118 @@
+"""
+Unit tests for lazy imports, deferred model schemas and lazy resources.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+from holded.api.models import iter_models, warm_schemas
+from holded.client import HoldedClient
+from holded.lazy import LazyResource
+
+# Generous budget for ``import holded`` in a fresh interpreter; loading the
+# clients and every resource eagerly takes several times longer
+IMPORT_BUDGET = 0.25
+# Budget for importing every model once pydantic is loaded
+MODELS_BUDGET = 0.5
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return what it prints as JSON."""
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that importing the package loads only what is used."""
+
+    def test_import_is_cheap(self):
+        """Test that importing holded loads no client, resource or HTTP library."""
+        result = _run(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import holded\n"
+            "elapsed = time.perf_counter() - start\n"
+            "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))"
+        )
+        modules = result["modules"]
+        for name in ("holded.client", "holded.async_client", "holded.api", "aiohttp", "requests", "pydantic"):
+            self.assertNotIn(name, modules)
+        self.assertLess(result["elapsed"], IMPORT_BUDGET)
+
+    def test_client_loads_only_used_resources(self):
+        """Test that a client imports the modules of the resources it uses."""
+        modules = _run(
+            "import json, sys\n"
+            "import holded\n"
+            "client = holded.HoldedClient(api_key='key')\n"
+            "client.contacts\n"
+            "print(json.dumps(sorted(sys.modules)))"
+        )
+        self.assertIn("holded.api.invoice.resources.contacts", modules)
+        self.assertNotIn("holded.api.invoice.resources.documents", modules)
+        self.assertNotIn("holded.api.crm", modules)
+        self.assertNotIn("aiohttp", modules)
+
+    def test_package_exports(self):
+        """Test that lazily exported names resolve and show up in dir()."""
+        import holded
+        from holded.api.invoice.models import Warehouse
+        from holded.transports import MemoryTransport
+
+        self.assertIs(holded.HoldedClient, HoldedClient)
+        self.assertEqual(Warehouse.__module__, "holded.api.invoice.models.warehouse")
+        self.assertEqual(MemoryTransport.__module__, "holded.transports.memory")
+        self.assertIn("AsyncHoldedClient", dir(holded))
+        self.assertEqual(holded.crm.resources.LeadsResource.__name__, "LeadsResource")
+        with self.assertRaises(AttributeError):
+            holded.missing  # noqa: B018
+
+
+class TestDeferredSchemas(unittest.TestCase):
+    """Test that model schemas are built on first use."""
+
+    def test_import_does_not_build_schemas(self):
+        """Test that importing every model builds no schema."""
+        result = _run(
+            "import json, time\n"
+            "import pydantic\n"
+            "start = time.perf_counter()\n"
+            "from holded.api.models import iter_models\n"
+            "models = list(iter_models())\n"
+            "elapsed = time.perf_counter() - start\n"
+            "print(json.dumps({'elapsed': elapsed, 'models': len(models),"
+            " 'built': sum(model.__pydantic_complete__ for model in models)}))"
+        )
+        self.assertGreater(result["models"], 60)
+        self.assertEqual(result["built"], 0)
+        self.assertLess(result["elapsed"], MODELS_BUDGET)
+
+    def test_warm_schemas_in_background(self):
+        """Test that warm_schemas builds the schemas in a thread."""
+        packages = ["holded.api.team.models"]
+        thread = warm_schemas(packages, background=True)
+        thread.join(10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(all(model.__pydantic_complete__ for model in iter_models(packages)))
+
+
+class TestLazyResources(unittest.TestCase):
+    """Test that clients create resources on first access."""
+
+    def test_created_once_on_access(self):
+        """Test that a resource is created on first access and then reused."""
+        client = HoldedClient(api_key="key")
+        self.assertNotIn("contacts", vars(client))
+
+        contacts = client.contacts
+        self.assertIs(contacts.client, client)
+        self.assertIs(client.contacts, contacts)
+        self.assertIsInstance(HoldedClient.contacts, LazyResource)
+        self.assertIsNot(HoldedClient(api_key="key").contacts, contacts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+"""
+Unit tests for the per-request instrumentation hooks.
+"""
+
+import asyncio
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+from pydantic import BaseModel
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import HoldedConnectionError, HoldedError, HoldedNotFoundError
+from holded.instrumentation import RequestEvent, endpoint_template
+from holded.retry import RetryPolicy
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+from _server import LocalServerMixin
+
+
+class _Contact(BaseModel):
+    id: str
+
+
+class _ListHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler that returns a list of contacts."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps([{"id": str(index)} for index in range(100)]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    """Test cases for endpoint_template."""
+
+    def test_templates(self):
+        """Test that IDs and document types are replaced and actions kept."""
+        cases = {
+            "invoicing/contacts": "invoicing/contacts",
+            "invoicing/contacts/5f1a": "invoicing/contacts/{id}",
+            "invoicing/contacts/5f1a/attachments": "invoicing/contacts/{id}/attachments",
+            "invoicing/documents/invoice": "invoicing/documents/{docType}",
+            "invoicing/documents/invoice/5f1a/pay": "invoicing/documents/{docType}/{id}/pay",
+            "/crm/funnels/5f1a/": "crm/funnels/{id}",
+            "team/employees/5f1a/times/7b2c": "team/employees/{id}/times/{id}",
+        }
+        for path, template in cases.items():
+            with self.subTest(path=path):
+                self.assertEqual(endpoint_template(path), template)
+
+
+class TestSyncHooks(unittest.TestCase):
+    """Test the events sent by the synchronous client."""
+
+    def test_successful_request(self):
+        """Test the event of a request that succeeds at once."""
+        events = []
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data={"id": "5f1a"}))
+        client = HoldedClient(api_key="key", transport=transport, hooks=[events.append])
+
+        client.put("invoicing/contacts/5f1a", data={"name": "A"}, response_model=_Contact)
+
+        (event,) = events
+        self.assertEqual((event.method, event.endpoint, event.attempt), ("PUT", "invoicing/contacts/{id}", 0))
+        self.assertEqual((event.status, event.status_class, event.error), (200, "2xx", None))
+        self.assertEqual(event.bytes_sent, len(b'{"name":"A"}'))
+        self.assertEqual(event.bytes_received, len(b'{"id": "5f1a"}'))
+        self.assertIsNotNone(event.decode)
+        self.assertIsNotNone(event.validation)
+        self.assertIsNone(event.connect)
+        self.assertGreaterEqual(event.total, event.decode + event.validation)
+
+    def test_failed_validation(self):
+        """Test that both clients record the validation time of a response that fails validation."""
+        events = []
+        client = HoldedClient(
+            api_key="key",
+            transport=MemoryTransport(lambda request: MemoryResponse(json_data={"name": "A"})),
+            hooks=[events.append],
+        )
+        async_client = AsyncHoldedClient(
+            api_key="key",
+            transport=AsyncMemoryTransport(lambda request: MemoryResponse(json_data={"name": "A"})),
+            hooks=[events.append],
+        )
+
+        with self.assertRaises(HoldedError):
+            client.get("invoicing/contacts/5f1a", response_model=_Contact)
+        with self.assertRaises(HoldedError):
+            asyncio.run(async_client.request("GET", "invoicing/contacts/5f1a", response_model=_Contact))
+
+        self.assertEqual(len(events), 2)
+        for event in events:
+            self.assertIsNotNone(event.validation)
+            self.assertIsNotNone(event.error)
+
+    def test_retried_request(self):
+        """Test that every attempt sends an event with its outcome."""
+        events = []
+        responses = [MemoryResponse(500, json_data={"message": "Down"}), MemoryResponse(json_data=[])]
+        client = HoldedClient(
+            api_key="key",
+            transport=MemoryTransport(lambda request: responses.pop(0)),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01, jitter=False),
+            hooks=[events.append],
+        )
+
+        client.get("invoicing/contacts")
+
+        self.assertEqual([(event.attempt, event.status) for event in events], [(0, 500), (1, 200)])
+        self.assertEqual(events[0].status_class, "5xx")
+        self.assertEqual(events[0].as_dict()["error"], "HoldedServerError")
+        self.assertEqual(events[0].retry_delay, 0.01)
+        self.assertIsNone(events[1].retry_delay)
+
+    def test_connection_error_and_failing_hook(self):
+        """Test the event of a failed attempt, and that a failing hook is ignored."""
+        events = []
+
+        def handler(request):
+            raise HoldedConnectionError("Connection reset")
+
+        def broken_hook(event):
+            raise RuntimeError("broken")
+
+        client = HoldedClient(
+            api_key="key",
+            transport=MemoryTransport(handler),
+            retry_policy=RetryPolicy(max_attempts=1),
+            hooks=[broken_hook, events.append],
+        )
+
+        with self.assertLogs("holded.instrumentation", "ERROR"):
+            with self.assertRaises(HoldedConnectionError):
+                client.get("invoicing/contacts")
+
+        (event,) = events
+        self.assertEqual((event.status, event.status_class, event.retry_delay), (None, "error", None))
+        self.assertIsInstance(event.error, HoldedConnectionError)
+
+    def test_rate_limit_wait(self):
+        """Test that the time spent in the rate limiter is recorded."""
+        events = []
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data=[]))
+        client = HoldedClient(api_key="key", transport=transport, rate_limit=50, rate_limit_burst=1)
+        client.hooks.append(events.append)
+
+        client.get("invoicing/contacts")
+        client.get("invoicing/contacts")
+
+        self.assertEqual(events[0].rate_limit_wait, 0.0)
+        self.assertGreater(events[1].rate_limit_wait, 0.0)
+
+
+class TestAsyncHooks(unittest.TestCase):
+    """Test the events sent by the asynchronous client."""
+
+    def test_request_and_stream(self):
+        """Test the events of a request and of a streamed list."""
+        events = []
+
+        async def handler(request):
+            if request.url.endswith("/missing"):
+                return MemoryResponse(404, json_data={"message": "Not found"})
+            return MemoryResponse(json_data=[{"id": "1"}, {"id": "2"}])
+
+        async def run():
+            client = AsyncHoldedClient(api_key="key", transport=AsyncMemoryTransport(handler), hooks=[events.append])
+            await client.get("invoicing/contacts")
+            items = [item async for item in client.stream_list("invoicing/contacts")]
+            with self.assertRaises(HoldedNotFoundError):
+                await client.get("invoicing/contacts/missing")
+            return items
+
+        self.assertEqual(len(asyncio.run(run())), 2)
+        self.assertEqual([event.status for event in events], [200, 200, 404])
+        self.assertEqual(events[0].bytes_received, len(b'[{"id": "1"}, {"id": "2"}]'))
+        self.assertIsNotNone(events[0].decode)
+        self.assertIsNone(events[1].bytes_received)
+        self.assertEqual(events[2].endpoint, "invoicing/contacts/{id}")
+        self.assertEqual(events[2].status_class, "4xx")
+
+
+class TestNetworkTimings(LocalServerMixin, unittest.TestCase):
+    """Test the phase timings measured by the network transports."""
+
+    handler = _ListHandler
+
+    def assertPhases(self, events):
+        first, second = events
+        for phase in ("connect", "ttfb", "download", "decode", "total"):
+            self.assertIsNotNone(getattr(first, phase), phase)
+        self.assertIsNone(first.tls)
+        # The second request reuses the connection
+        self.assertIsNone(second.connect)
+        self.assertIsNotNone(second.ttfb)
+        self.assertEqual(second.bytes_received, first.bytes_received)
+
+    def test_requests_transport(self):
+        """Test the timings measured by the requests transport."""
+        events = []
+        client = HoldedClient(api_key="key", base_url=self.base_url, hooks=[events.append])
+
+        client.get("invoicing/contacts")
+        client.get("invoicing/contacts")
+        client.close()
+
+        self.assertPhases(events)
+
+    def test_aiohttp_transport(self):
+        """Test the timings measured by the aiohttp transport."""
+        events = []
+
+        async def run():
+            async with AsyncHoldedClient(api_key="key", base_url=self.base_url, hooks=[events.append]) as client:
+                await client.get("invoicing/contacts")
+                await client.get("invoicing/contacts")
+
+        asyncio.run(run())
+        self.assertPhases(events)
+
+    def test_event_repr(self):
+        """Test that events describe themselves briefly."""
+        event = RequestEvent("GET", self.base_url, "invoicing/contacts")
+        self.assertEqual(repr(event), "<RequestEvent GET invoicing/contacts attempt=0 status=None ->")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the metrics registry.
+"""
+
+import asyncio
+import json
+import unittest
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import HoldedServerError
+from holded.instrumentation import RequestEvent
+from holded.metrics import Histogram, MetricsRegistry
+from holded.retry import RetryPolicy
+from holded.transports import AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+
+def _event(endpoint, total, status=200, attempt=0, method="GET"):
+    event = RequestEvent(method, "https://api.holded.com/api/" + endpoint, endpoint, attempt)
+    event.status = status
+    event.total = total
+    return event
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for Histogram."""
+
+    def test_buckets_and_quantiles(self):
+        """Test that observations land in their buckets and quantiles interpolate."""
+        histogram = Histogram([0.1, 0.2, 0.4])
+        for value in [0.05] * 50 + [0.15] * 40 + [0.3] * 9 + [1.0]:
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [(0.1, 50), (0.2, 90), (0.4, 99), (float("inf"), 100)])
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.sum, 2.5 + 6.0 + 2.7 + 1.0)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.1)
+        self.assertAlmostEqual(histogram.quantile(0.7), 0.15)
+        self.assertAlmostEqual(histogram.quantile(0.99), 0.4)
+        self.assertEqual(histogram.quantile(1.0), 0.4)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+    def test_bound_is_inclusive(self):
+        """Test that a value equal to a bound is counted in that bucket."""
+        histogram = Histogram([0.1, 0.2])
+        histogram.observe(0.1)
+        self.assertEqual(histogram.counts, [1, 0, 0])
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for MetricsRegistry."""
+
+    def test_series_are_keyed_by_labels(self):
+        """Test that attempts are grouped by method, endpoint, status class and retries."""
+        metrics = MetricsRegistry(buckets=[0.1, 1.0])
+        metrics(_event("invoicing/contacts/{id}", 0.05))
+        metrics(_event("invoicing/contacts/{id}", 0.5))
+        metrics(_event("invoicing/contacts/{id}", 0.5, status=503))
+        metrics(_event("invoicing/contacts/{id}", 0.05, attempt=1))
+
+        snapshot = json.loads(metrics.to_json())
+        series = {(s["status_class"], s["retries"]): s for s in snapshot["requests"]}
+        self.assertEqual(set(series), {("2xx", 0), ("5xx", 0), ("2xx", 1)})
+        self.assertEqual(series[("2xx", 0)]["count"], 2)
+        self.assertEqual(series[("2xx", 0)]["latency"]["buckets"], {"0.1": 1, "1.0": 2, "+Inf": 2})
+        self.assertEqual(metrics.latency("invoicing/contacts/{id}").count, 4)
+        self.assertEqual(metrics.latency("invoicing/contacts/{id}", status_class="2xx").count, 3)
+        self.assertEqual(metrics.latency("invoicing/contacts").count, 0)
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {"requests": [], "phases": []})
+
+    def test_prometheus_format(self):
+        """Test the Prometheus text exposition format."""
+        metrics = MetricsRegistry(buckets=[0.1], namespace="app")
+        event = _event("invoicing/documents/{docType}", 0.25, method="POST")
+        event.bytes_sent = 12
+        event.ttfb = 0.2
+        metrics(event)
+
+        text = metrics.to_prometheus()
+        labels = 'method="POST",endpoint="invoicing/documents/{docType}",status_class="2xx",retries="0"'
+        self.assertIn("# TYPE app_requests_total counter\n", text)
+        self.assertIn(f"app_requests_total{{{labels}}} 1\n", text)
+        self.assertIn("# TYPE app_request_duration_seconds histogram\n", text)
+        self.assertIn(f'app_request_duration_seconds_bucket{{{labels},le="0.1"}} 0\n', text)
+        self.assertIn(f'app_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n', text)
+        self.assertIn(f"app_request_duration_seconds_sum{{{labels}}} 0.25\n", text)
+        self.assertIn(f"app_request_bytes_total{{{labels}}} 12\n", text)
+        self.assertIn(
+            'app_phase_seconds_total{method="POST",endpoint="invoicing/documents/{docType}",phase="ttfb"} 0.2\n', text
+        )
+
+    def test_invalid_buckets(self):
+        """Test that buckets must increase."""
+        with self.assertRaises(ValueError):
+            MetricsRegistry(buckets=[1.0, 0.5])
+
+    def test_fed_by_clients(self):
+        """Test that clients record every attempt of their requests."""
+        metrics = MetricsRegistry()
+        responses = [MemoryResponse(502, json_data={"message": "Bad gateway"}), MemoryResponse(json_data=[])]
+        client = HoldedClient(
+            api_key="key",
+            transport=MemoryTransport(lambda request: responses.pop(0)),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            metrics=metrics,
+        )
+        client.get("invoicing/documents/invoice")
+
+        async def handler(request):
+            return MemoryResponse(503, json_data={"message": "Down"})
+
+        async def run():
+            async_client = AsyncHoldedClient(
+                api_key="key",
+                transport=AsyncMemoryTransport(handler),
+                retry_policy=RetryPolicy(max_attempts=1),
+                metrics=metrics,
+            )
+            with self.assertRaises(HoldedServerError):
+                await async_client.get("invoicing/contacts/5f1a")
+
+        asyncio.run(run())
+        keys = [
+            (s["endpoint"], s["status_class"], s["retries"], s["count"]) for s in metrics.snapshot()["requests"]
+        ]
+        self.assertEqual(
+            keys,
+            [
+                ("invoicing/contacts/{id}", "5xx", 0, 1),
+                ("invoicing/documents/{docType}", "2xx", 1, 1),
+                ("invoicing/documents/{docType}", "5xx", 0, 1),
+            ],
+        )
+        self.assertIs(client.metrics, metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Unit tests for the pagination helpers.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from holded.api.invoice.models.contacts import ContactListParams
+from holded.api.invoice.resources.async_contacts import AsyncContactsResource
+from holded.api.invoice.resources.contacts import ContactsResource
+from holded.api.team.resources.employees import EmployeesResource
+from holded.pagination import aiter_items, extract_items, find_last_page, iter_items
+
+
+def make_pages(total, page_size):
+    """Build a fetch function serving ``total`` items in pages of ``page_size``."""
+    calls = []
+
+    def fetch(params):
+        calls.append(dict(params))
+        start = (params["page"] - 1) * page_size
+        return [{"id": i} for i in range(start, min(start + page_size, total))]
+
+    return fetch, calls
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for the pagination helpers."""
+
+    def test_extract_items(self):
+        """Test extracting items from the supported page shapes."""
+        self.assertEqual(extract_items([1, 2]), [1, 2])
+        self.assertEqual(extract_items({"items": [1], "total": 1}), [1])
+        self.assertEqual(extract_items({"employees": [3]}), [3])
+        self.assertEqual(extract_items(None), [])
+        self.assertEqual(extract_items({"message": "empty"}), [])
+
+    def test_stops_on_short_page(self):
+        """Test that iteration stops on the first short page."""
+        fetch, calls = make_pages(25, 10)
+        items = list(iter_items(fetch, {"limit": 10}))
+        self.assertEqual([item["id"] for item in items], list(range(25)))
+        self.assertEqual([call["page"] for call in calls], [1, 2, 3])
+
+    def test_stops_on_empty_page(self):
+        """Test that iteration stops on an empty page when the total is a multiple of the page size."""
+        fetch, calls = make_pages(20, 10)
+        items = list(iter_items(fetch))
+        self.assertEqual(len(items), 20)
+        self.assertEqual(len(calls), 3)
+
+    def test_fetches_lazily(self):
+        """Test that pages are only fetched when the iterator needs them."""
+        fetch, calls = make_pages(100, 10)
+        iterator = iter_items(fetch, ContactListParams(page=3, limit=10))
+        self.assertEqual(next(iterator)["id"], 20)
+        self.assertEqual(len(calls), 1)
+
+    def test_stops_when_page_is_ignored(self):
+        """Test that endpoints ignoring the page parameter do not loop forever."""
+        items = list(iter_items(lambda params: [{"id": 1}, {"id": 2}]))
+        self.assertEqual(len(items), 2)
+
+    def test_contacts_iter_all(self):
+        """Test iterating over contacts through the resource."""
+        client = MagicMock()
+        client.get.side_effect = [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+        resource = ContactsResource(client)
+
+        items = list(resource.iter_all({"limit": 2}))
+
+        self.assertEqual([item["id"] for item in items], ["a", "b", "c"])
+        self.assertEqual(client.get.call_args_list[1][1]["params"], {"limit": 2, "page": 2})
+
+    def test_employees_iter_all(self):
+        """Test iterating over employees wrapped in a dictionary."""
+        client = MagicMock()
+        client.get.side_effect = [{"employees": [{"id": "a"}]}, {"employees": []}]
+        resource = EmployeesResource(client)
+
+        self.assertEqual(list(resource.iter_all()), [{"id": "a"}])
+
+    def test_async_contacts_stream(self):
+        """Test streaming contacts through the async resource."""
+        pages = [[{"id": "a"}, {"id": "b"}], []]
+
+        async def get(path, params=None):
+            return pages[params["page"] - 1]
+
+        client = MagicMock()
+        client.get = get
+        resource = AsyncContactsResource(client)
+
+        async def collect():
+            return [item async for item in resource.stream()]
+
+        loop = asyncio.new_event_loop()
+        try:
+            items = loop.run_until_complete(collect())
+        finally:
+            loop.close()
+        self.assertEqual([item["id"] for item in items], ["a", "b"])
+
+
+class TestParallelPagination(unittest.TestCase):
+    """Test cases for parallel pagination on the async resources."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.loop.close()
+
+    def make_fetch(self, total, page_size, with_total=False):
+        """Build a coroutine function serving ``total`` items and record the pages requested."""
+        requested = []
+
+        async def fetch(params):
+            requested.append(params["page"])
+            await asyncio.sleep(0)
+            start = (params["page"] - 1) * page_size
+            items = [{"id": i} for i in range(start, min(start + page_size, total))]
+            return {"items": items, "total": total} if with_total else items
+
+        return fetch, requested
+
+    def collect(self, fetch, params=None, concurrency=4):
+        """Collect the item IDs produced by a parallel walk."""
+
+        async def run():
+            return [item["id"] async for item in aiter_items(fetch, params, concurrency)]
+
+        return self.loop.run_until_complete(run())
+
+    def test_find_last_page(self):
+        """Test galloping and binary search over the page count."""
+        for total in (1, 10, 11, 95, 100, 1000, 1234):
+            fetch, requested = self.make_fetch(total, 10)
+
+            async def fetch_items(page):
+                return await fetch({"page": page})
+
+            first = self.loop.run_until_complete(fetch_items(1))
+            last = self.loop.run_until_complete(find_last_page(fetch_items, 1, first, 10))
+            self.assertEqual(last, (total + 9) // 10, total)
+            self.assertLess(len(requested), 25)
+
+    def test_yields_items_in_order(self):
+        """Test that parallel fetching yields every item in page order."""
+        fetch, requested = self.make_fetch(1234, 10)
+        self.assertEqual(self.collect(fetch, {"limit": 10}), list(range(1234)))
+        self.assertEqual(len(requested), len(set(requested)))
+
+    def test_uses_total_when_reported(self):
+        """Test that the page count is taken from the total without probing."""
+        fetch, requested = self.make_fetch(45, 10, with_total=True)
+        self.assertEqual(self.collect(fetch), list(range(45)))
+        self.assertEqual(sorted(requested), [1, 2, 3, 4, 5])
+
+    def test_empty_first_page(self):
+        """Test that an empty first page yields nothing."""
+        fetch, requested = self.make_fetch(0, 10)
+        self.assertEqual(self.collect(fetch), [])
+        self.assertEqual(requested, [1])
+
+    def test_page_parameter_ignored(self):
+        """Test that endpoints ignoring the page parameter are read once."""
+
+        async def fetch(params):
+            return [{"id": 1}, {"id": 2}]
+
+        self.assertEqual(self.collect(fetch), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
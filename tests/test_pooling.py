@@ -0,0 +1,114 @@
+"""
+Unit tests for the connection pool configuration.
+"""
+
+import asyncio
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.pooling import PoolConfig
+
+from _server import LocalServerMixin
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON handler."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps([]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPooling(LocalServerMixin, unittest.TestCase):
+    """Test cases for the connection pool configuration."""
+
+    handler = _Handler
+
+    def test_adapter_settings(self):
+        """Test that the synchronous client mounts an adapter with the configured size."""
+        client = HoldedClient(api_key="test_api_key", pool_config=PoolConfig(max_connections_per_host=50, block=True))
+        adapter = client.session.get_adapter("https://api.holded.com/")
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertTrue(adapter._pool_block)
+        client.close()
+
+    def test_sync_pool_stats(self):
+        """Test that the synchronous client reports idle keep-alive connections."""
+        client = HoldedClient(
+            api_key="test_api_key", base_url=self.base_url, pool_config=PoolConfig(max_connections_per_host=4)
+        )
+        client.get("invoicing/taxes")
+        stats = client.pool_stats()
+        client.close()
+
+        self.assertEqual(stats["size"], 4)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["idle"], 1)
+        self.assertEqual(stats["saturation"], 0.0)
+
+    def test_async_pool_stats(self):
+        """Test that the asynchronous client applies the limits to its connector."""
+        client = AsyncHoldedClient(
+            api_key="test_api_key",
+            base_url=self.base_url,
+            pool_config=PoolConfig(max_connections=8, max_connections_per_host=4, keepalive_timeout=60),
+        )
+
+        async def run():
+            self.assertEqual(client.pool_stats()["size"], 0)
+            await client.get("invoicing/taxes")
+            connector = client.session.connector
+            stats = client.pool_stats()
+            await client.close()
+            return connector, stats
+
+        loop = asyncio.new_event_loop()
+        try:
+            connector, stats = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        self.assertEqual(connector.limit, 8)
+        self.assertEqual(connector.limit_per_host, 4)
+        self.assertEqual(stats["size"], 8)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_warmup(self):
+        """Test that warmup leaves the requested number of idle connections in the pool."""
+        client = AsyncHoldedClient(api_key="test_api_key", base_url=self.base_url)
+
+        async def run():
+            async with client:
+                opened = await client.warmup(3)
+                return opened, client.pool_stats()
+
+        loop = asyncio.new_event_loop()
+        try:
+            opened, stats = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        self.assertEqual(opened, 3)
+        self.assertEqual(stats["idle"], 3)
+        self.assertTrue(client.session.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Unit tests for the client-side rate limiter.
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.rate_limit import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the RateLimiter class."""
+
+    def test_burst_is_not_delayed(self):
+        """Test that requests within the burst are sent immediately."""
+        limiter = RateLimiter(rate=10, burst=5)
+        waits = [limiter.acquire() for _ in range(5)]
+        self.assertEqual(waits, [0.0] * 5)
+        self.assertEqual(limiter.stats()["delayed"], 0)
+
+    @patch("holded.rate_limit.time.sleep")
+    def test_paces_after_burst(self, mock_sleep):
+        """Test that requests beyond the burst wait for new tokens."""
+        limiter = RateLimiter(rate=10, burst=2)
+        for _ in range(4):
+            limiter.acquire()
+
+        stats = limiter.stats()
+        self.assertEqual(stats["requests"], 4)
+        self.assertEqual(stats["delayed"], 2)
+        self.assertAlmostEqual(stats["max_wait"], 0.2, delta=0.05)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    def test_thread_safe(self):
+        """Test that concurrent threads never exceed the configured rate."""
+        limiter = RateLimiter(rate=200, burst=1)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = limiter.stats()
+        self.assertEqual(stats["requests"], 20)
+        # The last of 20 requests at 200/s has to wait for 19 refills
+        self.assertAlmostEqual(stats["max_wait"], 19 / 200, places=2)
+
+    def test_acquire_async(self):
+        """Test pacing from asyncio tasks."""
+        limiter = RateLimiter(rate=100, burst=1)
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+        loop = asyncio.new_event_loop()
+        try:
+            waits = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertEqual(waits[0], 0.0)
+        self.assertGreater(waits[2], waits[1])
+
+    def test_cancelled_acquire_async(self):
+        """Test that a task cancelled while waiting returns its tokens."""
+        limiter = RateLimiter(rate=10, burst=1)
+
+        async def run():
+            await limiter.acquire_async()
+            task = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return await limiter.acquire_async()
+
+        loop = asyncio.new_event_loop()
+        try:
+            wait = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertLess(wait, 0.1)
+
+    def test_invalid_arguments(self):
+        """Test that invalid settings are rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=1, burst=0)
+
+    @patch("requests.Session.request")
+    def test_client_uses_limiter(self, mock_request):
+        """Test that the synchronous client paces every request."""
+        mock_response = MagicMock()
+        mock_response.content = b"{}"
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        client = HoldedClient(api_key="test_api_key", rate_limit=50, rate_limit_burst=3)
+        for _ in range(3):
+            client.get("invoicing/taxes")
+        client.close()
+
+        self.assertEqual(client.rate_limiter.stats()["requests"], 3)
+
+    def test_clients_share_limiter(self):
+        """Test that a limiter can be shared by both clients."""
+        limiter = RateLimiter(rate=5)
+        client = HoldedClient(api_key="test_api_key", rate_limiter=limiter)
+        async_client = AsyncHoldedClient(api_key="test_api_key", rate_limiter=limiter)
+        self.assertIs(client.rate_limiter, async_client.rate_limiter)
+        client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit tests for the retry policy.
+"""
+
+import asyncio
+import unittest
+from email.utils import formatdate
+from time import time
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+import requests
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import (
+    HoldedConnectionError,
+    HoldedNotFoundError,
+    HoldedRateLimitError,
+    HoldedServerError,
+    HoldedTimeoutError,
+)
+from holded.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def make_error_response(status_code, headers=None):
+    """Build a mocked requests response for an error status."""
+    response = MagicMock()
+    response.content = b'{"error": "failure"}'
+    response.status_code = status_code
+    response.text = f"{status_code} Error"
+    response.headers = headers or {}
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test cases for the RetryPolicy class."""
+
+    def test_parse_retry_after(self):
+        """Test parsing seconds and HTTP dates."""
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+        in_ten_seconds = parse_retry_after(formatdate(time() + 10, usegmt=True))
+        self.assertTrue(8 <= in_ten_seconds <= 10)
+
+    def test_full_jitter(self):
+        """Test that delays stay between zero and the exponential bound."""
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for attempt in range(6):
+            delay = policy.compute_delay(attempt)
+            self.assertTrue(0 <= delay <= min(5, 2**attempt))
+
+    def test_retry_after_takes_precedence(self):
+        """Test that the Retry-After header overrides the backoff."""
+        policy = RetryPolicy(base_delay=1, max_retry_after=60)
+        error = HoldedRateLimitError("Rate limit exceeded.", status_code=429, headers={"Retry-After": "7"})
+        self.assertEqual(policy.get_retry_delay("POST", error, 0), 7.0)
+
+    def test_method_classification(self):
+        """Test that only idempotent methods retry server and network errors."""
+        policy = RetryPolicy()
+        for error in (HoldedServerError("boom"), HoldedTimeoutError("slow"), HoldedConnectionError("reset")):
+            self.assertTrue(policy.is_retryable("GET", error))
+            self.assertTrue(policy.is_retryable("PUT", error))
+            self.assertFalse(policy.is_retryable("POST", error))
+        self.assertTrue(policy.is_retryable("POST", HoldedRateLimitError("slow down")))
+        self.assertFalse(policy.is_retryable("GET", HoldedNotFoundError("missing")))
+
+    def test_max_attempts(self):
+        """Test that no retry is allowed after the last attempt."""
+        policy = RetryPolicy(max_attempts=2, jitter=False)
+        error = HoldedServerError("boom")
+        self.assertEqual(policy.get_retry_delay("GET", error, 0), 1.0)
+        self.assertIsNone(policy.get_retry_delay("GET", error, 1))
+
+    def test_budget_limits_retries(self):
+        """Test that the retry budget stops retries once spent."""
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    @patch("holded.client.time.sleep")
+    @patch("requests.Session.request")
+    def test_sync_client_honors_retry_after(self, mock_request, mock_sleep):
+        """Test that the synchronous client waits for Retry-After and then succeeds."""
+        success = MagicMock()
+        success.content = b'{"ok": true}'
+        success.status_code = 200
+        mock_request.side_effect = [make_error_response(429, {"Retry-After": "2"}), success]
+
+        client = HoldedClient(api_key="test_api_key")
+        self.assertEqual(client.get("invoicing/taxes"), {"ok": True})
+        client.close()
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("holded.client.time.sleep")
+    @patch("requests.Session.request")
+    def test_sync_client_does_not_retry_post(self, mock_request, mock_sleep):
+        """Test that a POST failing with a server error is not sent twice."""
+        mock_request.return_value = make_error_response(500)
+
+        client = HoldedClient(api_key="test_api_key")
+        with self.assertRaises(HoldedServerError):
+            client.post("invoicing/contacts", data={"name": "Test"})
+        client.close()
+
+        self.assertEqual(mock_request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("holded.async_client.asyncio.sleep")
+    @patch("aiohttp.ClientSession.request")
+    def test_async_client_retries_disconnects(self, mock_request, mock_sleep):
+        """Test that the async client retries idempotent requests after a disconnect."""
+
+        async def no_sleep(delay):
+            return None
+
+        async def mock_read():
+            return b'{"ok": true}'
+
+        response = MagicMock()
+        response.read = mock_read
+        response.status = 200
+        response.headers = {"Content-Type": "application/json"}
+        mock_sleep.side_effect = no_sleep
+        mock_request.return_value.__aenter__.side_effect = [aiohttp.ServerDisconnectedError(), response]
+
+        client = AsyncHoldedClient(api_key="test_api_key")
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(client.get("invoicing/taxes"))
+            loop.run_until_complete(client.close())
+        finally:
+            loop.close()
+
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual(mock_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+Unit tests for streaming JSON list responses.
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.codec import JSONCodec
+from holded.exceptions import HoldedAPIError, HoldedNotFoundError
+from holded.retry import RetryPolicy
+from holded.streaming import JSONArrayParser
+from holded.transports import AiohttpTransport, AsyncMemoryTransport, MemoryResponse, MemoryTransport
+
+from _server import LocalServerMixin
+
+try:
+    from holded.transports import HttpxTransport
+
+    import httpx  # noqa: F401
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+ITEMS = [
+    {"id": str(i), "desc": 'quote " bracket ] brace } comma , backslash \\', "lines": [{"units": i}, []]}
+    for i in range(20)
+] + [1, "text", None, True, []]
+
+
+def _parse(body, chunk_size):
+    """Feed a body to a parser in chunks and collect the items."""
+    parser = JSONArrayParser(JSONCodec())
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items
+
+
+class TestJSONArrayParser(unittest.TestCase):
+    """Test cases for the incremental parser."""
+
+    def test_any_chunk_size(self):
+        """Test that items are parsed whatever the chunk boundaries."""
+        body = json.dumps(ITEMS, indent=2).encode()
+        for chunk_size in (1, 2, 3, 7, 64, len(body)):
+            self.assertEqual(_parse(body, chunk_size), ITEMS)
+
+    def test_items_are_yielded_when_complete(self):
+        """Test that an item is returned as soon as it ends."""
+        parser = JSONArrayParser(JSONCodec())
+        self.assertEqual(parser.feed(b'[{"id": "1"}, {"id"'), [{"id": "1"}])
+        self.assertEqual(parser.feed(b': "2"}]'), [{"id": "2"}])
+        self.assertEqual(parser.close(), [])
+
+    def test_empty(self):
+        """Test empty arrays and bodies."""
+        self.assertEqual(_parse(b" [ ] ", 1), [])
+        self.assertEqual(_parse(b"", 1), [])
+
+    def test_wrapped_list(self):
+        """Test that a list wrapped in an object is returned on close."""
+        self.assertEqual(_parse(b'{"items": [1, 2]}', 4), [1, 2])
+
+    def test_invalid(self):
+        """Test that malformed arrays are rejected."""
+        for body in (b"[1,]", b"[,1]", b"[1, 2", b"[1] 2", b"[1 2]"):
+            with self.assertRaises(ValueError):
+                _parse(body, 2)
+
+
+def _documents_handler(request):
+    if request.url.endswith("/missing"):
+        return MemoryResponse(404, json_data={"message": "Not found"})
+    if request.url.endswith("/broken"):
+        return MemoryResponse(content=b'[{"id": "1"}, {"id": ', headers={"Content-Type": "application/json"})
+    return MemoryResponse(json_data=ITEMS)
+
+
+class TestClientStreaming(unittest.TestCase):
+    """Test cases for the stream_list methods of the clients."""
+
+    def test_sync(self):
+        """Test streaming through the sync client and resources."""
+        client = HoldedClient(api_key="key", transport=MemoryTransport(_documents_handler))
+
+        self.assertEqual(list(client.stream_list("invoicing/documents/invoice", chunk_size=5)), ITEMS)
+        self.assertEqual(list(client.documents.stream_list("invoice", {"paid": 1})), ITEMS)
+        self.assertEqual(list(client.daily_ledger.stream_list()), ITEMS)
+        self.assertEqual(client.transport.requests[1].params, {"paid": 1})
+        with self.assertRaises(HoldedNotFoundError):
+            list(client.stream_list("invoicing/documents/missing"))
+        with self.assertRaises(HoldedAPIError):
+            list(client.stream_list("invoicing/documents/broken"))
+
+    def test_sync_retry(self):
+        """Test that errors before the body arrives are retried."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return MemoryResponse(503, json_data={"message": "Unavailable"})
+            return MemoryResponse(json_data=[1, 2])
+
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler), retry_policy=policy)
+
+        self.assertEqual(list(client.stream_list("accounting/dailyledger")), [1, 2])
+        self.assertEqual(len(calls), 2)
+
+    def test_async(self):
+        """Test streaming through the async client and resources."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return MemoryResponse(503, json_data={"message": "Unavailable"})
+            return _documents_handler(request)
+
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+
+        async def run():
+            transport = AsyncMemoryTransport(handler)
+            async with AsyncHoldedClient(api_key="key", transport=transport, retry_policy=policy) as client:
+                streamed = [item async for item in client.stream_list("invoicing/documents/invoice", chunk_size=5)]
+                documents = [item async for item in client.documents.stream_list("invoice")]
+                entries = [item async for item in client.daily_ledger.stream_list()]
+                with self.assertRaises(HoldedNotFoundError):
+                    [item async for item in client.stream_list("invoicing/documents/missing")]
+                with self.assertRaises(HoldedAPIError):
+                    [item async for item in client.stream_list("invoicing/documents/broken")]
+            return streamed, documents, entries
+
+        streamed, documents, entries = asyncio.run(run())
+        self.assertEqual(streamed, ITEMS)
+        self.assertEqual(documents, ITEMS)
+        self.assertEqual(entries, ITEMS)
+        self.assertEqual(len(calls), 6)
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Send the first item of a list, wait for the client, then send the rest."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(b'[{"id": "1"},')
+        released = self.server.release.wait(5)
+        self.server.release.clear()
+        self._chunk(json.dumps({"released": released}).encode() + b"]")
+        self._chunk(b"")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestNetworkStreaming(LocalServerMixin, unittest.TestCase):
+    """Test that items are yielded before the whole body is received."""
+
+    handler = _SlowHandler
+
+    @classmethod
+    def setUpClass(cls):
+        """Start a local HTTP server that holds back the end of the body until released."""
+        super().setUpClass()
+        cls.server.release = threading.Event()
+
+    def test_requests_transport(self):
+        """Test streaming with the requests transport."""
+        client = HoldedClient(api_key="key", base_url=self.base_url)
+        try:
+            items = client.stream_list("invoicing/documents/invoice")
+            self.assertEqual(next(items), {"id": "1"})
+            self.server.release.set()
+            self.assertEqual(list(items), [{"released": True}])
+        finally:
+            client.close()
+
+    @unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+    def test_httpx_transport(self):
+        """Test streaming with the sync httpx transport."""
+        client = HoldedClient(api_key="key", base_url=self.base_url, transport=HttpxTransport(http2=False))
+        try:
+            items = client.stream_list("accounting/dailyledger")
+            self.assertEqual(next(items), {"id": "1"})
+            self.server.release.set()
+            self.assertEqual(list(items), [{"released": True}])
+        finally:
+            client.close()
+
+    def test_aiohttp_transport(self):
+        """Test streaming with the aiohttp transport."""
+
+        async def run():
+            transport = AiohttpTransport()
+            async with AsyncHoldedClient(api_key="key", base_url=self.base_url, transport=transport) as client:
+                items = client.stream_list("invoicing/documents/invoice")
+                first = await items.__anext__()
+                self.server.release.set()
+                return first, [item async for item in items]
+
+        first, rest = asyncio.run(run())
+        self.assertEqual(first, {"id": "1"})
+        self.assertEqual(rest, [{"released": True}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Unit tests for the pluggable transports.
+"""
+
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+
+from holded.async_client import AsyncHoldedClient
+from holded.client import HoldedClient
+from holded.exceptions import HoldedConnectionError, HoldedNotFoundError
+from holded.retry import RetryPolicy
+from holded.transports import (
+    AiohttpTransport,
+    AsyncMemoryTransport,
+    MemoryResponse,
+    MemoryTransport,
+    RequestsTransport,
+)
+
+from _server import LocalServerMixin
+
+try:
+    import httpx  # noqa: F401
+
+    from holded.transports import AsyncHttpxTransport, HttpxTransport
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Echo the request method, path, content type and body as JSON."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _echo(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else None
+        payload = {
+            "method": self.command,
+            "path": self.path,
+            "content_type": self.headers.get("Content-Type"),
+            "key": self.headers.get("Key"),
+            "body": json.loads(body) if body else None,
+        }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _echo
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _contacts_handler(request):
+    if request.url.endswith("/missing"):
+        return MemoryResponse(404, json_data={"message": "Not found"})
+    if request.method == "POST":
+        return MemoryResponse(201, json_data={"id": "1", **request.json()})
+    return MemoryResponse(json_data=[{"id": "1", "page": request.params.get("page")}])
+
+
+class TestMemoryTransport(unittest.TestCase):
+    """Test cases for the in-memory transports."""
+
+    def test_sync_client(self):
+        """Test that the sync client sends requests through the transport."""
+        transport = MemoryTransport(_contacts_handler)
+        client = HoldedClient(api_key="key", transport=transport)
+
+        self.assertEqual(client.contacts.list({"page": 2}), [{"id": "1", "page": 2}])
+        self.assertEqual(client.contacts.create({"name": "A"}), {"id": "1", "name": "A"})
+        with self.assertRaises(HoldedNotFoundError):
+            client.get("invoicing/contacts/missing")
+
+        self.assertEqual([request.method for request in transport.requests], ["GET", "POST", "GET"])
+        self.assertEqual(transport.requests[0].headers["Key"], "key")
+        self.assertIsNone(client.session)
+
+    def test_sync_retry(self):
+        """Test that transport errors go through the retry policy."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise HoldedConnectionError("Connection reset")
+            return MemoryResponse(json_data={"ok": True})
+
+        policy = RetryPolicy(max_attempts=2, base_delay=0)
+        client = HoldedClient(api_key="key", transport=MemoryTransport(handler), retry_policy=policy)
+
+        self.assertEqual(client.get("invoicing/contacts"), {"ok": True})
+        self.assertEqual(len(calls), 2)
+
+    def test_async_client(self):
+        """Test that the async client sends requests through the transport."""
+
+        async def handler(request):
+            return _contacts_handler(request)
+
+        transport = AsyncMemoryTransport(handler)
+
+        async def run():
+            async with AsyncHoldedClient(api_key="key", transport=transport) as client:
+                contacts = await client.contacts.list({"page": 3})
+                created = await client.contacts.create({"name": "B"})
+                with self.assertRaises(HoldedNotFoundError):
+                    await client.get("invoicing/contacts/missing")
+            return contacts, created
+
+        contacts, created = asyncio.run(run())
+        self.assertEqual(contacts, [{"id": "1", "page": 3}])
+        self.assertEqual(created, {"id": "1", "name": "B"})
+        self.assertEqual(transport.requests[1].headers["Content-Type"], "application/json")
+
+
+class TestNetworkTransports(LocalServerMixin, unittest.TestCase):
+    """Test cases for the transports that talk to a server."""
+
+    handler = _Handler
+
+    def test_aiohttp_transport(self):
+        """Test that the aiohttp transport sends the body as JSON."""
+
+        async def run():
+            transport = AiohttpTransport()
+            async with AsyncHoldedClient(api_key="key", base_url=self.base_url, transport=transport) as client:
+                return await client.post("invoicing/contacts", data={"name": "A"})
+
+        result = asyncio.run(run())
+        self.assertEqual(result["method"], "POST")
+        self.assertEqual(result["content_type"], "application/json")
+        self.assertEqual(result["body"], {"name": "A"})
+
+    def test_session_per_thread(self):
+        """Test that threads get their own session over one connection pool."""
+        client = HoldedClient(api_key="key", base_url=self.base_url, session_per_thread=True)
+
+        def call(index):
+            result = client.get("invoicing/contacts", params={"page": index})
+            return client.session, result
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(call, range(16)))
+
+        sessions = {id(session) for session, _ in outcomes}
+        self.assertGreater(len(sessions), 1)
+        self.assertLessEqual(len(sessions), 4)
+        adapter = client.transport._adapter
+        self.assertTrue(all(session.get_adapter(self.base_url) is adapter for session, _ in outcomes))
+        self.assertTrue(all(session.headers["Key"] == "key" for session, _ in outcomes))
+        self.assertEqual(
+            sorted(result["path"] for _, result in outcomes),
+            sorted(f"/api/invoicing/v1/contacts/?page={index}" for index in range(16)),
+        )
+        self.assertIsNot(client.session, outcomes[0][0])
+
+        self.assertEqual(len(client.pool_stats()["hosts"]), 1)
+        client.close()
+        self.assertEqual(client.pool_stats()["hosts"], {})
+
+    def test_shared_session(self):
+        """Test that threads share one session by default."""
+        transport = RequestsTransport()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(executor.map(lambda _: transport.session, range(4)))
+        self.assertTrue(all(session is transport.session for session in sessions))
+
+    @unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+    def test_httpx_transport(self):
+        """Test the sync httpx transport."""
+        client = HoldedClient(api_key="key", base_url=self.base_url, transport=HttpxTransport())
+        try:
+            result = client.get("invoicing/contacts", params={"page": 2})
+            created = client.post("invoicing/contacts", data={"name": "A"})
+        finally:
+            client.close()
+
+        self.assertEqual(result["path"], "/api/invoicing/v1/contacts/?page=2")
+        self.assertEqual(result["key"], "key")
+        self.assertEqual(created["body"], {"name": "A"})
+
+    @unittest.skipUnless(HAS_HTTPX, "httpx is not installed")
+    def test_async_httpx_transport(self):
+        """Test the async httpx transport."""
+
+        async def run():
+            transport = AsyncHttpxTransport()
+            async with AsyncHoldedClient(api_key="key", base_url=self.base_url, transport=transport) as client:
+                return await asyncio.gather(*(client.get("invoicing/contacts") for _ in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual([result["method"] for result in results], ["GET"] * 5)
+        self.assertEqual(results[0]["content_type"], "application/json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the response validation modes.
+"""
+
+import unittest
+from typing import List
+
+from holded.api.invoice.models.documents import Document
+from holded.client import HoldedClient
+from holded.exceptions import HoldedError
+from holded.transports import MemoryResponse, MemoryTransport
+from holded.validation import ResponseValidator, construct
+from pydantic import RootModel
+
+DOCUMENT = {
+    "id": "1",
+    "type": "invoice",
+    "status": "paid",
+    "contactId": "c1",
+    "date": "2024-01-31T00:00:00",
+    "number": "F001",
+    "items": [{"name": "Widget", "units": 2, "price": 10.0}],
+    "currency": "eur",
+    "exchangeRate": 1.0,
+    "total": 20.0,
+    "subtotal": 20.0,
+    "customFields": {"project": "alpha"},
+}
+
+
+class DocumentList(RootModel):
+    """List of documents."""
+
+    root: List[Document]
+
+
+class TestConstruct(unittest.TestCase):
+    """Test cases for building models without validation."""
+
+    def test_construct_nested_models(self):
+        """Test that nested models are built and aliases are honored."""
+        document = construct(Document, DOCUMENT)
+        self.assertIsInstance(document, Document)
+        self.assertEqual(document.contact_id, "c1")
+        self.assertEqual(document.items[0].name, "Widget")
+        self.assertEqual(document.custom_fields, {"project": "alpha"})
+        # Values are not coerced
+        self.assertEqual(document.date, "2024-01-31T00:00:00")
+
+    def test_construct_root_model(self):
+        """Test that root models of lists are built."""
+        documents = construct(DocumentList, [DOCUMENT, DOCUMENT])
+        self.assertEqual([document.id for document in documents.root], ["1", "1"])
+
+
+class TestResponseValidator(unittest.TestCase):
+    """Test cases for the ResponseValidator class."""
+
+    def test_full_mode_validates(self):
+        """Test that full mode coerces values and rejects invalid data."""
+        validator = ResponseValidator()
+        self.assertEqual(validator.validate(Document, DOCUMENT).date.year, 2024)
+        with self.assertRaises(ValueError):
+            validator.validate(Document, {"id": "1"})
+
+    def test_sampled_mode_logs_drift(self):
+        """Test that sampled mode validates one in N responses and logs drift."""
+        validator = ResponseValidator("sampled", sample_rate=3)
+        drifted = {key: value for key, value in DOCUMENT.items() if key != "total"}
+        with self.assertLogs("holded.validation", level="WARNING") as logs:
+            results = [validator.validate(Document, drifted) for _ in range(6)]
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertTrue(all(result.id == "1" for result in results))
+        self.assertEqual(validator.stats(), {"validated": 2, "constructed": 6, "drift": 2})
+
+    def test_per_call_mode(self):
+        """Test that the mode can be overridden per call."""
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data=DOCUMENT))
+        client = HoldedClient(api_key="key", transport=transport, validation="trusted")
+
+        trusted = client.get("invoicing/documents/invoice/1", response_model=Document)
+        full = client.get("invoicing/documents/invoice/1", response_model=Document, validation="full")
+        self.assertIsInstance(trusted.date, str)
+        self.assertEqual(full.date.year, 2024)
+        self.assertEqual(client.validator.stats(), {"validated": 1, "constructed": 1, "drift": 0})
+
+    def test_full_mode_errors_are_wrapped(self):
+        """Test that validation errors keep surfacing as HoldedError in full mode."""
+        transport = MemoryTransport(lambda request: MemoryResponse(json_data={"id": "1"}))
+        client = HoldedClient(api_key="key", transport=transport)
+        with self.assertRaises(HoldedError):
+            client.get("invoicing/documents/invoice/1", response_model=Document)
+
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            ResponseValidator("lenient")
+
+
+if __name__ == "__main__":
+    unittest.main()